@@ -0,0 +1,48 @@
+"""add vital_sign_rollups for BP trend charts
+
+Revision ID: 005_vital_sign_rollups
+Revises: 004_user_profile_fields
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '005_vital_sign_rollups'
+down_revision = '004_user_profile_fields'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-user hour / day / week aggregates (fill with scripts.rebuild_vitals_rollups)
+    op.create_table(
+        'vital_sign_rollups',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('bucket', sa.String(length=10), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('systolic_sum', sa.Integer(), nullable=False),
+        sa.Column('systolic_min', sa.Integer(), nullable=False),
+        sa.Column('systolic_max', sa.Integer(), nullable=False),
+        sa.Column('diastolic_sum', sa.Integer(), nullable=False),
+        sa.Column('diastolic_min', sa.Integer(), nullable=False),
+        sa.Column('diastolic_max', sa.Integer(), nullable=False),
+        sa.Column('heart_rate_count', sa.Integer(), nullable=False),
+        sa.Column('heart_rate_sum', sa.Integer(), nullable=False),
+        sa.Column('heart_rate_min', sa.Integer(), nullable=True),
+        sa.Column('heart_rate_max', sa.Integer(), nullable=True),
+        sa.Column('normal_count', sa.Integer(), nullable=False),
+        sa.Column('low_count', sa.Integer(), nullable=False),
+        sa.Column('moderate_count', sa.Integer(), nullable=False),
+        sa.Column('high_count', sa.Integer(), nullable=False),
+        sa.Column('critical_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'bucket', 'bucket_start'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('vital_sign_rollups')
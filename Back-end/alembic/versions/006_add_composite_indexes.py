@@ -0,0 +1,39 @@
+"""add composite indexes for vitals, notifications and caregiver links
+
+Revision ID: 006_composite_indexes
+Revises: 005_vital_sign_rollups
+Create Date: 2026-10-17 23:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_composite_indexes'
+down_revision = '005_vital_sign_rollups'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    # /bp/current, /bp/history: WHERE user_id = ? ORDER BY measured_at DESC
+    ('ix_vital_signs_user_id_measured_at', 'vital_signs', ['user_id', sa.text('measured_at DESC')]),
+    # Notification list / unread count: WHERE user_id = ? AND is_read = ? ORDER BY created_at
+    ('ix_notifications_user_id_is_read_created_at', 'notifications', ['user_id', 'is_read', 'created_at']),
+    # Caregiver access checks and patient lists
+    ('ix_patient_caregiver_links_caregiver_patient_active', 'patient_caregiver_links', ['caregiver_id', 'patient_id', 'is_active']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run in a transaction; avoids locking writes on large tables
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,26 @@
+"""add bp_thresholds to users
+
+Revision ID: 007_user_bp_thresholds
+Revises: 006_composite_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '007_user_bp_thresholds'
+down_revision = '006_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-patient BP risk thresholds (NULL = guideline defaults)
+    op.add_column('users', sa.Column('bp_thresholds', postgresql.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'bp_thresholds')
@@ -0,0 +1,95 @@
+"""partition vital_signs by month on measured_at
+
+Revision ID: 008_partition_vital_signs
+Revises: 007_user_bp_thresholds
+Create Date: 2026-10-18 00:30:00.000000
+
+Rebuilds vital_signs as a RANGE-partitioned table with one partition per
+month (from the oldest reading to 3 months ahead) plus a DEFAULT
+partition, and copies existing rows. The primary key becomes
+(id, measured_at) because Postgres requires the partition key in it.
+The app creates upcoming partitions and drops expired ones at runtime
+(app/services/vitals_partitions.py).
+
+Copies the whole table: run during a maintenance window.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008_partition_vital_signs'
+down_revision = '007_user_bp_thresholds'
+branch_labels = None
+depends_on = None
+
+
+# One statement per execute (asyncpg runs prepared statements)
+INDEXES = [
+    "CREATE INDEX ix_vital_signs_user_id ON vital_signs (user_id)",
+    "CREATE INDEX ix_vital_signs_measured_at ON vital_signs (measured_at)",
+    "CREATE INDEX ix_vital_signs_user_id_measured_at ON vital_signs (user_id, measured_at DESC)",
+]
+
+
+def upgrade() -> None:
+    # Move the plain table aside (its indexes go with it when dropped below)
+    op.execute("ALTER TABLE vital_signs RENAME TO vital_signs_legacy")
+    op.execute("ALTER TABLE vital_signs_legacy RENAME CONSTRAINT vital_signs_pkey TO vital_signs_legacy_pkey")
+    
+    # Partitioned parent with the same columns
+    op.execute("""
+        CREATE TABLE vital_signs (LIKE vital_signs_legacy INCLUDING DEFAULTS)
+        PARTITION BY RANGE (measured_at)
+    """)
+    op.execute("ALTER TABLE vital_signs ADD CONSTRAINT vital_signs_pkey PRIMARY KEY (id, measured_at)")
+    op.execute("""
+        ALTER TABLE vital_signs ADD CONSTRAINT vital_signs_user_id_fkey
+        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+    """)
+    
+    # Monthly partitions covering existing readings and the next 3 months
+    op.execute("""
+        DO $$
+        DECLARE
+            month date;
+            last_month date := (date_trunc('month', now()) + interval '3 months')::date;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(measured_at), now()))::date
+            INTO month FROM vital_signs_legacy;
+            
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF vital_signs FOR VALUES FROM (%L) TO (%L)',
+                    'vital_signs_p' || to_char(month, 'YYYYMM'),
+                    month,
+                    (month + interval '1 month')::date
+                );
+                month := (month + interval '1 month')::date;
+            END LOOP;
+        END $$
+    """)
+    op.execute("CREATE TABLE vital_signs_default PARTITION OF vital_signs DEFAULT")
+    
+    # Copy rows, then index once (cascades to every partition)
+    op.execute("INSERT INTO vital_signs SELECT * FROM vital_signs_legacy")
+    op.execute("DROP TABLE vital_signs_legacy")
+    for statement in INDEXES:
+        op.execute(statement)
+    op.execute("ANALYZE vital_signs")
+
+
+def downgrade() -> None:
+    # Back to one plain table (drops all partitions)
+    op.execute("CREATE TABLE vital_signs_plain (LIKE vital_signs INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO vital_signs_plain SELECT * FROM vital_signs")
+    op.execute("DROP TABLE vital_signs CASCADE")
+    op.execute("ALTER TABLE vital_signs_plain RENAME TO vital_signs")
+    
+    op.execute("ALTER TABLE vital_signs ADD CONSTRAINT vital_signs_pkey PRIMARY KEY (id)")
+    op.execute("""
+        ALTER TABLE vital_signs ADD CONSTRAINT vital_signs_user_id_fkey
+        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+    """)
+    for statement in INDEXES:
+        op.execute(statement)
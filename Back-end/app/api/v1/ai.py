@@ -2,14 +2,28 @@
 AI inference router for Symptom Checker
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Response, status
+from typing import Dict, List, Optional, Tuple
+import hashlib
 
+from app.core.config import settings
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.services.ai_service import get_symptom_checker, SymptomCheckerService
+from app.services.inference_executor import (
+    get_inference_executor,
+    InferenceExecutor,
+    InferenceQueueFullError
+)
+from app.services.inference_batcher import get_symptom_batcher, SymptomBatcher
+from app.services.model_registry import get_model_registry, ModelRegistry
+from app.services.prediction_cache import get_prediction_cache, PredictionCache
 from app.schemas.ai import (
     SymptomCheckRequest, 
     SymptomCheckResponse, 
+    SymptomBatchRequest,
+    SymptomBatchResponse,
+    SymptomBatchResult,
     DiseaseInfo, 
     ChatRequest, 
     ChatResponse,
@@ -57,29 +71,29 @@ SYMPTOM_CATEGORIES_MAP = {
     }
 }
 
-@router.get("/available-symptoms", response_model=SymptomListResponse)
-async def get_available_symptoms(
-    current_user: User = Depends(get_current_user),
-    symptom_checker: SymptomCheckerService = Depends(get_symptom_checker)
-):
+async def run_inference(inference):
     """
-    Get list of available symptoms grouped by category
+    Await model call scheduled on the inference pool, mapping saturation to 503
     """
-    if not symptom_checker.metadata:
-        # Try load
-        symptom_checker.load_model()
-        
-    if not symptom_checker.metadata:
-         raise HTTPException(
+    try:
+        return await inference
+    except InferenceQueueFullError:
+        raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Model metadata not available"
+            detail="AI service is busy. Please retry shortly.",
+            headers={"Retry-After": "1"}
         )
-    
-    all_symptoms = symptom_checker.metadata.get("symptoms", [])
-    
-    # Group symptoms
+
+
+# Serialized symptom catalog, rebuilt only when the model metadata changes
+_symptom_catalog_cache = {"metadata": None, "body": None, "etag": None}
+
+
+def build_symptom_catalog(all_symptoms: List[str]) -> SymptomListResponse:
+    """
+    Group symptoms into UI categories by keyword
+    """
     categorized = {k: [] for k in SYMPTOM_CATEGORIES_MAP.keys()}
-    used_symptoms = set()
     
     for symptom in all_symptoms:
         assigned = False
@@ -92,7 +106,6 @@ async def get_available_symptoms(
             for key in info["keywords"]:
                 if key in s_clean:
                     categorized[cat].append(symptom)
-                    used_symptoms.add(symptom)
                     assigned = True
                     break
             if assigned: break
@@ -118,12 +131,76 @@ async def get_available_symptoms(
     )
 
 
+def get_symptom_catalog(metadata: Dict) -> Tuple[bytes, str]:
+    """
+    Get serialized symptom catalog and its ETag, building it once per model load
+    """
+    if _symptom_catalog_cache["metadata"] is not metadata:
+        catalog = build_symptom_catalog(metadata.get("symptoms", []))
+        body = catalog.model_dump_json().encode("utf-8")
+        _symptom_catalog_cache.update(
+            metadata=metadata,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        )
+    return _symptom_catalog_cache["body"], _symptom_catalog_cache["etag"]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check If-None-Match header against ETag (weak comparison)
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag[2:] == etag if tag.startswith("W/") else tag == etag
+        for tag in candidates
+    )
+
+
+@router.get("/available-symptoms", response_model=SymptomListResponse)
+async def get_available_symptoms(
+    current_user: User = Depends(get_current_user),
+    symptom_checker: SymptomCheckerService = Depends(get_symptom_checker),
+    if_none_match: Optional[str] = Header(default=None)
+):
+    """
+    Get list of available symptoms grouped by category
+    
+    Served with ETag / Cache-Control; clients sending a matching
+    If-None-Match get 304 Not Modified.
+    """
+    if not symptom_checker.metadata:
+        # Try load
+        symptom_checker.load_model()
+        
+    if not symptom_checker.metadata:
+         raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Model metadata not available"
+        )
+    
+    body, etag = get_symptom_catalog(symptom_checker.metadata)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={settings.ai_catalog_max_age_seconds}"
+    }
+    
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 
 @router.post("/symptom-checker", response_model=SymptomCheckResponse)
 async def check_symptoms(
     request: SymptomCheckRequest,
     current_user: User = Depends(get_current_user),
-    symptom_checker: SymptomCheckerService = Depends(get_symptom_checker)
+    symptom_checker: SymptomCheckerService = Depends(get_symptom_checker),
+    batcher: SymptomBatcher = Depends(get_symptom_batcher),
+    prediction_cache: PredictionCache = Depends(get_prediction_cache)
 ):
     """
     AI-powered symptom checker
@@ -135,8 +212,8 @@ async def check_symptoms(
     ⚠️ **IMPORTANT**: This is for educational purposes only. 
     Always consult a healthcare professional for diagnosis.
     """
-    # Get prediction
-    result = symptom_checker.predict_disease(request.symptoms)
+    # Get prediction (cached per symptom set, else micro-batched off the event loop)
+    result = await run_inference(prediction_cache.predict(request.symptoms, batcher.predict))
     
     if not result:
         raise HTTPException(
@@ -160,11 +237,51 @@ async def check_symptoms(
 
 
 
+@router.post("/symptom-checker/batch", response_model=SymptomBatchResponse)
+async def check_symptoms_batch(
+    request: SymptomBatchRequest,
+    current_user: User = Depends(get_current_user),
+    symptom_checker: SymptomCheckerService = Depends(get_symptom_checker),
+    executor: InferenceExecutor = Depends(get_inference_executor)
+):
+    """
+    Batched AI symptom checker (e.g. nightly re-assessments)
+    
+    - **symptom_sets**: List of symptom lists, one per assessment
+    - **top_k**: Number of ranked predictions per assessment (default 3)
+    
+    All assessments are scored in a single vectorized model pass.
+    Results are returned in the same order as the input.
+    """
+    results = await run_inference(
+        executor.run(
+            symptom_checker.predict_batch,
+            request.symptom_sets,
+            top_k=request.top_k
+        )
+    )
+    
+    if results is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI model not available. Please ensure model files are in Symptom-Checker/Output/Production/"
+        )
+    
+    model_version = results[0]["model_version"] if results else "unknown"
+    
+    return SymptomBatchResponse(
+        model_version=model_version,
+        results=[SymptomBatchResult(**result) for result in results]
+    )
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_symptom_checker(
     request: ChatRequest,
     current_user: User = Depends(get_current_user),
-    symptom_checker: SymptomCheckerService = Depends(get_symptom_checker)
+    symptom_checker: SymptomCheckerService = Depends(get_symptom_checker),
+    batcher: SymptomBatcher = Depends(get_symptom_batcher),
+    prediction_cache: PredictionCache = Depends(get_prediction_cache)
 ):
     """
     Assistant-like chat interface for Symptom Checker
@@ -177,18 +294,8 @@ async def chat_symptom_checker(
                 detail="AI model is not available."
             )
 
-    # 1. Extract Symptoms from Message
-    message = request.message.lower()
-    known_symptoms = symptom_checker.metadata.get("symptoms", [])
-    found_symptoms = []
-    
-    # Sort known symptoms by length (descending) to match "high fever" before "fever"
-    sorted_symptoms = sorted(known_symptoms, key=len, reverse=True)
-    
-    for symptom in sorted_symptoms:
-        symptom_clean = symptom.replace("_", " ")
-        if symptom_clean in message or symptom in message:
-            found_symptoms.append(symptom)
+    # 1. Extract Symptoms from Message (precompiled matcher, longest match wins)
+    found_symptoms = symptom_checker.extract_symptoms(request.message)
             
     # 2. Logic Branching
     if not found_symptoms:
@@ -198,8 +305,8 @@ async def chat_symptom_checker(
             options=["High Fever", "Cough", "Headache", "Fatigue", "Nausea"]
         )
         
-    # 3. Predict
-    result = symptom_checker.predict_disease(found_symptoms)
+    # 3. Predict (cached per symptom set, else micro-batched off the event loop)
+    result = await run_inference(prediction_cache.predict(found_symptoms, batcher.predict))
     
     if not result:
          return ChatResponse(
@@ -256,6 +363,43 @@ async def get_model_info(
         "diseases_count": len(symptom_checker.metadata.get("diseases", {})),
         "symptoms_count": len(symptom_checker.metadata.get("symptoms", []))
     }
+
+
+@router.get("/inference-metrics")
+async def get_inference_metrics(
+    current_user: User = Depends(get_current_user),
+    batcher: SymptomBatcher = Depends(get_symptom_batcher),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    prediction_cache: PredictionCache = Depends(get_prediction_cache)
+):
+    """
+    Get inference scheduler metrics (batch size, queue wait, pool load,
+    prediction cache hits / misses)
+    """
+    return {
+        "batching": batcher.metrics.snapshot(),
+        "prediction_cache": prediction_cache.info(),
+        "executor": {
+            "workers": executor.max_workers,
+            "max_queue_size": executor.max_queue_size,
+            "in_flight": executor.in_flight,
+            "queue_depth": executor.queue_depth
+        }
+    }
+
+
+@router.get("/models")
+async def get_models(
+    current_user: User = Depends(get_current_user),
+    registry: ModelRegistry = Depends(get_model_registry)
+):
+    """
+    Get model registry state: active/candidate versions, A/B split,
+    per-model latency and agreement metrics, and available archive models
+    """
+    return registry.info()
+
+
 @router.get("/symptom-checker/history/{session_id}")
 async def get_chat_history(
     session_id: str,
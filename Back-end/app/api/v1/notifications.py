@@ -2,13 +2,14 @@
 Notifications router
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, desc
-from typing import List
+from sqlalchemy import select, update
+from typing import List, Optional
 from uuid import UUID
 
 from app.core.database import get_db
+from app.core.pagination import apply_cursor, page_with_cursor
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.notification import Notification
@@ -19,28 +20,31 @@ router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 @router.get("", response_model=List[NotificationResponse])
 async def get_notifications(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     unread_only: bool = Query(default=False),
-    limit: int = Query(default=50, le=100)
+    limit: int = Query(default=50, le=100),
+    cursor: Optional[str] = Query(default=None)
 ):
     """
     Get notifications for current user
     
     - **unread_only**: Only return unread notifications
     - **limit**: Maximum number of notifications (max 100)
+    - **cursor**: X-Next-Cursor header of the previous page (omitted on the last page)
     """
     query = select(Notification).where(Notification.user_id == current_user.id)
     
     if unread_only:
         query = query.where(Notification.is_read == False)
     
-    query = query.order_by(desc(Notification.created_at)).limit(limit)
+    query = apply_cursor(query, Notification.created_at, Notification.id, cursor)
     
-    result = await db.execute(query)
+    result = await db.execute(query.limit(limit + 1))
     notifications = result.scalars().all()
     
-    return notifications
+    return page_with_cursor(notifications, limit, "created_at", response)
 
 
 @router.get("/unread-count")
@@ -14,6 +14,7 @@ from app.core.security import verify_password, get_password_hash
 from app.models.user import User
 from app.models.patient_caregiver_link import PatientCaregiverLink
 from app.schemas.user import UserResponse, UserUpdate, PasswordChange
+from app.services.redis_cache import redis_cache
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -231,4 +232,7 @@ async def delete_account(
     await db.delete(current_user)
     await db.commit()
     
+    # Cached readings must not outlive the account
+    await redis_cache.invalidate_user_cache(str(current_user.id))
+    
     return None
@@ -2,24 +2,214 @@
 Vitals router for blood pressure management
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, insert, desc, func, literal_column
 from datetime import datetime, timedelta
-from typing import List, Optional
+from types import SimpleNamespace
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from app.core.database import get_db
+from app.core.pagination import apply_cursor, page_with_cursor
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.vital_sign import VitalSign, RiskLevel
-from app.schemas.vital_sign import VitalSignCreate, VitalSignResponse
+from app.models.vital_sign_rollup import VitalSignRollup, RollupBucket
+from app.schemas.vital_sign import (
+    VitalSignCreate,
+    VitalSignResponse,
+    VitalSignBulkItem,
+    VitalSignBulkCreate,
+    VitalSignBulkResponse,
+    BPThresholds,
+    PatientLatestVitals,
+    CaregiverOverviewResponse
+)
 from app.models.patient_caregiver_link import PatientCaregiverLink
 from app.services.notification_service import get_notification_service
+from app.services.tiered_cache import cached
+from app.services.redis_cache import redis_cache
+from app.services.vitals_rollup import apply_readings, remove_reading, bucket_start, RISK_COUNT_COLUMNS
+from app.services.risk_classifier import RULE_ORDER, Thresholds, classify_bp, resolve_thresholds
+from app.services.vitals_export import EXPORT_FORMATS, stream_bp_export
+from app.core.config import settings
 
 router = APIRouter(prefix="/vitals", tags=["Vitals"])
 
 
+async def cache_latest_reading(vital: VitalSign):
+    """
+    Write-through: store reading as the user's latest in Redis
+    """
+    await redis_cache.cache_bp_reading(
+        str(vital.user_id),
+        VitalSignResponse.model_validate(vital).model_dump(mode="json")
+    )
+
+
+async def get_latest_reading(db: AsyncSession, user_id: UUID) -> Optional[dict]:
+    """
+    Get user's most recent reading, Redis first, Postgres on a miss
+    
+    Args:
+        db: Database session
+        user_id: User ID
+    
+    Returns:
+        Reading as response dict or None if user has no readings
+    """
+    cached_reading = await redis_cache.get_cached_bp_reading(str(user_id))
+    if cached_reading:
+        return cached_reading
+    
+    # Key taken before the query, so a concurrent new reading orphans this fill
+    [key] = await redis_cache.bp_reading_keys([str(user_id)])
+    result = await db.execute(
+        select(VitalSign)
+        .where(VitalSign.user_id == user_id)
+        .order_by(desc(VitalSign.measured_at))
+        .limit(1)
+    )
+    vital = result.scalar_one_or_none()
+    if not vital:
+        return None
+    
+    reading = VitalSignResponse.model_validate(vital).model_dump(mode="json")
+    await redis_cache.fill_bp_readings({key: reading})
+    return reading
+
+
+async def get_latest_readings(db: AsyncSession, user_ids: List[UUID]) -> Dict[str, dict]:
+    """
+    Get most recent reading of many users in constant round trips
+    
+    Redis MGET first; one DISTINCT ON query for the misses, whose
+    results are written back in one pipeline.
+    
+    Args:
+        db: Database session
+        user_ids: User IDs
+    
+    Returns:
+        User ID (str) -> reading as response dict (users without readings omitted)
+    """
+    ids = [str(u) for u in user_ids]
+    keys = dict(zip(ids, await redis_cache.bp_reading_keys(ids)))
+    readings = await redis_cache.get_cached_bp_readings(keys)
+    
+    missing = [u for u in user_ids if str(u) not in readings]
+    if missing:
+        result = await db.execute(
+            select(VitalSign)
+            .where(VitalSign.user_id.in_(missing))
+            .order_by(VitalSign.user_id, desc(VitalSign.measured_at))
+            .distinct(VitalSign.user_id)
+        )
+        fetched = {
+            str(vital.user_id): VitalSignResponse.model_validate(vital).model_dump(mode="json")
+            for vital in result.scalars().all()
+        }
+        await redis_cache.fill_bp_readings({keys[user_id]: reading for user_id, reading in fetched.items()})
+        readings.update(fetched)
+    
+    return readings
+
+
+async def insert_bp_readings(
+    db: AsyncSession,
+    user_id: UUID,
+    readings: List[VitalSignBulkItem],
+    thresholds: Optional[Thresholds] = None
+) -> List[dict]:
+    """
+    Insert a batch of readings for one user (not committed)
+    
+    Risk levels are classified for the whole batch at once, rows go in
+    as multi-row INSERTs and the hour/day/week rollups are updated with
+    one incremental upsert.
+    
+    Args:
+        db: Database session
+        user_id: Reading owner
+        readings: Readings to insert
+        thresholds: Owner's risk threshold table (default: guideline defaults)
+    
+    Returns:
+        Inserted rows as dicts
+    """
+    now = datetime.utcnow()
+    risk_levels = classify_bp(
+        [reading.systolic for reading in readings],
+        [reading.diastolic for reading in readings],
+        thresholds
+    )
+    rows = [
+        {
+            "user_id": user_id,
+            "systolic": reading.systolic,
+            "diastolic": reading.diastolic,
+            "heart_rate": reading.heart_rate,
+            "risk_level": risk_level,
+            "source": reading.source,
+            "measured_at": reading.measured_at or now,
+            "created_at": now
+        }
+        for reading, risk_level in zip(readings, risk_levels)
+    ]
+    
+    await db.execute(insert(VitalSign), rows)
+    await apply_readings(db, [SimpleNamespace(**row) for row in rows])
+    
+    return rows
+
+
+STATS_PERCENTILES = {"p50": 0.5, "p90": 0.9}
+
+
+def aggregate_columns(column, name: str, percentiles: bool = True) -> list:
+    """
+    Build avg/min/max (and percentile) select expressions for one column
+    
+    Args:
+        column: Numeric model column
+        name: Label prefix
+        percentiles: Include ordered-set percentiles
+    
+    Returns:
+        Labeled SQL expressions
+    """
+    columns = [
+        func.avg(column).label(f"{name}_avg"),
+        func.min(column).label(f"{name}_min"),
+        func.max(column).label(f"{name}_max")
+    ]
+    if percentiles:
+        columns += [
+            # Inline constant: a bind parameter is ambiguous between the
+            # scalar and array overloads of percentile_cont
+            func.percentile_cont(literal_column(repr(fraction))).within_group(column).label(f"{name}_{key}")
+            for key, fraction in STATS_PERCENTILES.items()
+        ]
+    return columns
+
+
+def aggregate_values(row, name: str) -> dict:
+    """
+    Read one column's aggregates from a result row as JSON-ready numbers
+    """
+    values = {
+        "avg": float(row[f"{name}_avg"]),
+        "min": row[f"{name}_min"],
+        "max": row[f"{name}_max"]
+    }
+    for key in STATS_PERCENTILES:
+        if f"{name}_{key}" in row:
+            values[key] = float(row[f"{name}_{key}"])
+    return values
+
+
 @router.post("/bp", response_model=VitalSignResponse, status_code=status.HTTP_201_CREATED)
 async def create_bp_reading(
     vital_data: VitalSignCreate,
@@ -41,13 +231,23 @@ async def create_bp_reading(
         source=vital_data.source
     )
     
-    # Calculate risk level
-    db_vital.risk_level = db_vital.calculate_risk_level()
+    # Calculate risk level (patient's custom thresholds, if any)
+    db_vital.risk_level = db_vital.calculate_risk_level(resolve_thresholds(current_user.bp_thresholds))
     
     db.add(db_vital)
+    await db.flush()
+    
+    # Hour / day / week trend rollups commit together with the reading
+    await apply_readings(db, [db_vital])
+    
     await db.commit()
     await db.refresh(db_vital)
     
+    # New reading changes every stats window (new cache generation)
+    # and is the latest one
+    await redis_cache.invalidate_user_cache(str(current_user.id))
+    await cache_latest_reading(db_vital)
+    
     # Send emergency alert if risk is high or critical
     if db_vital.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
         notification_service = get_notification_service()
@@ -62,22 +262,116 @@ async def create_bp_reading(
     return db_vital
 
 
-@router.get("/bp/current", response_model=VitalSignResponse)
-async def get_current_bp(
+@router.post("/bp/bulk", response_model=VitalSignBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_bp_readings_bulk(
+    data: VitalSignBulkCreate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get most recent BP reading for current user
+    Upload a batch of buffered BP readings (max 5000)
+    
+    One transaction for the whole batch, and at most one emergency
+    alert: the most severe high/critical reading, with the number of
+    high-risk readings in the batch.
     """
-    result = await db.execute(
-        select(VitalSign)
-        .where(VitalSign.user_id == current_user.id)
-        .order_by(desc(VitalSign.measured_at))
-        .limit(1)
+    rows = await insert_bp_readings(
+        db,
+        current_user.id,
+        data.readings,
+        resolve_thresholds(current_user.bp_thresholds)
     )
+    await db.commit()
     
-    vital = result.scalar_one_or_none()
+    # Latest reading and stats may have changed
+    await redis_cache.invalidate_user_cache(str(current_user.id))
+    
+    risk_levels = {risk: 0 for risk in RiskLevel}
+    for row in rows:
+        risk_levels[row["risk_level"]] += 1
+    
+    # Send one aggregated alert if any reading is high or critical
+    alerts = [row for row in rows if row["risk_level"] in [RiskLevel.HIGH, RiskLevel.CRITICAL]]
+    if alerts:
+        worst = max(
+            alerts,
+            key=lambda row: (row["risk_level"] == RiskLevel.CRITICAL, row["systolic"], row["diastolic"])
+        )
+        notification_service = get_notification_service()
+        await notification_service.send_emergency_bp_alert(
+            db=db,
+            patient_id=str(current_user.id),
+            systolic=worst["systolic"],
+            diastolic=worst["diastolic"],
+            risk_level=worst["risk_level"].value,
+            alert_count=len(alerts)
+        )
+    
+    return VitalSignBulkResponse(
+        inserted=len(rows),
+        risk_levels=risk_levels,
+        alert_sent=bool(alerts)
+    )
+
+
+def thresholds_response(thresholds: Thresholds) -> BPThresholds:
+    """Threshold table as response schema"""
+    return BPThresholds(**{level.value: thresholds[level] for level in RULE_ORDER})
+
+
+@router.get("/bp/thresholds", response_model=BPThresholds)
+async def get_bp_thresholds(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get risk thresholds applied to current user's readings
+    """
+    return thresholds_response(resolve_thresholds(current_user.bp_thresholds))
+
+
+@router.put("/bp/thresholds", response_model=BPThresholds)
+async def update_bp_thresholds(
+    data: BPThresholds,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Set custom risk thresholds for current user's new readings
+    
+    Levels left out fall back to the guideline defaults; an empty body
+    resets all of them. Existing readings keep their risk level until
+    re-scored with scripts.reclassify_vitals.
+    """
+    overrides = {level: list(bounds) for level, bounds in data.model_dump(exclude_none=True).items()}
+    thresholds = resolve_thresholds(overrides)
+    
+    # Each level must be at least as strict as the one below it
+    low, moderate, high, critical = (
+        thresholds[level]
+        for level in (RiskLevel.LOW, RiskLevel.MODERATE, RiskLevel.HIGH, RiskLevel.CRITICAL)
+    )
+    for axis in range(2):
+        if not low[axis] <= moderate[axis] <= high[axis] <= critical[axis]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Thresholds must increase from low to moderate, high and critical"
+            )
+    
+    current_user.bp_thresholds = overrides or None
+    await db.commit()
+    
+    return thresholds_response(thresholds)
+
+
+@router.get("/bp/current", response_model=VitalSignResponse)
+async def get_current_bp(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get most recent BP reading for current user (served from Redis when cached)
+    """
+    vital = await get_latest_reading(db, current_user.id)
     
     if not vital:
         raise HTTPException(
@@ -90,10 +384,12 @@ async def get_current_bp(
 
 @router.get("/bp/history", response_model=List[VitalSignResponse])
 async def get_bp_history(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     limit: int = Query(default=50, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None),
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None
 ):
@@ -101,9 +397,13 @@ async def get_bp_history(
     Get BP history for current user with pagination
     
     - **limit**: Max number of records (default 50, max 200)
-    - **offset**: Number of records to skip
+    - **offset**: Number of records to skip (ignored when cursor is set)
+    - **cursor**: X-Next-Cursor header of the previous page; constant
+      cost per page however deep
     - **start_date**: Filter from date (optional)
     - **end_date**: Filter to date (optional)
+    
+    The X-Next-Cursor response header is omitted on the last page.
     """
     query = select(VitalSign).where(VitalSign.user_id == current_user.id)
     
@@ -113,16 +413,105 @@ async def get_bp_history(
     if end_date:
         query = query.where(VitalSign.measured_at <= end_date)
     
-    # Order by most recent first
-    query = query.order_by(desc(VitalSign.measured_at)).limit(limit).offset(offset)
+    # Most recent first, starting after the cursor's reading
+    query = apply_cursor(query, VitalSign.measured_at, VitalSign.id, cursor)
+    if not cursor:
+        query = query.offset(offset)
     
-    result = await db.execute(query)
+    # One extra row tells whether there is a next page
+    result = await db.execute(query.limit(limit + 1))
     vitals = result.scalars().all()
     
-    return vitals
+    return page_with_cursor(vitals, limit, "measured_at", response)
+
+
+@router.get("/bp/export")
+async def export_bp_history(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv|parquet)$"),
+    patient_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+):
+    """
+    Download full BP history, oldest first, as a stream
+    
+    - **format**: ndjson (default), csv or parquet
+    - **patient_id**: Export a linked patient's history instead of your own
+    - **start_date**: Filter from date (optional)
+    - **end_date**: Filter to date (optional)
+    
+    Rows are read from a server-side cursor and written as they arrive,
+    so memory use doesn't depend on history length.
+    """
+    exporter_class, available = EXPORT_FORMATS[format]
+    if not available():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"Export format '{format}' is not available on this server"
+        )
+    
+    user_id = current_user.id
+    if patient_id and patient_id != current_user.id:
+        # Verify link
+        link_result = await db.execute(
+            select(PatientCaregiverLink)
+            .where(PatientCaregiverLink.caregiver_id == current_user.id)
+            .where(PatientCaregiverLink.patient_id == patient_id)
+            .where(PatientCaregiverLink.is_active == True)
+        )
+        if not link_result.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied. Patient is not linked to you."
+            )
+        user_id = patient_id
+    
+    exporter = exporter_class()
+    return StreamingResponse(
+        stream_bp_export(
+            exporter,
+            user_id,
+            settings.vitals_export_batch_size,
+            start_date=start_date,
+            end_date=end_date
+        ),
+        media_type=exporter.media_type,
+        headers={"Content-Disposition": f'attachment; filename="bp_history_{user_id}.{format}"'}
+    )
+
+
+def bp_stats_query(user_id: UUID, start_date: datetime):
+    """
+    Build the /bp/stats aggregate: one row of scalars, no ORM entities
+    
+    Args:
+        user_id: Reading owner
+        start_date: Start of the window
+    
+    Returns:
+        Select of count, systolic/diastolic avg/min/max/percentiles and
+        heart rate avg/min/max
+    """
+    return (
+        select(
+            func.count().label("total_readings"),
+            *aggregate_columns(VitalSign.systolic, "systolic"),
+            *aggregate_columns(VitalSign.diastolic, "diastolic"),
+            func.count(VitalSign.heart_rate).label("heart_rate_count"),
+            *aggregate_columns(VitalSign.heart_rate, "heart_rate", percentiles=False)
+        )
+        .where(VitalSign.user_id == user_id)
+        .where(VitalSign.measured_at >= start_date)
+    )
 
 
 @router.get("/bp/stats")
+@cached(
+    lambda current_user, days, **_: redis_cache.user_key(str(current_user.id), f"bp:stats:{days}"),
+    ttl_seconds=settings.vitals_stats_cache_ttl_seconds
+)
 async def get_bp_stats(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -131,41 +520,173 @@ async def get_bp_stats(
     """
     Get BP statistics for last N days
     
-    Returns average, min, max for systolic and diastolic
+    Returns average, min, max, median and 90th percentile for systolic
+    and diastolic, plus heart rate stats (cached per user and window
+    until the next reading).
+    
+    Aggregated in Postgres: one row of scalars regardless of how many
+    readings the window holds.
     """
     start_date = datetime.utcnow() - timedelta(days=days)
     
-    result = await db.execute(
-        select(VitalSign)
-        .where(VitalSign.user_id == current_user.id)
-        .where(VitalSign.measured_at >= start_date)
-    )
+    result = await db.execute(bp_stats_query(current_user.id, start_date))
     
-    vitals = result.scalars().all()
+    row = result.one()._mapping
     
-    if not vitals:
+    if not row["total_readings"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No BP readings found in last {days} days"
         )
     
-    systolic_values = [v.systolic for v in vitals]
-    diastolic_values = [v.diastolic for v in vitals]
+    return {
+        "period_days": days,
+        "total_readings": row["total_readings"],
+        "systolic": aggregate_values(row, "systolic"),
+        "diastolic": aggregate_values(row, "diastolic"),
+        "heart_rate": aggregate_values(row, "heart_rate") if row["heart_rate_count"] else None
+    }
+
+
+def rollup_values(rollup: VitalSignRollup, name: str) -> Optional[dict]:
+    """
+    Read one measurement's avg/min/max from a rollup row
+    """
+    count = rollup.count if name != "heart_rate" else rollup.heart_rate_count
+    if not count:
+        return None
+    return {
+        "avg": getattr(rollup, f"{name}_sum") / count,
+        "min": getattr(rollup, f"{name}_min"),
+        "max": getattr(rollup, f"{name}_max")
+    }
+
+
+@router.get("/bp/trends")
+@cached(
+    lambda current_user, bucket, days, **_: redis_cache.user_key(
+        str(current_user.id), f"bp:trends:{bucket.value}:{days}"
+    ),
+    ttl_seconds=settings.vitals_stats_cache_ttl_seconds
+)
+async def get_bp_trends(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    bucket: RollupBucket = Query(default=RollupBucket.DAY),
+    days: int = Query(default=30, ge=1, le=365)
+):
+    """
+    Get BP trend for last N days, one point per hour / day / week
+    
+    - **bucket**: hour, day or week (weeks start on Monday)
+    - **days**: Period length (default 30, max 365)
+    
+    Read from the rollup tables, so cost grows with the number of
+    buckets rather than readings. Buckets without readings are omitted.
+    """
+    start = bucket_start(datetime.utcnow() - timedelta(days=days), bucket)
+    
+    result = await db.execute(
+        select(VitalSignRollup)
+        .where(VitalSignRollup.user_id == current_user.id)
+        .where(VitalSignRollup.bucket == bucket.value)
+        .where(VitalSignRollup.bucket_start >= start)
+        .order_by(VitalSignRollup.bucket_start)
+    )
+    
+    points = []
+    for rollup in result.scalars().all():
+        points.append({
+            "start": rollup.bucket_start.isoformat(),
+            "count": rollup.count,
+            "systolic": rollup_values(rollup, "systolic"),
+            "diastolic": rollup_values(rollup, "diastolic"),
+            "heart_rate": rollup_values(rollup, "heart_rate"),
+            "risk_levels": {
+                risk.value: getattr(rollup, column)
+                for risk, column in RISK_COUNT_COLUMNS.items()
+            }
+        })
     
     return {
+        "bucket": bucket.value,
         "period_days": days,
-        "total_readings": len(vitals),
-        "systolic": {
-            "avg": sum(systolic_values) / len(systolic_values),
-            "min": min(systolic_values),
-            "max": max(systolic_values)
-        },
-        "diastolic": {
-            "avg": sum(diastolic_values) / len(diastolic_values),
-            "min": min(diastolic_values),
-            "max": max(diastolic_values)
-        }
+        "buckets": points
     }
+
+
+@router.delete("/bp/{vital_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_bp_reading(
+    vital_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delete a BP reading (e.g. mistaken manual entry)
+    
+    Rebuilds the trend rollups that contained it and drops the user's
+    cached latest reading and stats so the next read comes from the
+    database.
+    """
+    result = await db.execute(
+        select(VitalSign)
+        .where(VitalSign.id == vital_id)
+        .where(VitalSign.user_id == current_user.id)
+    )
+    
+    vital = result.scalar_one_or_none()
+    
+    if not vital:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="BP reading not found"
+        )
+    
+    await db.delete(vital)
+    await db.flush()
+    await remove_reading(db, vital)
+    await db.commit()
+    
+    await redis_cache.invalidate_user_cache(str(current_user.id))
+    
+    return None
+
+
+@router.get("/caregiver/overview", response_model=CaregiverOverviewResponse)
+async def get_caregiver_overview(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get latest BP reading and risk level of every linked patient
+    
+    One request for the whole caregiver dashboard; cached readings are
+    fetched in bulk and only misses hit the database.
+    """
+    result = await db.execute(
+        select(User.id, User.full_name)
+        .join(PatientCaregiverLink, PatientCaregiverLink.patient_id == User.id)
+        .where(PatientCaregiverLink.caregiver_id == current_user.id)
+        .where(PatientCaregiverLink.is_active == True)
+        .order_by(User.full_name)
+    )
+    patients = result.all()
+    
+    readings = await get_latest_readings(db, [patient.id for patient in patients])
+    
+    overview = []
+    for patient in patients:
+        latest = readings.get(str(patient.id))
+        overview.append(PatientLatestVitals(
+            patient_id=patient.id,
+            full_name=patient.full_name,
+            risk_level=latest["risk_level"] if latest else None,
+            latest=latest
+        ))
+    
+    return CaregiverOverviewResponse(patients=overview)
+
+
 @router.get("/patient/{patient_id}/current", response_model=VitalSignResponse)
 async def get_patient_current_bp(
     patient_id: UUID,
@@ -173,7 +694,7 @@ async def get_patient_current_bp(
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get most recent BP reading for a linked patient
+    Get most recent BP reading for a linked patient (served from Redis when cached)
     """
     # Verify link
     link_result = await db.execute(
@@ -188,13 +709,7 @@ async def get_patient_current_bp(
             detail="Access denied. Patient is not linked to you."
         )
 
-    result = await db.execute(
-        select(VitalSign)
-        .where(VitalSign.user_id == patient_id)
-        .order_by(desc(VitalSign.measured_at))
-        .limit(1)
-    )
-    vital = result.scalar_one_or_none()
+    vital = await get_latest_reading(db, patient_id)
     if not vital:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -206,13 +721,17 @@ async def get_patient_current_bp(
 @router.get("/patient/{patient_id}/history", response_model=List[VitalSignResponse])
 async def get_patient_bp_history(
     patient_id: UUID,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     limit: int = Query(default=50, le=200),
-    offset: int = Query(default=0, ge=0)
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None)
 ):
     """
     Get BP history for a linked patient
+    
+    Paginated like /bp/history (offset, or cursor from X-Next-Cursor)
     """
     # Verify link
     link_result = await db.execute(
@@ -227,11 +746,14 @@ async def get_patient_bp_history(
             detail="Access denied. Patient is not linked to you."
         )
 
-    result = await db.execute(
-        select(VitalSign)
-        .where(VitalSign.user_id == patient_id)
-        .order_by(desc(VitalSign.measured_at))
-        .limit(limit)
-        .offset(offset)
+    query = apply_cursor(
+        select(VitalSign).where(VitalSign.user_id == patient_id),
+        VitalSign.measured_at,
+        VitalSign.id,
+        cursor
     )
-    return result.scalars().all()
+    if not cursor:
+        query = query.offset(offset)
+    
+    result = await db.execute(query.limit(limit + 1))
+    return page_with_cursor(result.scalars().all(), limit, "measured_at", response)
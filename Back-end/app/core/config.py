@@ -27,9 +27,18 @@ class Settings(BaseSettings):
     postgres_user: str = "healthmate"
     postgres_password: str = "healthmate123"
     postgres_db: str = "healthmate_db"
+    vitals_export_batch_size: int = 5000  # Rows per server-side cursor fetch in /vitals/bp/export
+    vitals_partition_months_ahead: int = 3  # Monthly vital_signs partitions created in advance
+    vitals_partition_retention_months: int = 0  # Drop partitions older than this (0 = keep all)
+    vitals_partition_check_interval_seconds: int = 86400  # Partition maintenance interval (0 = startup only)
     
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    cache_local_max_entries: int = 10000  # In-process cache tier size (0 = Redis only)
+    cache_local_ttl_seconds: float = 30.0  # Max staleness of the in-process tier across workers
+    cache_early_refresh_beta: float = 1.0  # Probabilistic early refresh aggressiveness (0 = off)
+    cache_serializer: str = "orjson"  # Redis payload format: orjson, msgpack or json
+    vitals_stats_cache_ttl_seconds: int = 300  # /vitals/bp/stats cache lifetime
     
     # JWT
     jwt_secret: str
@@ -45,7 +54,19 @@ class Settings(BaseSettings):
     
     # AI Models
     symptom_checker_model_path: str = "../Symptom-Checker/Output/Production/"
+    symptom_checker_archive_path: str = "../Symptom-Checker/Output/Models_Archive/"
+    symptom_checker_use_compact: bool = True  # Prefer mmap'd compact artifact / NumPy MLP kernel over sklearn
     bp_model_path: str = "../Predict-ABP/models/"
+    ai_inference_workers: int = 2  # Threads running model inference
+    ai_inference_queue_size: int = 32  # Max requests waiting for a worker before 503
+    ai_batch_window_ms: float = 5.0  # Max time a symptom check waits to be batched
+    ai_batch_max_size: int = 64  # Flush micro-batch early at this many requests
+    ai_catalog_max_age_seconds: int = 86400  # Client cache lifetime for /ai/available-symptoms
+    ai_candidate_model: str = ""  # Archive model name for A/B (e.g. Deep_Neural_Network)
+    ai_candidate_traffic_percent: float = 0.0  # Share of requests served by candidate
+    ai_model_reload_interval_seconds: float = 30.0  # Hot-swap polling interval (0 = disabled)
+    ai_prediction_cache_size: int = 1024  # In-process LRU entries (0 = cache disabled)
+    ai_prediction_cache_ttl_seconds: int = 3600  # Redis lifetime of cached predictions
     
     # Cloudinary
     cloudinary_cloud_name: str = ""
@@ -4,6 +4,7 @@ Database session management
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy import text
 from app.core.config import settings
 
 
@@ -49,3 +50,19 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def ping_database() -> bool:
+    """
+    Check a pooled database connection can run a query
+    
+    Returns:
+        True if SELECT 1 succeeded
+    """
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        print(f"Database PING error: {e}")
+        return False
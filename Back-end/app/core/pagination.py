@@ -0,0 +1,106 @@
+"""
+Keyset (cursor) pagination for newest-first history lists
+Cursors are opaque base64 tokens of the last row's (timestamp, id)
+"""
+
+import base64
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import desc, tuple_
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """
+    Build cursor pointing just after a row
+    
+    Args:
+        sort_value: Row's sort timestamp (e.g. measured_at)
+        row_id: Row's primary key (tie-breaker)
+    
+    Returns:
+        URL-safe opaque cursor
+    """
+    raw = f"{sort_value.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse cursor built by encode_cursor
+    
+    Args:
+        cursor: Opaque cursor from a previous page
+    
+    Returns:
+        (sort_value, row_id)
+    
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def apply_cursor(query, sort_column, id_column, cursor: Optional[str]):
+    """
+    Order query newest first and start it after the cursor's row
+    
+    The standalone sort_column <= bound lets Postgres start the index
+    scan at the cursor (constant cost per page); the row comparison
+    then skips rows already returned with the same timestamp.
+    
+    Args:
+        query: Select filtered to one user
+        sort_column: Timestamp column (e.g. VitalSign.measured_at)
+        id_column: Primary key column
+        cursor: Cursor from the previous page, or None for the first page
+    
+    Returns:
+        Query with keyset filter and ordering (limit not applied)
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = (
+            query
+            .where(sort_column <= sort_value)
+            .where(tuple_(sort_column, id_column) < tuple_(sort_value, row_id))
+        )
+    return query.order_by(desc(sort_column), desc(id_column))
+
+
+def page_with_cursor(
+    rows: Sequence,
+    limit: int,
+    sort_attr: str,
+    response: Response
+) -> Sequence:
+    """
+    Trim a limit + 1 fetch to one page and set the next-page cursor header
+    
+    Args:
+        rows: Up to limit + 1 rows in page order
+        limit: Page size
+        sort_attr: Name of the rows' sort timestamp attribute
+        response: Response to set the X-Next-Cursor header on (omitted on the last page)
+    
+    Returns:
+        At most limit rows
+    """
+    page = rows[:limit]
+    if len(rows) > limit and page:
+        last = page[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(last, sort_attr), last.id)
+    return page
@@ -0,0 +1,99 @@
+"""
+Pluggable serializers for cache payloads and API responses
+Uses orjson / msgpack when installed, stdlib json otherwise
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class JsonSerializer:
+    """Stdlib json (always available)"""
+    
+    name = "json"
+    
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    """orjson: same JSON output, several times faster encode/decode"""
+    
+    name = "orjson"
+    
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer:
+    """msgpack: compact binary payloads (Redis only, not for HTTP)"""
+    
+    name = "msgpack"
+    
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+    
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+SERIALIZERS = {
+    "json": (JsonSerializer, lambda: True),
+    "orjson": (OrjsonSerializer, lambda: orjson is not None),
+    "msgpack": (MsgpackSerializer, lambda: msgpack is not None),
+}
+
+
+def get_serializer(name: str):
+    """
+    Get serializer by name, falling back to stdlib json
+    
+    Args:
+        name: "json", "orjson" or "msgpack"
+    
+    Returns:
+        Serializer with dumps(value) -> bytes and loads(bytes) -> value
+    """
+    serializer_class, available = SERIALIZERS.get(name, SERIALIZERS["json"])
+    if not available():
+        print(f"⚠️  Serializer '{name}' not installed, using json")
+        return JsonSerializer()
+    return serializer_class()
+
+
+# Fastest JSON encoder available (HTTP responses)
+json_serializer = get_serializer("orjson") if orjson is not None else JsonSerializer()
+
+# Redis payload format
+cache_serializer = get_serializer(settings.cache_serializer)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when installed
+    
+    Used as the app's default response class.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return json_serializer.dumps(content)
@@ -3,15 +3,22 @@ Main FastAPI application
 NO HARDCODED VALUES - all config from settings
 """
 
+import asyncio
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
-from app.core.database import engine
+from app.core.database import engine, ping_database
+from app.core.serialization import FastJSONResponse
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.models import Base
 from app.api.v1 import auth, vitals, medications, users, iot, upload, notifications, ai, contacts
 from app.services.redis_cache import redis_cache
+from app.services.inference_executor import inference_executor
+from app.services.ai_service import symptom_checker, watch_model_files
+from app.services.vitals_partitions import maintain_partitions, watch_partitions
 
 
 # Lifespan events
@@ -28,17 +35,60 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     
     print("✅ Database tables created")
+    
+    # Monthly vital_signs partitions (current + upcoming, drop expired)
+    try:
+        await maintain_partitions(
+            engine,
+            settings.vitals_partition_months_ahead,
+            settings.vitals_partition_retention_months
+        )
+    except Exception as e:
+        print(f"❌ Partition maintenance failed: {e}")
     print(f"✅ Environment: {settings.environment}")
     print(f"✅ IoT Mode: {settings.iot_mode}")
     
     # Connect to Redis
     await redis_cache.connect()
     
+    # Start AI inference pool
+    inference_executor.start()
+    print(f"✅ Inference pool: {settings.ai_inference_workers} workers, queue {settings.ai_inference_queue_size}")
+    
+    # Load and warm up AI model before accepting traffic
+    if await inference_executor.run(symptom_checker.warm_up):
+        print("✅ Symptom Checker model warmed up")
+    else:
+        print("⚠️  Symptom Checker model warm-up failed")
+    
+    # Hot-swap model files without restarting workers
+    model_watcher = None
+    if settings.ai_model_reload_interval_seconds > 0:
+        model_watcher = asyncio.create_task(
+            watch_model_files(inference_executor, settings.ai_model_reload_interval_seconds)
+        )
+    
+    partition_watcher = None
+    if settings.vitals_partition_check_interval_seconds > 0:
+        partition_watcher = asyncio.create_task(
+            watch_partitions(
+                engine,
+                settings.vitals_partition_check_interval_seconds,
+                settings.vitals_partition_months_ahead,
+                settings.vitals_partition_retention_months
+            )
+        )
+    
     yield
     
     # Shutdown
     print("👋 Shutting down Health Mate API...")
+    if model_watcher:
+        model_watcher.cancel()
+    if partition_watcher:
+        partition_watcher.cancel()
     await redis_cache.disconnect()
+    inference_executor.shutdown()
     await engine.dispose()
 
 
@@ -47,7 +97,8 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     debug=settings.debug,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware
@@ -56,7 +107,8 @@ app.add_middleware(
     allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER]
 )
 
 import socketio
@@ -126,6 +178,30 @@ async def health_check():
     }
 
 
+# Readiness endpoint (for load balancers)
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness check endpoint
+    
+    Returns 503 until the AI model is warm and Redis and the database answer
+    """
+    checks = {
+        "model": symptom_checker.warmed,
+        "redis": await redis_cache.ping(),
+        "database": await ping_database()
+    }
+    ready = all(checks.values())
+    
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "checks": checks
+        }
+    )
+
+
 # Root endpoint
 @app.get("/")
 async def root():
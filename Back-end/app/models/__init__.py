@@ -6,6 +6,7 @@ from app.core.database import Base
 from app.models.user import User, UserRole
 from app.models.patient_caregiver_link import PatientCaregiverLink
 from app.models.vital_sign import VitalSign, RiskLevel
+from app.models.vital_sign_rollup import VitalSignRollup, RollupBucket
 from app.models.medication import Medication
 from app.models.call_session import CallSession, CallType, CallStatus
 from app.models.medical_contact import MedicalContact, ContactType
@@ -20,6 +21,8 @@ __all__ = [
     "PatientCaregiverLink",
     "VitalSign",
     "RiskLevel",
+    "VitalSignRollup",
+    "RollupBucket",
     "Medication",
     "CallSession",
     "CallType",
@@ -2,7 +2,7 @@
 Notification model for alerts and messages
 """
 
-from sqlalchemy import Column, ForeignKey, String, Boolean, DateTime, Enum as SQLEnum, Text
+from sqlalchemy import Column, ForeignKey, String, Boolean, DateTime, Index, Enum as SQLEnum, Text
 from sqlalchemy.dialects.postgresql import UUID, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -53,6 +53,11 @@ class Notification(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     read_at = Column(DateTime, nullable=True)
     
+    # Indexes (user's notifications, optionally unread only, by date)
+    __table_args__ = (
+        Index("ix_notifications_user_id_is_read_created_at", "user_id", "is_read", "created_at"),
+    )
+    
     # Relationship
     user = relationship("User")
     
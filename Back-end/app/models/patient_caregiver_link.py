@@ -3,7 +3,7 @@ Patient-Caregiver relationship model
 Many-to-many relationship allowing multiple caregivers per patient
 """
 
-from sqlalchemy import Column, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -36,6 +36,11 @@ class PatientCaregiverLink(Base):
     linked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    # Indexes (caregiver's active patients / link checks)
+    __table_args__ = (
+        Index("ix_patient_caregiver_links_caregiver_patient_active", "caregiver_id", "patient_id", "is_active"),
+    )
+    
     # Relationships
     patient = relationship("User", foreign_keys=[patient_id], back_populates="caregivers")
     caregiver = relationship("User", foreign_keys=[caregiver_id], back_populates="patients")
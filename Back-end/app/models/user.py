@@ -4,7 +4,7 @@ Supports Patient and Caregiver roles
 """
 
 from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -47,6 +47,9 @@ class User(Base):
     gender = Column(String(20), nullable=True)
     profile_image_url = Column(String(500), nullable=True)
     
+    # Custom BP risk thresholds, e.g. {"high": [150, 95]} (None = guideline defaults)
+    bp_thresholds = Column(JSON, nullable=True)
+    
     # Role
     role = Column(SQLEnum(UserRole), nullable=False, index=True)
     
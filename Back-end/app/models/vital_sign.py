@@ -2,7 +2,7 @@
 Vital signs model for blood pressure readings
 """
 
-from sqlalchemy import Column, ForeignKey, Integer, Float, String, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, ForeignKey, Integer, Float, String, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -27,6 +27,9 @@ class VitalSign(Base):
     
     Stores BP readings from sensors or manual input
     Includes risk level for emergency alerts
+    
+    Range-partitioned by month on measured_at (migration 008), so
+    queries with a measured_at range only scan the matching months
     """
     __tablename__ = "vital_signs"
     
@@ -56,16 +59,22 @@ class VitalSign(Base):
     signal_quality = Column(Float, nullable=True)  # 0.0 to 1.0
     
     # Timestamps
-    measured_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    measured_at = Column(DateTime, default=datetime.utcnow, primary_key=True, index=True)  # Partition key, part of PK
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
+    # Indexes (history / latest reading: filter by user, newest first) and monthly partitioning
+    __table_args__ = (
+        Index("ix_vital_signs_user_id_measured_at", "user_id", measured_at.desc()),
+        {"postgresql_partition_by": "RANGE (measured_at)"},
+    )
+    
     # Relationship
     user = relationship("User", back_populates="vitals")
     
     def __repr__(self):
         return f"<VitalSign(user={self.user_id}, bp={self.systolic}/{self.diastolic}, risk={self.risk_level})>"
     
-    def calculate_risk_level(self) -> RiskLevel:
+    def calculate_risk_level(self, thresholds=None) -> RiskLevel:
         """
         Calculate risk level based on BP thresholds
         
@@ -74,14 +83,10 @@ class VitalSign(Base):
         Moderate: 120-139/80-89
         High: 140-179/90-119
         Critical: >= 180/120
+        
+        Thresholds come from the table in app/services/risk_classifier.py
+        (or a patient's custom table), shared with batch classification.
         """
-        if self.systolic < 90 or self.diastolic < 60:
-            return RiskLevel.LOW
-        elif self.systolic >= 180 or self.diastolic >= 120 :
-            return RiskLevel.CRITICAL
-        elif self.systolic >= 140 or self.diastolic >= 90:
-            return RiskLevel.HIGH
-        elif self.systolic >= 120 or self.diastolic >= 80:
-            return RiskLevel.MODERATE
-        else:
-            return RiskLevel.NORMAL
+        from app.services.risk_classifier import classify_reading
+        
+        return classify_reading(self.systolic, self.diastolic, thresholds)
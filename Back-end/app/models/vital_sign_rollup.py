@@ -0,0 +1,62 @@
+"""
+Time-bucketed blood pressure rollups for trend charts
+"""
+
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+
+from app.core.database import Base
+
+
+class RollupBucket(str, enum.Enum):
+    """Rollup bucket width (date_trunc field)"""
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+
+class VitalSignRollup(Base):
+    """
+    Per-user BP aggregates for one hour / day / week bucket
+    
+    Holds count, sum, min and max per measurement plus risk level
+    counts, so averages and trends over months are read from one row
+    per bucket instead of every reading.
+    
+    Maintained incrementally on insert and rebuilt from vital_signs
+    when readings are deleted (see app/services/vitals_rollup.py)
+    """
+    __tablename__ = "vital_sign_rollups"
+    
+    # Primary Key (one row per user, bucket width and bucket start)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    bucket = Column(String(10), primary_key=True)  # hour, day, week
+    bucket_start = Column(DateTime, primary_key=True)
+    
+    # Readings in bucket
+    count = Column(Integer, nullable=False, default=0)
+    
+    # Blood Pressure
+    systolic_sum = Column(Integer, nullable=False, default=0)
+    systolic_min = Column(Integer, nullable=False)
+    systolic_max = Column(Integer, nullable=False)
+    diastolic_sum = Column(Integer, nullable=False, default=0)
+    diastolic_min = Column(Integer, nullable=False)
+    diastolic_max = Column(Integer, nullable=False)
+    
+    # Heart Rate (only readings that have one)
+    heart_rate_count = Column(Integer, nullable=False, default=0)
+    heart_rate_sum = Column(Integer, nullable=False, default=0)
+    heart_rate_min = Column(Integer, nullable=True)
+    heart_rate_max = Column(Integer, nullable=True)
+    
+    # Risk Level Counts
+    normal_count = Column(Integer, nullable=False, default=0)
+    low_count = Column(Integer, nullable=False, default=0)
+    moderate_count = Column(Integer, nullable=False, default=0)
+    high_count = Column(Integer, nullable=False, default=0)
+    critical_count = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<VitalSignRollup(user={self.user_id}, {self.bucket}={self.bucket_start}, count={self.count})>"
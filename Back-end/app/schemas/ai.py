@@ -3,7 +3,7 @@ AI schemas for inference requests and responses
 """
 
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict
+from typing import Annotated, List, Optional, Dict
 
 
 class SymptomCheckRequest(BaseModel):
@@ -11,6 +11,15 @@ class SymptomCheckRequest(BaseModel):
     symptoms: List[str] = Field(..., min_items=1, max_items=20)
     
 
+class SymptomBatchRequest(BaseModel):
+    """Batched symptom checker request"""
+    # Each set is bounded like SymptomCheckRequest.symptoms
+    symptom_sets: List[Annotated[List[str], Field(min_length=1, max_length=20)]] = Field(
+        ..., min_items=1, max_items=1000
+    )
+    top_k: int = Field(default=3, ge=1, le=10)
+
+
 class DiseaseInfo(BaseModel):
     """Disease information"""
     name: str
@@ -31,6 +40,29 @@ class SymptomCheckResponse(BaseModel):
     disclaimer: str = "This is an AI prediction for educational purposes only. Please consult a healthcare professional for accurate diagnosis."
 
 
+class DiseasePrediction(BaseModel):
+    """Single ranked disease prediction"""
+    disease: str
+    confidence: Optional[float]
+
+
+class SymptomBatchResult(BaseModel):
+    """Prediction result for one symptom list in a batch"""
+    disease: str
+    confidence: Optional[float]
+    symptoms_matched: int
+    top_predictions: List[DiseasePrediction]
+
+
+class SymptomBatchResponse(BaseModel):
+    """Batched symptom checker response"""
+    model_config = ConfigDict(protected_namespaces=())
+    
+    model_version: str
+    results: List[SymptomBatchResult]
+    disclaimer: str = "This is an AI prediction for educational purposes only. Please consult a healthcare professional for accurate diagnosis."
+
+
 class ChatRequest(BaseModel):
     """Chat request"""
     message: str
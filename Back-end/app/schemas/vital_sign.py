@@ -2,12 +2,15 @@
 Vital signs schemas
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, Field, validator
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 from app.models.vital_sign import RiskLevel
 
+# Allowed clock drift of sensor gateways
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
 
 class VitalSignCreate(BaseModel):
     """Create vital sign reading"""
@@ -17,6 +20,34 @@ class VitalSignCreate(BaseModel):
     source: str = Field(default="manual", max_length=50)
 
 
+class VitalSignBulkItem(VitalSignCreate):
+    """Buffered reading with the time it was taken"""
+    measured_at: Optional[datetime] = None  # Defaults to upload time
+    
+    @validator('measured_at')
+    def validate_measured_at(cls, v):
+        """Normalize to naive UTC (as stored) and reject future readings"""
+        if v is None:
+            return v
+        if v.tzinfo is not None:
+            v = v.astimezone(timezone.utc).replace(tzinfo=None)
+        if v > datetime.utcnow() + MAX_CLOCK_SKEW:
+            raise ValueError('measured_at cannot be in the future')
+        return v
+
+
+class VitalSignBulkCreate(BaseModel):
+    """Batch of readings uploaded by a sensor gateway"""
+    readings: List[VitalSignBulkItem] = Field(..., min_length=1, max_length=5000)
+
+
+class VitalSignBulkResponse(BaseModel):
+    """Bulk upload result"""
+    inserted: int
+    risk_levels: Dict[RiskLevel, int]
+    alert_sent: bool
+
+
 class VitalSignResponse(BaseModel):
     """Vital sign response"""
     id: UUID
@@ -33,3 +64,29 @@ class VitalSignResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class PatientLatestVitals(BaseModel):
+    """Linked patient's latest BP reading"""
+    patient_id: UUID
+    full_name: str
+    risk_level: Optional[RiskLevel] = None
+    latest: Optional[VitalSignResponse] = None
+
+
+class CaregiverOverviewResponse(BaseModel):
+    """Latest BP reading of every linked patient"""
+    patients: List[PatientLatestVitals]
+
+
+class BPThresholds(BaseModel):
+    """
+    BP risk thresholds as [systolic, diastolic] in mmHg
+    
+    Low is "below either", the others "at or above either". Levels
+    left out use the guideline defaults.
+    """
+    low: Optional[Tuple[int, int]] = None
+    moderate: Optional[Tuple[int, int]] = None
+    high: Optional[Tuple[int, int]] = None
+    critical: Optional[Tuple[int, int]] = None
@@ -3,13 +3,16 @@ AI inference service for Symptom Checker
 Integrates existing trained model from Symptom-Checker directory
 """
 
-import joblib
+import asyncio
 import json
 import os
+import numpy as np
 from typing import List, Dict, Optional
 from pathlib import Path
 
 from app.core.config import settings
+from app.services.symptom_matcher import SymptomMatcher
+from app.services.model_registry import ModelRegistry, model_registry, PRODUCTION_MODEL_NAME
 
 
 class SymptomCheckerService:
@@ -19,40 +22,49 @@ class SymptomCheckerService:
     Uses existing trained model from Symptom-Checker/Output/Production/
     """
     
-    def __init__(self):
+    def __init__(self, registry: ModelRegistry):
         """Initialize model paths"""
         self.model_path = Path(settings.symptom_checker_model_path)
-        self.model = None
-        self.vectorizer = None
+        self.registry = registry
         self.metadata = None
+        self.symptom_matcher = SymptomMatcher()
         self.loaded = False
+        self.warmed = False
+    
+    @property
+    def model(self):
+        """Active (production) model"""
+        return self.registry.active.model if self.registry.active else None
+    
+    @property
+    def vectorizer(self):
+        """Active (production) vectorizer"""
+        return self.registry.active.vectorizer if self.registry.active else None
+    
+    def _load_metadata(self):
+        """
+        Load metadata and compile chat symptom extractor
+        """
+        metadata = None
+        metadata_file = self.model_path / "model_metadata.json"
+        if metadata_file.exists():
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+            print("✅ Model metadata loaded")
+        
+        # Compile chat symptom extractor once per model load
+        self.symptom_matcher = SymptomMatcher.from_metadata(metadata)
+        self.metadata = metadata
     
     def load_model(self):
         """
         Load trained model, vectorizer, and metadata
         """
         try:
-            # Load model
-            model_file = self.model_path / "best_model.pkl"
-            if not model_file.exists():
-                print(f"⚠️  Symptom Checker model not found at: {model_file}")
+            if not self.registry.load():
                 return False
             
-            self.model = joblib.load(model_file)
-            print("✅ Symptom Checker model loaded")
-            
-            # Load vectorizer
-            vectorizer_file = self.model_path / "vectorizer.pkl"
-            if vectorizer_file.exists():
-                self.vectorizer = joblib.load(vectorizer_file)
-                print("✅ Vectorizer loaded")
-            
-            # Load metadata
-            metadata_file = self.model_path / "model_metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    self.metadata = json.load(f)
-                print("✅ Model metadata loaded")
+            self._load_metadata()
             
             self.loaded = True
             return True
@@ -61,6 +73,58 @@ class SymptomCheckerService:
             print(f"❌ Error loading Symptom Checker model: {e}")
             return False
     
+    def reload_if_changed(self) -> List[str]:
+        """
+        Hot-swap models whose files changed (no worker restart)
+        
+        Returns:
+            Names of swapped model versions
+        """
+        if not self.loaded:
+            # Startup load failed: retry until a model answers, readiness follows
+            if self.warm_up():
+                print("✅ Symptom Checker model loaded and warmed up")
+                return [PRODUCTION_MODEL_NAME]
+            return []
+        
+        try:
+            swapped = self.registry.refresh()
+            if PRODUCTION_MODEL_NAME in swapped:
+                self._load_metadata()
+            if PRODUCTION_MODEL_NAME in swapped or not self.warmed:
+                # Readiness reflects the model now serving, not the one at startup
+                self.warm_up()
+            return swapped
+        except Exception as e:
+            print(f"❌ Error reloading Symptom Checker model: {e}")
+            return []
+    
+    def extract_symptoms(self, message: str) -> List[str]:
+        """
+        Extract known symptoms from free-text message
+        
+        Args:
+            message: User message (English or Arabic)
+        
+        Returns:
+            List of canonical symptom names
+        """
+        return self.symptom_matcher.find(message)
+    
+    def warm_up(self) -> bool:
+        """
+        Load model (if needed) and run a throwaway prediction
+        
+        Called at startup so the first real request does not pay the
+        unpickle and first-inference cost.
+        
+        Returns:
+            True if model is loaded and answered a prediction
+        """
+        sample = (self.metadata or {}).get("symptoms", [])[:3] or ["fever", "headache"]
+        self.warmed = self.predict_batch([sample]) is not None
+        return self.warmed
+    
     def predict_disease(self, symptoms: List[str]) -> Optional[Dict]:
         """
         Predict disease from symptoms
@@ -71,41 +135,125 @@ class SymptomCheckerService:
         Returns:
             Dict with prediction results or None
         """
+        results = self.predict_batch([symptoms], top_k=1)
+        if not results:
+            return None
+        return results[0]
+    
+    def predict_batch(self, symptom_sets: List[List[str]], top_k: int = 3) -> Optional[List[Dict]]:
+        """
+        Predict diseases for many symptom lists in one vectorized pass
+        
+        All symptom lists are vectorized into a single sparse matrix and the
+        model is run once; labels and top-k confidences are both read from
+        the same probability matrix.
+        
+        Args:
+            symptom_sets: List of symptom string lists (one per patient)
+            top_k: Number of ranked predictions to return per symptom list
+        
+        Returns:
+            List of prediction dicts (same order as input) or None
+        """
         if not self.loaded:
             if not self.load_model():
                 return None
         
         try:
-            # Join symptoms into single string
-            symptoms_text = " ".join(symptoms)
+            # Snapshot versions so a concurrent hot-swap can't change them mid-batch
+            active = self.registry.active
+            candidate = self.registry.candidate
             
-            # Vectorize input
-            if self.vectorizer:
-                symptoms_vector = self.vectorizer.transform([symptoms_text])
-            else:
-                # Fallback if no vectorizer
-                symptoms_vector = [symptoms_text]
+            # Join each symptom list into a single string
+            symptom_texts = [" ".join(symptoms) for symptoms in symptom_sets]
             
-            # Make prediction
-            prediction = self.model.predict(symptoms_vector)[0]
+            model_version = self.metadata.get("version", "unknown") if self.metadata else "unknown"
             
-            # Get prediction probability if available
-            confidence = None
-            if hasattr(self.model, 'predict_proba'):
-                probabilities = self.model.predict_proba(symptoms_vector)[0]
-                confidence = float(max(probabilities))
+            # Single vectorized pass of the active model over the whole batch
+            results = self._rank(
+                active, self.registry.score(active, symptom_texts), symptom_sets, top_k, model_version
+            )
             
-            return {
-                "disease": prediction,
-                "confidence": confidence,
-                "symptoms_matched": len(symptoms),
-                "model_version": self.metadata.get("version") if self.metadata else "unknown"
-            }
+            # A/B: serve routed rows from the candidate, tracking agreement with active
+            routed = [i for i, to_candidate in enumerate(self.registry.route(len(symptom_sets))) if to_candidate]
+            if candidate and routed:
+                routed_sets = [symptom_sets[i] for i in routed]
+                candidate_results = self._rank(
+                    candidate,
+                    self.registry.score(candidate, [symptom_texts[i] for i in routed]),
+                    routed_sets,
+                    top_k,
+                    candidate.name
+                )
+                candidate.metrics.record_agreement(
+                    sum(results[i]["disease"] == r["disease"] for i, r in zip(routed, candidate_results)),
+                    len(routed)
+                )
+                for i, result in zip(routed, candidate_results):
+                    results[i] = result
+            
+            return results
             
         except Exception as e:
             print(f"Error during prediction: {e}")
             return None
     
+    def _rank(self, version, scores, symptom_sets: List[List[str]], top_k: int, model_version: str) -> List[Dict]:
+        """
+        Turn one probability matrix into ranked top-k prediction dicts
+        
+        Args:
+            version: Model version that produced the scores
+            scores: (probabilities, labels) from ModelRegistry.score
+            symptom_sets: Input symptom lists
+            top_k: Number of ranked predictions per row
+            model_version: Version label reported with each result
+        
+        Returns:
+            List of prediction dicts
+        """
+        probabilities, labels = scores
+        
+        # Models without probabilities only give us the label
+        if probabilities is None:
+            return [
+                {
+                    "disease": str(prediction),
+                    "confidence": None,
+                    "symptoms_matched": len(symptoms),
+                    "model_version": model_version,
+                    "top_predictions": [{"disease": str(prediction), "confidence": None}]
+                }
+                for prediction, symptoms in zip(labels, symptom_sets)
+            ]
+        
+        probabilities = np.asarray(probabilities)
+        classes = version.model.classes_
+        k = max(1, min(top_k, len(classes)))
+        
+        # Top-k class indices per row, ordered by descending probability
+        top_indices = np.argpartition(-probabilities, k - 1, axis=1)[:, :k]
+        top_probabilities = np.take_along_axis(probabilities, top_indices, axis=1)
+        order = np.argsort(-top_probabilities, axis=1, kind="stable")
+        top_indices = np.take_along_axis(top_indices, order, axis=1)
+        top_probabilities = np.take_along_axis(top_probabilities, order, axis=1)
+        
+        results = []
+        for symptoms, row_indices, row_probabilities in zip(symptom_sets, top_indices, top_probabilities):
+            top_predictions = [
+                {"disease": str(classes[idx]), "confidence": float(prob)}
+                for idx, prob in zip(row_indices, row_probabilities)
+            ]
+            results.append({
+                "disease": top_predictions[0]["disease"],
+                "confidence": top_predictions[0]["confidence"],
+                "symptoms_matched": len(symptoms),
+                "model_version": model_version,
+                "top_predictions": top_predictions
+            })
+        
+        return results
+    
     def get_disease_info(self, disease_name: str) -> Optional[Dict]:
         """
         Get educational information about disease
@@ -125,7 +273,7 @@ class SymptomCheckerService:
 
 
 # Singleton instance
-symptom_checker = SymptomCheckerService()
+symptom_checker = SymptomCheckerService(model_registry)
 
 
 def get_symptom_checker() -> SymptomCheckerService:
@@ -133,3 +281,19 @@ def get_symptom_checker() -> SymptomCheckerService:
     if not symptom_checker.loaded:
         symptom_checker.load_model()
     return symptom_checker
+
+
+async def watch_model_files(executor, interval_seconds: float):
+    """
+    Background task: periodically hot-swap models whose files changed
+    
+    Args:
+        executor: Inference executor (reloads run off the event loop)
+        interval_seconds: Polling interval
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await executor.run(symptom_checker.reload_if_changed)
+        except Exception as e:
+            print(f"⚠️  Model reload check skipped: {e}")
@@ -0,0 +1,324 @@
+"""
+Compact (non-pickle) symptom checker model
+Loads the artifact exported by Symptom-Checker/train_model.py and runs
+vectorization + MLP inference with NumPy on memory-mapped weights
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.special import expit
+
+
+COMPACT_DIR_NAME = "compact"
+COMPACT_FORMAT = "healthmate-mlp"
+COMPACT_FORMAT_VERSION = 1
+
+
+# In-place activations (same operations as sklearn.neural_network)
+def _identity(X):
+    return X
+
+
+def _logistic(X):
+    return expit(X, out=X)
+
+
+def _tanh(X):
+    return np.tanh(X, out=X)
+
+
+def _relu(X):
+    return np.maximum(X, 0, out=X)
+
+
+def _softmax(X):
+    X -= X.max(axis=1)[:, np.newaxis]
+    np.exp(X, out=X)
+    X /= X.sum(axis=1)[:, np.newaxis]
+    return X
+
+
+ACTIVATIONS = {
+    "identity": _identity,
+    "logistic": _logistic,
+    "tanh": _tanh,
+    "relu": _relu,
+    "softmax": _softmax,
+}
+
+
+class CompactVectorizer:
+    """
+    Word n-gram count / TF-IDF vectorizer driven by an exported vocabulary
+    
+    Mirrors sklearn CountVectorizer/TfidfVectorizer.transform for the
+    default word analyzer.
+    """
+    
+    def __init__(
+        self,
+        vocabulary: List[str],
+        token_pattern: str,
+        ngram_range: Tuple[int, int] = (1, 1),
+        lowercase: bool = True,
+        binary: bool = False,
+        idf: Optional[np.ndarray] = None,
+        norm: Optional[str] = None,
+        sublinear_tf: bool = False
+    ):
+        """Initialize from exported vectorizer parameters"""
+        self.vocabulary_ = {term: idx for idx, term in enumerate(vocabulary)}
+        self.n_features = len(vocabulary)
+        self.token_re = re.compile(token_pattern)
+        self.ngram_range = tuple(ngram_range)
+        self.lowercase = lowercase
+        self.binary = binary
+        self.idf = idf
+        self.norm = norm
+        self.sublinear_tf = sublinear_tf
+    
+    def _analyze(self, text: str) -> List[str]:
+        """Split text into word n-grams"""
+        if self.lowercase:
+            text = text.lower()
+        tokens = self.token_re.findall(text)
+        
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        
+        terms = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            for i in range(len(tokens) - n + 1):
+                terms.append(" ".join(tokens[i:i + n]))
+        return terms
+    
+    def transform(self, texts: List[str]) -> csr_matrix:
+        """
+        Vectorize texts into a sparse feature matrix
+        
+        Args:
+            texts: Raw documents
+        
+        Returns:
+            CSR matrix (n_texts x n_features)
+        """
+        indptr = [0]
+        indices = []
+        data = []
+        
+        for text in texts:
+            counts: Dict[int, int] = {}
+            for term in self._analyze(text):
+                idx = self.vocabulary_.get(term)
+                if idx is not None:
+                    counts[idx] = counts.get(idx, 0) + 1
+            columns = sorted(counts)
+            indices.extend(columns)
+            data.extend(counts[c] for c in columns)
+            indptr.append(len(indices))
+        
+        indices = np.asarray(indices, dtype=np.int32)
+        data = np.asarray(data, dtype=np.float64)
+        indptr = np.asarray(indptr, dtype=np.int32)
+        
+        if self.binary:
+            data.fill(1.0)
+        if self.sublinear_tf:
+            np.log(data, out=data)
+            data += 1.0
+        if self.idf is not None:
+            data *= self.idf[indices]
+        if self.norm:
+            rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+            if self.norm == "l2":
+                norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=len(texts)))
+            else:
+                norms = np.bincount(rows, weights=np.abs(data), minlength=len(texts))
+            norms[norms == 0.0] = 1.0
+            data /= norms[rows]
+        
+        return csr_matrix((data, indices, indptr), shape=(len(texts), self.n_features))
+
+
+class CompactMLPClassifier:
+    """
+    NumPy forward pass for an exported sklearn MLPClassifier
+    
+    Exposes classes_, predict and predict_proba so it can stand in for
+    the sklearn estimator in SymptomCheckerService. Skips sklearn's input
+    validation and dispatch, and writes dense layer outputs into
+    preallocated per-thread buffers. Operations mirror
+    MLPClassifier._forward_pass_fast, so probabilities are identical.
+    """
+    
+    def __init__(
+        self,
+        coefs: List[np.ndarray],
+        intercepts: List[np.ndarray],
+        classes: List[str],
+        activation: str = "relu",
+        out_activation: str = "softmax"
+    ):
+        """Initialize from layer weights"""
+        self.coefs_ = coefs
+        self.intercepts_ = intercepts
+        self.classes_ = np.asarray(classes)
+        self.activation = activation
+        self.out_activation_ = out_activation
+        self._hidden_activation = ACTIVATIONS[activation]
+        self._output_activation = ACTIVATIONS[out_activation]
+        self._local = threading.local()
+    
+    @classmethod
+    def from_sklearn(cls, model) -> "CompactMLPClassifier":
+        """
+        Build kernel from a fitted sklearn MLPClassifier
+        
+        Args:
+            model: Fitted MLPClassifier (e.g. unpickled best_model.pkl)
+        
+        Returns:
+            Kernel sharing the model's weight arrays
+        """
+        return cls(
+            coefs=list(model.coefs_),
+            intercepts=list(model.intercepts_),
+            classes=list(model.classes_),
+            activation=model.activation,
+            out_activation=model.out_activation_
+        )
+    
+    def _buffers(self, n_samples: int) -> List[np.ndarray]:
+        """
+        Get this thread's layer output buffers sized for n_samples rows
+        
+        Buffers grow geometrically and are reused across calls.
+        """
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None or buffers[0].shape[0] < n_samples:
+            capacity = max(n_samples, 2 * buffers[0].shape[0] if buffers else 1)
+            buffers = [
+                np.empty((capacity, coef.shape[1]), dtype=np.result_type(coef.dtype, np.float64))
+                for coef in self.coefs_
+            ]
+            self._local.buffers = buffers
+        return [buffer[:n_samples] for buffer in buffers]
+    
+    def _forward(self, X) -> np.ndarray:
+        """Run forward pass, returning output layer activations (buffer view)"""
+        buffers = self._buffers(X.shape[0])
+        last = len(self.coefs_) - 1
+        
+        activation = X
+        if isinstance(activation, np.ndarray) and activation.dtype != np.float64:
+            activation = activation.astype(np.float64)
+        
+        for i, (coef, intercept) in enumerate(zip(self.coefs_, self.intercepts_)):
+            out = buffers[i]
+            if isinstance(activation, np.ndarray):
+                np.matmul(activation, coef, out=out)
+            else:
+                # Sparse input (first layer): scipy CSR @ dense
+                out[...] = activation @ coef
+            out += intercept
+            if i != last:
+                self._hidden_activation(out)
+            activation = out
+        
+        return self._output_activation(activation)
+    
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Class probabilities
+        
+        Args:
+            X: Feature matrix (dense or sparse)
+        
+        Returns:
+            Array (n_samples x n_classes), owned by the caller
+        """
+        y_pred = self._forward(X)
+        if y_pred.shape[1] == 1:
+            # Binary network has a single logistic output unit
+            y_pred = y_pred.ravel()
+            return np.vstack([1 - y_pred, y_pred]).T
+        return y_pred.copy()
+    
+    def predict(self, X) -> np.ndarray:
+        """Most likely class label per sample"""
+        y_pred = self._forward(X)
+        if y_pred.shape[1] == 1:
+            return self.classes_[(y_pred.ravel() > 0.5).astype(int)]
+        return self.classes_[np.argmax(y_pred, axis=1)]
+
+
+def load_compact_model(
+    directory: Path
+) -> Optional[Tuple[CompactVectorizer, CompactMLPClassifier, Dict]]:
+    """
+    Load compact artifact with memory-mapped weights
+    
+    Weight pages are shared between forked workers instead of each
+    process unpickling its own copy.
+    
+    Args:
+        directory: Artifact directory containing manifest.json
+    
+    Returns:
+        (vectorizer, model, manifest) or None if missing / unsupported
+    """
+    manifest_file = directory / "manifest.json"
+    if not manifest_file.exists():
+        return None
+    
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    if (manifest.get("format") != COMPACT_FORMAT
+            or manifest.get("format_version") != COMPACT_FORMAT_VERSION):
+        print(f"⚠️  Unsupported compact model format: {manifest.get('format')} v{manifest.get('format_version')}")
+        return None
+    
+    # Each export has its own weights directory (older exports: flat layout)
+    weights_dir = directory / manifest.get("weights_dir", "")
+    
+    model_info = manifest["model"]
+    coefs = [
+        np.load(weights_dir / f"coef_{i}.npy", mmap_mode="r")
+        for i in range(model_info["n_layers"])
+    ]
+    intercepts = [
+        np.load(weights_dir / f"intercept_{i}.npy", mmap_mode="r")
+        for i in range(model_info["n_layers"])
+    ]
+    model = CompactMLPClassifier(
+        coefs=coefs,
+        intercepts=intercepts,
+        classes=model_info["classes"],
+        activation=model_info["activation"],
+        out_activation=model_info["out_activation"]
+    )
+    
+    with open(weights_dir / "vocabulary.json", 'r', encoding='utf-8') as f:
+        vocabulary = json.load(f)
+    
+    vec_info = manifest["vectorizer"]
+    vectorizer = CompactVectorizer(
+        vocabulary=vocabulary,
+        token_pattern=vec_info["token_pattern"],
+        ngram_range=tuple(vec_info["ngram_range"]),
+        lowercase=vec_info["lowercase"],
+        binary=vec_info.get("binary", False),
+        idf=np.load(weights_dir / "idf.npy", mmap_mode="r") if vec_info["use_idf"] else None,
+        norm=vec_info.get("norm"),
+        sublinear_tf=vec_info.get("sublinear_tf", False)
+    )
+    
+    return vectorizer, model, manifest
@@ -0,0 +1,155 @@
+"""
+Micro-batching scheduler for concurrent symptom checks
+Collects requests for a short window and scores them in one model pass
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.services.ai_service import SymptomCheckerService, symptom_checker
+from app.services.inference_executor import InferenceExecutor, inference_executor
+
+
+class BatchMetrics:
+    """
+    Running counters for batch size and queue wait time
+    """
+    
+    def __init__(self):
+        """Initialize counters"""
+        self.batches = 0
+        self.requests = 0
+        self.max_batch_size = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+    
+    def record(self, batch_size: int, wait_times_ms: List[float]):
+        """
+        Record one dispatched batch
+        
+        Args:
+            batch_size: Number of requests in the batch
+            wait_times_ms: Queue wait time of each request
+        """
+        self.batches += 1
+        self.requests += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.total_wait_ms += sum(wait_times_ms)
+        self.max_wait_ms = max(self.max_wait_ms, max(wait_times_ms))
+    
+    def snapshot(self) -> Dict:
+        """Get metrics as dict"""
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "avg_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "avg_wait_ms": self.total_wait_ms / self.requests if self.requests else 0.0,
+            "max_wait_ms": self.max_wait_ms
+        }
+
+
+class SymptomBatcher:
+    """
+    Asyncio micro-batcher in front of SymptomCheckerService
+    
+    Requests are queued until the batch window elapses or the batch is
+    full, then scored with a single predict_batch call on the inference
+    executor. Results are fanned back to the waiting coroutines.
+    """
+    
+    def __init__(
+        self,
+        service: SymptomCheckerService,
+        executor: InferenceExecutor,
+        window_ms: float,
+        max_batch_size: int
+    ):
+        """Initialize batcher"""
+        self.service = service
+        self.executor = executor
+        self.window_seconds = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self.metrics = BatchMetrics()
+        self._pending: List[Tuple[List[str], asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def predict(self, symptoms: List[str]) -> Optional[Dict]:
+        """
+        Queue symptoms for the next batch and wait for the prediction
+        
+        Args:
+            symptoms: List of symptom strings
+        
+        Returns:
+            Dict with prediction results or None
+        
+        Raises:
+            InferenceQueueFullError: If the inference executor is saturated
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((symptoms, future, time.perf_counter()))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Dispatch all pending requests as one batch"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        if not self._pending:
+            return
+        
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[List[str], asyncio.Future, float]]):
+        """Score one batch and resolve its futures"""
+        dispatched_at = time.perf_counter()
+        self.metrics.record(
+            len(batch),
+            [(dispatched_at - queued_at) * 1000.0 for _, _, queued_at in batch]
+        )
+        
+        try:
+            results = await self.executor.run(
+                self.service.predict_batch,
+                [symptoms for symptoms, _, _ in batch],
+                top_k=1
+            )
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for i, (_, future, _) in enumerate(batch):
+            # Waiter may have been cancelled (client disconnected)
+            if not future.done():
+                future.set_result(results[i] if results else None)
+
+
+# Singleton instance
+symptom_batcher = SymptomBatcher(
+    service=symptom_checker,
+    executor=inference_executor,
+    window_ms=settings.ai_batch_window_ms,
+    max_batch_size=settings.ai_batch_max_size
+)
+
+
+def get_symptom_batcher() -> SymptomBatcher:
+    """Get symptom batcher instance"""
+    return symptom_batcher
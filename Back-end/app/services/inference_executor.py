@@ -0,0 +1,99 @@
+"""
+Inference executor for CPU-bound AI model work
+Keeps sklearn/joblib predictions off the asyncio event loop
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+
+class InferenceQueueFullError(Exception):
+    """Raised when the inference executor is saturated"""
+
+
+class InferenceExecutor:
+    """
+    Bounded thread pool for model inference
+    
+    Provides:
+    - Dedicated worker threads (I/O requests keep the event loop)
+    - Queue-depth limit with fail-fast backpressure
+    """
+    
+    def __init__(self, max_workers: int, max_queue_size: int):
+        """Initialize executor limits"""
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of submitted tasks (running + queued)"""
+        return self._in_flight
+    
+    @property
+    def queue_depth(self) -> int:
+        """Number of tasks waiting for a free worker"""
+        return max(0, self._in_flight - self.max_workers)
+    
+    def start(self):
+        """Create worker pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="inference"
+            )
+    
+    def shutdown(self):
+        """Stop worker pool (waits for running tasks)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run blocking function on the inference pool
+        
+        Args:
+            func: Blocking callable (e.g. model prediction)
+            *args, **kwargs: Arguments passed to func
+        
+        Returns:
+            Result of func
+        
+        Raises:
+            InferenceQueueFullError: If workers and queue are all busy
+        """
+        # In-flight counter is only touched from the event loop thread
+        if self._in_flight >= self.max_workers + self.max_queue_size:
+            raise InferenceQueueFullError(
+                f"Inference queue full ({self.queue_depth} waiting)"
+            )
+        
+        self.start()
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **kwargs)
+            )
+        finally:
+            self._in_flight -= 1
+
+
+# Singleton instance
+inference_executor = InferenceExecutor(
+    max_workers=settings.ai_inference_workers,
+    max_queue_size=settings.ai_inference_queue_size
+)
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """Get inference executor instance"""
+    return inference_executor
@@ -0,0 +1,319 @@
+"""
+Symptom Checker model registry
+Named model versions, atomic hot-swap on file change, and A/B traffic routing
+"""
+
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import joblib
+
+from app.core.config import settings
+from app.services.compact_model import load_compact_model, CompactMLPClassifier, COMPACT_DIR_NAME
+
+
+PRODUCTION_MODEL_NAME = "production"
+
+
+class ModelMetrics:
+    """
+    Per-model latency and agreement counters
+    """
+    
+    def __init__(self):
+        """Initialize counters"""
+        self.calls = 0
+        self.rows = 0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self.compared = 0
+        self.agreed = 0
+    
+    def record_call(self, rows: int, latency_ms: float):
+        """Record one scoring call"""
+        self.calls += 1
+        self.rows += rows
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+    
+    def record_agreement(self, agreed: int, compared: int):
+        """Record how many predictions matched the active model"""
+        self.agreed += agreed
+        self.compared += compared
+    
+    def snapshot(self) -> Dict:
+        """Get metrics as dict"""
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "avg_latency_ms": self.total_latency_ms / self.calls if self.calls else 0.0,
+            "avg_latency_per_row_ms": self.total_latency_ms / self.rows if self.rows else 0.0,
+            "max_latency_ms": self.max_latency_ms,
+            "compared": self.compared,
+            "agreement_rate": self.agreed / self.compared if self.compared else None
+        }
+
+
+class ModelVersion:
+    """
+    One loaded model together with the vectorizer it was trained with
+    
+    Swapped as a single reference so a prediction never mixes a new
+    model with an old vectorizer.
+    """
+    
+    def __init__(self, name: str, model, vectorizer, sources: List[Path]):
+        """Initialize version"""
+        self.name = name
+        self.model = model
+        self.vectorizer = vectorizer
+        self.sources = sources
+        self.source_stats = _file_stats(sources)
+        # Changes whenever any source is replaced, even twice within a second
+        digest = hashlib.sha256(repr(sorted(self.source_stats.items())).encode("utf-8")).hexdigest()[:16]
+        self.fingerprint = f"{name}:{digest}"
+        self.loaded_at = datetime.utcnow()
+        self.metrics = ModelMetrics()
+    
+    def is_stale(self) -> bool:
+        """Check if any source file changed since load"""
+        return _file_stats(self.sources) != self.source_stats
+    
+    def info(self) -> Dict:
+        """Get version description with metrics"""
+        return {
+            "name": self.name,
+            "model_type": type(self.model).__name__,
+            "fingerprint": self.fingerprint,
+            "loaded_at": self.loaded_at.isoformat(),
+            "metrics": self.metrics.snapshot()
+        }
+
+
+def _file_stats(paths: List[Path]) -> Dict[str, Tuple[int, int, int]]:
+    """Get (inode, mtime in ns, size) of existing files"""
+    stats = {}
+    for p in paths:
+        if p.exists():
+            stat = p.stat()
+            stats[str(p)] = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def _wrap_model(model):
+    """Run MLP networks on the NumPy kernel (no sklearn predict overhead)"""
+    if settings.symptom_checker_use_compact and hasattr(model, 'coefs_'):
+        return CompactMLPClassifier.from_sklearn(model)
+    return model
+
+
+class ModelRegistry:
+    """
+    Registry of Symptom Checker model versions
+    
+    Provides:
+    - Production model (compact artifact or best_model.pkl)
+    - Named archive models (Output/Models_Archive/<name>.pkl)
+    - Hot-swap when model files change (no worker restart)
+    - Candidate model receiving a percentage of traffic
+    """
+    
+    def __init__(
+        self,
+        model_path: Path,
+        archive_path: Path,
+        candidate_name: str = "",
+        candidate_percent: float = 0.0
+    ):
+        """Initialize registry paths and routing"""
+        self.model_path = model_path
+        self.archive_path = archive_path
+        self.candidate_name = candidate_name
+        self.candidate_percent = candidate_percent
+        self.active: Optional[ModelVersion] = None
+        self.candidate: Optional[ModelVersion] = None
+        self._lock = threading.Lock()
+        self._rng = random.Random()
+    
+    def available_models(self) -> List[str]:
+        """List archive model names"""
+        if not self.archive_path.exists():
+            return []
+        return sorted(p.stem for p in self.archive_path.glob("*.pkl"))
+    
+    def _load_production(self) -> Optional[ModelVersion]:
+        """Load production model and vectorizer"""
+        compact_dir = self.model_path / COMPACT_DIR_NAME
+        # Metadata changes also trigger a production reload
+        metadata_file = self.model_path / "model_metadata.json"
+        
+        if settings.symptom_checker_use_compact:
+            compact = load_compact_model(compact_dir)
+            if compact:
+                vectorizer, model, _ = compact
+                print("✅ Symptom Checker compact model loaded (mmap)")
+                return ModelVersion(
+                    PRODUCTION_MODEL_NAME,
+                    model,
+                    vectorizer,
+                    # Exports publish by replacing the manifest last
+                    [compact_dir / "manifest.json", metadata_file]
+                )
+        
+        model_file = self.model_path / "best_model.pkl"
+        if not model_file.exists():
+            print(f"⚠️  Symptom Checker model not found at: {model_file}")
+            return None
+        
+        model = _wrap_model(joblib.load(model_file))
+        print(f"✅ Symptom Checker model loaded ({type(model).__name__})")
+        
+        vectorizer = None
+        vectorizer_file = self.model_path / "vectorizer.pkl"
+        if vectorizer_file.exists():
+            vectorizer = joblib.load(vectorizer_file)
+            print("✅ Vectorizer loaded")
+        
+        return ModelVersion(
+            PRODUCTION_MODEL_NAME,
+            model,
+            vectorizer,
+            [model_file, vectorizer_file, metadata_file]
+        )
+    
+    def load_named(self, name: str) -> Optional[ModelVersion]:
+        """
+        Load archive model by name
+        
+        Archive models share the production vectorizer.
+        
+        Args:
+            name: Archive model name (e.g. "Deep_Neural_Network")
+        
+        Returns:
+            Loaded version or None
+        """
+        model_file = self.archive_path / f"{name}.pkl"
+        if not self.active or not model_file.exists():
+            print(f"⚠️  Archive model not available: {model_file}")
+            return None
+        
+        model = _wrap_model(joblib.load(model_file))
+        print(f"✅ Archive model loaded: {name} ({type(model).__name__})")
+        return ModelVersion(name, model, self.active.vectorizer, [model_file])
+    
+    def load(self) -> bool:
+        """
+        Load production and candidate models
+        
+        Returns:
+            True if production model is loaded
+        """
+        with self._lock:
+            production = self._load_production()
+            if not production:
+                return False
+            self.active = production
+            
+            if self.candidate_name:
+                self.candidate = self.load_named(self.candidate_name)
+            return True
+    
+    def refresh(self) -> List[str]:
+        """
+        Reload versions whose files changed and swap them in atomically
+        
+        Returns:
+            Names of swapped versions
+        """
+        swapped = []
+        with self._lock:
+            if self.active and self.active.is_stale():
+                production = self._load_production()
+                if production:
+                    self.active = production
+                    swapped.append(production.name)
+            
+            if self.candidate_name and (
+                self.candidate is None
+                or self.candidate.is_stale()
+                or PRODUCTION_MODEL_NAME in swapped
+            ):
+                candidate = self.load_named(self.candidate_name)
+                if candidate:
+                    self.candidate = candidate
+                    swapped.append(candidate.name)
+        
+        for name in swapped:
+            print(f"🔄 Hot-swapped model: {name}")
+        return swapped
+    
+    def route(self, n_rows: int) -> List[bool]:
+        """
+        Pick rows to serve with the candidate model
+        
+        Args:
+            n_rows: Number of requests in the batch
+        
+        Returns:
+            Per-row flags (True = candidate)
+        """
+        if not self.candidate or self.candidate_percent <= 0:
+            return [False] * n_rows
+        return [self._rng.random() * 100.0 < self.candidate_percent for _ in range(n_rows)]
+    
+    def score(self, version: ModelVersion, symptom_texts: List[str]):
+        """
+        Vectorize and score texts with one model version
+        
+        Args:
+            version: Model version snapshot
+            symptom_texts: Joined symptom strings
+        
+        Returns:
+            (probabilities or None, labels or None)
+        """
+        start = time.perf_counter()
+        
+        if version.vectorizer:
+            matrix = version.vectorizer.transform(symptom_texts)
+        else:
+            # Fallback if no vectorizer
+            matrix = symptom_texts
+        
+        if hasattr(version.model, 'predict_proba'):
+            result = (version.model.predict_proba(matrix), None)
+        else:
+            # Models without probabilities only give us the label
+            result = (None, version.model.predict(matrix))
+        
+        version.metrics.record_call(len(symptom_texts), (time.perf_counter() - start) * 1000.0)
+        return result
+    
+    def info(self) -> Dict:
+        """Get registry state with per-model metrics"""
+        return {
+            "active": self.active.info() if self.active else None,
+            "candidate": self.candidate.info() if self.candidate else None,
+            "candidate_traffic_percent": self.candidate_percent,
+            "available": self.available_models()
+        }
+
+
+# Singleton instance
+model_registry = ModelRegistry(
+    model_path=Path(settings.symptom_checker_model_path),
+    archive_path=Path(settings.symptom_checker_archive_path),
+    candidate_name=settings.ai_candidate_model,
+    candidate_percent=settings.ai_candidate_traffic_percent
+)
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get model registry instance"""
+    return model_registry
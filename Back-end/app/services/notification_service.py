@@ -70,7 +70,8 @@ class NotificationService:
         patient_id: str,
         systolic: int,
         diastolic: int,
-        risk_level: str
+        risk_level: str,
+        alert_count: int = 1
     ):
         """
         Send emergency BP alert to all linked caregivers
@@ -81,6 +82,7 @@ class NotificationService:
             systolic: Systolic BP
             diastolic: Diastolic BP
             risk_level: Risk level (normal/low/moderate/high/critical)
+            alert_count: High-risk readings summarized by this alert (bulk uploads)
         """
         # Get patient info
         patient_result = await db.execute(select(User).where(User.id == patient_id))
@@ -99,6 +101,10 @@ class NotificationService:
         
         caregivers = caregivers_result.scalars().all()
         
+        message = f"Blood pressure: {systolic}/{diastolic} mmHg - Risk: {risk_level.upper()}"
+        if alert_count > 1:
+            message += f" ({alert_count} high-risk readings in latest upload)"
+        
         # Create notification for each caregiver
         for caregiver in caregivers:
             await self.create_notification(
@@ -106,13 +112,14 @@ class NotificationService:
                 user_id=str(caregiver.id),
                 notification_type=NotificationType.EMERGENCY_BP_ALERT,
                 title=f"⚠️ Emergency BP Alert: {patient.full_name}",
-                message=f"Blood pressure: {systolic}/{diastolic} mmHg - Risk: {risk_level.upper()}",
+                message=message,
                 data={
                     "patient_id": str(patient_id),
                     "patient_name": patient.full_name,
                     "systolic": systolic,
                     "diastolic": diastolic,
                     "risk_level": risk_level,
+                    "alert_count": alert_count,
                     "actions": ["call_patient", "video_call_patient", "view_details"]
                 }
             )
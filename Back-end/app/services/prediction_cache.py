@@ -0,0 +1,139 @@
+"""
+Symptom prediction cache
+Tiered (in-process + Redis) cache keyed by model version + canonical symptom set
+"""
+
+import hashlib
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.model_registry import ModelRegistry, model_registry
+from app.services.redis_cache import redis_cache
+from app.services.tiered_cache import TieredCache
+
+
+class PredictionCache:
+    """
+    Two-tier cache for single symptom checks
+    
+    Keys combine the active model fingerprint with a digest of the
+    canonical symptom set, so a hot-swap changes every key: the local
+    tier is cleared when the fingerprint changes and old Redis entries
+    are simply never read again (they expire by TTL).
+    
+    Predictions are computed on the symptoms as submitted. The key only
+    normalizes what can't change the output, so it always maps to exactly
+    one model output. Concurrent checks of the same symptom set share one
+    model call.
+    """
+    
+    def __init__(self, registry: ModelRegistry, cache: TieredCache, ttl_seconds: int):
+        """Initialize cache"""
+        self.registry = registry
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.invalidations = 0
+        self._fingerprint: Optional[str] = None
+    
+    @staticmethod
+    def canonical(symptoms: List[str], vectorizer=None) -> List[str]:
+        """
+        Normalize symptom list for the cache key: trimmed, lowercase, sorted
+        
+        Duplicates and blank entries are kept: they change term counts and
+        symptoms_matched. Case and order are only dropped for a lowercasing
+        unigram vectorizer, which ignores them; otherwise the list is kept
+        as submitted.
+        
+        Args:
+            symptoms: Symptom strings as submitted
+            vectorizer: Vectorizer of the model that will score them
+        
+        Returns:
+            Canonical symptom list
+        """
+        if (vectorizer is None
+                or tuple(getattr(vectorizer, "ngram_range", (1, 1))) != (1, 1)
+                or not getattr(vectorizer, "lowercase", False)):
+            return list(symptoms)
+        return sorted(s.strip().lower() for s in symptoms)
+    
+    @staticmethod
+    def symptoms_key(fingerprint: str, symptoms: List[str]) -> str:
+        """Build cache key from model fingerprint and canonical symptoms"""
+        digest = hashlib.sha256("\n".join(symptoms).encode("utf-8")).hexdigest()[:32]
+        return f"ai:prediction:{fingerprint}:{digest}"
+    
+    def _active_fingerprint(self) -> Optional[str]:
+        """
+        Fingerprint of the model serving cacheable traffic
+        
+        Returns None (bypass) when no model is loaded or a candidate is
+        receiving A/B traffic, since routed rows must reach the model.
+        """
+        active = self.registry.active
+        if not active or self.cache.max_entries <= 0:
+            return None
+        if self.registry.candidate and self.registry.candidate_percent > 0:
+            return None
+        
+        if active.fingerprint != self._fingerprint:
+            # Hot-swap: entries of the previous version can never be served
+            if self._fingerprint is not None:
+                self.invalidations += 1
+            self.cache.clear_local()
+            self._fingerprint = active.fingerprint
+        return active.fingerprint
+    
+    async def predict(
+        self,
+        symptoms: List[str],
+        compute: Callable[[List[str]], Awaitable[Optional[Dict]]]
+    ) -> Optional[Dict]:
+        """
+        Get prediction from cache, computing and storing it on a miss
+        
+        Args:
+            symptoms: Symptom strings as submitted
+            compute: Async prediction function (e.g. SymptomBatcher.predict)
+        
+        Returns:
+            Dict with prediction results or None
+        """
+        fingerprint = self._active_fingerprint()
+        if fingerprint is None:
+            return await compute(symptoms)
+        
+        canonical = self.canonical(symptoms, self.registry.active.vectorizer)
+        return await self.cache.get_or_compute(
+            self.symptoms_key(fingerprint, canonical),
+            lambda: compute(symptoms),
+            self.ttl_seconds
+        )
+    
+    def info(self) -> Dict:
+        """Get cache state with hit / miss counters"""
+        return {
+            "enabled": self.cache.max_entries > 0,
+            "model_fingerprint": self._fingerprint,
+            "invalidations": self.invalidations,
+            **self.cache.info()
+        }
+
+
+# Singleton instance
+prediction_cache = PredictionCache(
+    registry=model_registry,
+    cache=TieredCache(
+        cache=redis_cache,
+        max_entries=settings.ai_prediction_cache_size,
+        local_ttl_seconds=settings.ai_prediction_cache_ttl_seconds,
+        early_refresh_beta=0.0  # A key's prediction never changes, only its model version
+    ),
+    ttl_seconds=settings.ai_prediction_cache_ttl_seconds
+)
+
+
+def get_prediction_cache() -> PredictionCache:
+    """Get prediction cache instance"""
+    return prediction_cache
@@ -3,9 +3,22 @@ Redis cache service for performance optimization
 """
 
 import redis.asyncio as redis
-from typing import Optional, Any
-import json
+from typing import Optional, Any, Dict, List
 from app.core.config import settings
+from app.core.serialization import cache_serializer
+
+
+# Resolve a user's generation and access the versioned key in one round trip
+# KEYS[1] = generation key; ARGV = key prefix, key suffix[, ttl, value]
+VERSIONED_GET_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+return redis.call('GET', ARGV[1] .. generation .. ARGV[2])
+"""
+
+VERSIONED_SET_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+return redis.call('SETEX', ARGV[1] .. generation .. ARGV[2], ARGV[3], ARGV[4])
+"""
 
 
 class RedisCache:
@@ -14,6 +27,7 @@ class RedisCache:
     
     Provides:
     - BP reading cache (reduce DB queries)
+    - Per-user versioned namespaces (one INCR invalidates a user)
     - User session cache
     - API response cache
     - Real-time data cache
@@ -22,18 +36,23 @@ class RedisCache:
     def __init__(self):
         """Initialize Redis connection"""
         self.redis_client: Optional[redis.Redis] = None
+        self.serializer = cache_serializer
+        self._versioned_get = None
+        self._versioned_set = None
     
     async def connect(self):
         """Connect to Redis"""
         try:
             self.redis_client = await redis.from_url(
                 settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True
+                # Raw bytes: payloads may be binary (msgpack)
+                decode_responses=False
             )
             # Test connection
             await self.redis_client.ping()
-            print("✅ Redis connected successfully")
+            self._versioned_get = self.redis_client.register_script(VERSIONED_GET_SCRIPT)
+            self._versioned_set = self.redis_client.register_script(VERSIONED_SET_SCRIPT)
+            print(f"✅ Redis connected successfully (payloads: {self.serializer.name})")
         except Exception as e:
             print(f"⚠️  Redis connection failed: {e}")
             self.redis_client = None
@@ -43,7 +62,23 @@ class RedisCache:
         if self.redis_client:
             await self.redis_client.close()
     
-    async def get(self, key: str) -> Optional[str]:
+    async def ping(self) -> bool:
+        """
+        Check Redis connection is alive
+        
+        Returns:
+            True if Redis answered PING
+        """
+        if not self.redis_client:
+            return False
+        
+        try:
+            return bool(await self.redis_client.ping())
+        except Exception as e:
+            print(f"Redis PING error: {e}")
+            return False
+    
+    async def get(self, key: str) -> Optional[bytes]:
         """
         Get value from cache
         
@@ -51,7 +86,7 @@ class RedisCache:
             key: Cache key
         
         Returns:
-            Cached value or None
+            Raw cached value or None
         """
         if not self.redis_client:
             return None
@@ -66,15 +101,17 @@ class RedisCache:
         self,
         key: str,
         value: Any,
-        expire_seconds: int = 300
+        expire_seconds: int = 300,
+        only_if_absent: bool = False
     ) -> bool:
         """
         Set value in cache with expiration
         
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (serialized unless str/bytes)
             expire_seconds: Expiration time in seconds (default 5 minutes)
+            only_if_absent: Keep an existing value (SET NX)
         
         Returns:
             True if successful
@@ -83,11 +120,11 @@ class RedisCache:
             return False
         
         try:
-            # Serialize value if not string
-            if not isinstance(value, str):
-                value = json.dumps(value)
+            # Serialize value if not already raw
+            if not isinstance(value, (str, bytes)):
+                value = self.serializer.dumps(value)
             
-            await self.redis_client.setex(key, expire_seconds, value)
+            await self.redis_client.set(key, value, ex=expire_seconds, nx=only_if_absent)
             return True
         except Exception as e:
             print(f"Redis SET error: {e}")
@@ -113,23 +150,251 @@ class RedisCache:
             print(f"Redis DELETE error: {e}")
             return False
     
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get many values in one round trip (MGET)
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Values in key order (None for misses)
+        """
+        if not self.redis_client or not keys:
+            return [None] * len(keys)
+        
+        try:
+            return await self.redis_client.mget(keys)
+        except Exception as e:
+            print(f"Redis MGET error: {e}")
+            return [None] * len(keys)
+    
+    async def set_many(
+        self,
+        values: Dict[str, Any],
+        expire_seconds: int = 300,
+        only_if_absent: bool = False
+    ) -> bool:
+        """
+        Set many values with expiration in one pipelined round trip
+        
+        Args:
+            values: Key -> value (serialized unless str/bytes)
+            expire_seconds: Expiration time in seconds (default 5 minutes)
+            only_if_absent: Keep existing values (SET NX)
+        
+        Returns:
+            True if successful
+        """
+        if not self.redis_client or not values:
+            return False
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    if not isinstance(value, (str, bytes)):
+                        value = self.serializer.dumps(value)
+                    pipe.set(key, value, ex=expire_seconds, nx=only_if_absent)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            print(f"Redis SET pipeline error: {e}")
+            return False
+    
+    def decode(self, value: Optional[bytes]) -> Optional[Any]:
+        """
+        Deserialize raw cached value
+        
+        Args:
+            value: Raw value from Redis
+        
+        Returns:
+            Deserialized value or None (missing or written in another format)
+        """
+        if not value:
+            return None
+        try:
+            return self.serializer.loads(value)
+        except Exception:
+            return None
+    
     async def get_json(self, key: str) -> Optional[dict]:
         """
-        Get JSON value from cache
+        Get deserialized value from cache
         
         Args:
             key: Cache key
         
         Returns:
-            Deserialized JSON or None
+            Deserialized value or None
+        """
+        return self.decode(await self.get(key))
+    
+    # ==========================================
+    # Per-user namespaces
+    # ==========================================
+    # Every user-scoped key embeds the user's generation counter:
+    #   user:<user_id>:g<generation>:<name>
+    # Bumping the counter (one INCR) orphans all of the user's keys at once;
+    # orphaned entries are never read again and expire by TTL.
+    
+    @staticmethod
+    def generation_key(user_id: str) -> str:
+        """Key of user's generation counter (no TTL)"""
+        return f"user:{user_id}:generation"
+    
+    async def get_generation(self, user_id: str) -> int:
+        """
+        Get user's current cache generation
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Generation (0 if never invalidated or Redis unavailable)
         """
-        value = await self.get(key)
-        if value:
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return None
-        return None
+        value = await self.get(self.generation_key(user_id))
+        return int(value) if value else 0
+    
+    async def user_key(self, user_id: str, name: str) -> str:
+        """
+        Build versioned key for a user-scoped value
+        
+        Args:
+            user_id: User ID
+            name: Value name (e.g. "bp:stats:7")
+        
+        Returns:
+            Key under the user's current generation
+        """
+        return f"user:{user_id}:g{await self.get_generation(user_id)}:{name}"
+    
+    async def user_keys(self, user_ids: List[str], name: str) -> List[str]:
+        """
+        Build versioned keys of one value for many users (one MGET)
+        
+        Args:
+            user_ids: User IDs
+            name: Value name
+        
+        Returns:
+            Keys in user order, under each user's current generation
+        """
+        generations = await self.get_many([self.generation_key(u) for u in user_ids])
+        return [
+            f"user:{user_id}:g{int(generation or 0)}:{name}"
+            for user_id, generation in zip(user_ids, generations)
+        ]
+    
+    async def get_user_value(self, user_id: str, name: str) -> Optional[bytes]:
+        """
+        Get user-scoped value (generation lookup + GET in one round trip)
+        
+        Args:
+            user_id: User ID
+            name: Value name
+        
+        Returns:
+            Cached value or None
+        """
+        if not self.redis_client:
+            return None
+        
+        try:
+            return await self._versioned_get(
+                keys=[self.generation_key(user_id)],
+                args=[f"user:{user_id}:g", f":{name}"]
+            )
+        except Exception as e:
+            print(f"Redis GET error: {e}")
+            return None
+    
+    async def set_user_value(
+        self,
+        user_id: str,
+        name: str,
+        value: Any,
+        expire_seconds: int = 300
+    ) -> bool:
+        """
+        Set user-scoped value under the current generation (one round trip)
+        
+        Args:
+            user_id: User ID
+            name: Value name
+            value: Value to cache (serialized unless str/bytes)
+            expire_seconds: Expiration time in seconds (default 5 minutes)
+        
+        Returns:
+            True if successful
+        """
+        if not self.redis_client:
+            return False
+        
+        try:
+            if not isinstance(value, (str, bytes)):
+                value = self.serializer.dumps(value)
+            
+            await self._versioned_set(
+                keys=[self.generation_key(user_id)],
+                args=[f"user:{user_id}:g", f":{name}", expire_seconds, value]
+            )
+            return True
+        except Exception as e:
+            print(f"Redis SET error: {e}")
+            return False
+    
+    async def get_user_values(self, user_ids: List[str], name: str) -> List[Optional[bytes]]:
+        """
+        Get one user-scoped value for many users (two MGETs, any number of users)
+        
+        Args:
+            user_ids: User IDs
+            name: Value name
+        
+        Returns:
+            Values in user order (None for misses)
+        """
+        if not self.redis_client or not user_ids:
+            return [None] * len(user_ids)
+        
+        return await self.get_many(await self.user_keys(user_ids, name))
+    
+    async def set_user_values(
+        self,
+        values: Dict[str, Any],
+        name: str,
+        expire_seconds: int = 300
+    ) -> bool:
+        """
+        Set one user-scoped value for many users in one pipelined round trip
+        
+        Args:
+            values: User ID -> value (serialized unless str/bytes)
+            name: Value name
+            expire_seconds: Expiration time in seconds (default 5 minutes)
+        
+        Returns:
+            True if successful
+        """
+        if not self.redis_client or not values:
+            return False
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for user_id, value in values.items():
+                    if not isinstance(value, (str, bytes)):
+                        value = self.serializer.dumps(value)
+                    await self._versioned_set(
+                        keys=[self.generation_key(user_id)],
+                        args=[f"user:{user_id}:g", f":{name}", expire_seconds, value],
+                        client=pipe
+                    )
+                await pipe.execute()
+            return True
+        except Exception as e:
+            print(f"Redis SET pipeline error: {e}")
+            return False
     
     async def cache_bp_reading(self, user_id: str, bp_data: dict):
         """
@@ -139,8 +404,7 @@ class RedisCache:
             user_id: User ID
             bp_data: BP reading data
         """
-        key = f"bp:latest:{user_id}"
-        await self.set(key, bp_data, expire_seconds=600)  # 10 minutes
+        await self.set_user_value(user_id, "bp:latest", bp_data, expire_seconds=600)  # 10 minutes
     
     async def get_cached_bp_reading(self, user_id: str) -> Optional[dict]:
         """
@@ -152,29 +416,92 @@ class RedisCache:
         Returns:
             Cached BP data or None
         """
-        key = f"bp:latest:{user_id}"
-        return await self.get_json(key)
+        return self.decode(await self.get_user_value(user_id, "bp:latest"))
+    
+    # Filling the cache after a miss: take the key before querying Postgres.
+    # A reading that invalidates the user in the meantime bumps the
+    # generation, so the stale fill lands in the orphaned namespace, and NX
+    # keeps it from overwriting a write-through under the same generation.
+    
+    async def bp_reading_keys(self, user_ids: List[str]) -> List[str]:
+        """
+        Get latest-reading keys of users under their current generations
+        
+        Args:
+            user_ids: User IDs
+        
+        Returns:
+            Keys in user order
+        """
+        return await self.user_keys(user_ids, "bp:latest")
+    
+    async def get_cached_bp_readings(self, keys: Dict[str, str]) -> Dict[str, dict]:
+        """
+        Get cached BP readings of many users (one MGET)
+        
+        Args:
+            keys: User ID -> key from bp_reading_keys
+        
+        Returns:
+            User ID -> cached BP data (misses omitted)
+        """
+        readings = {}
+        for user_id, value in zip(keys, await self.get_many(list(keys.values()))):
+            reading = self.decode(value)
+            if reading is not None:
+                readings[user_id] = reading
+        return readings
+    
+    async def fill_bp_readings(self, readings: Dict[str, dict]):
+        """
+        Cache BP readings fetched after a miss (one round trip)
+        
+        Args:
+            readings: Key from bp_reading_keys -> BP reading data
+        """
+        await self.set_many(readings, expire_seconds=600, only_if_absent=True)  # 10 minutes
     
-    async def invalidate_user_cache(self, user_id: str):
+    async def invalidate_user_cache(self, user_id: str) -> int:
         """
-        Invalidate all caches for user
+        Invalidate all caches for user (single INCR)
         
         Args:
             user_id: User ID
+        
+        Returns:
+            New generation (0 if Redis unavailable)
         """
         if not self.redis_client:
-            return
-        
-        # Delete all user-related keys
-        patterns = [
-            f"bp:latest:{user_id}",
-            f"bp:stats:{user_id}",
-            f"meds:{user_id}",
-            f"user:{user_id}"
-        ]
+            return 0
+        
+        try:
+            return await self.redis_client.incr(self.generation_key(user_id))
+        except Exception as e:
+            print(f"Redis INCR error: {e}")
+            return 0
+    
+    async def invalidate_users_cache(self, user_ids: List[str]) -> bool:
+        """
+        Invalidate caches of many users in one pipelined round trip
         
-        for pattern in patterns:
-            await self.delete(pattern)
+        Args:
+            user_ids: User IDs (e.g. all patients on a caregiver dashboard)
+        
+        Returns:
+            True if successful
+        """
+        if not self.redis_client or not user_ids:
+            return False
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for user_id in user_ids:
+                    pipe.incr(self.generation_key(user_id))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            print(f"Redis INCR pipeline error: {e}")
+            return False
 
 
 # Singleton instance
@@ -0,0 +1,115 @@
+"""
+Vectorized blood pressure risk classification
+Threshold-table driven, with optional per-patient overrides
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.models.vital_sign import RiskLevel
+
+
+# (systolic, diastolic) bound per level, in mmHg
+Thresholds = Dict[RiskLevel, Tuple[int, int]]
+
+# Guideline defaults (see VitalSign.calculate_risk_level)
+DEFAULT_THRESHOLDS: Thresholds = {
+    RiskLevel.LOW: (90, 60),  # below either
+    RiskLevel.CRITICAL: (180, 120),  # at or above either
+    RiskLevel.HIGH: (140, 90),
+    RiskLevel.MODERATE: (120, 80),
+}
+
+# Checked in order, first match wins; no match is NORMAL
+RULE_ORDER = [RiskLevel.LOW, RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MODERATE]
+
+
+def resolve_thresholds(overrides: Optional[Dict] = None) -> Thresholds:
+    """
+    Merge a patient's custom thresholds over the defaults
+    
+    Args:
+        overrides: e.g. {"high": [150, 95]} as stored in User.bp_thresholds
+    
+    Returns:
+        Complete threshold table
+    """
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for level, bounds in (overrides or {}).items():
+        thresholds[RiskLevel(level)] = (int(bounds[0]), int(bounds[1]))
+    return thresholds
+
+
+def stack_thresholds(tables: Sequence[Thresholds]) -> Dict[RiskLevel, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Turn one threshold table per reading into per-level bound arrays
+    
+    Lets classify_bp score readings of many patients, each with their
+    own thresholds, in the same np.select call.
+    
+    Args:
+        tables: Threshold table of each reading's patient
+    
+    Returns:
+        Level -> (systolic bounds, diastolic bounds), aligned with readings
+    """
+    return {
+        level: (
+            np.array([table[level][0] for table in tables]),
+            np.array([table[level][1] for table in tables])
+        )
+        for level in RULE_ORDER
+    }
+
+
+def classify_bp(
+    systolic: Sequence[int],
+    diastolic: Sequence[int],
+    thresholds: Optional[Dict[RiskLevel, Tuple[Union[int, np.ndarray], Union[int, np.ndarray]]]] = None
+) -> List[RiskLevel]:
+    """
+    Risk level of each reading in a batch
+    
+    Args:
+        systolic: Systolic BP per reading (mmHg)
+        diastolic: Diastolic BP per reading (mmHg)
+        thresholds: One table for all readings, or per-reading bound
+            arrays from stack_thresholds (default: DEFAULT_THRESHOLDS)
+    
+    Returns:
+        Risk level per reading
+    """
+    thresholds = thresholds or DEFAULT_THRESHOLDS
+    systolic = np.asarray(systolic)
+    diastolic = np.asarray(diastolic)
+    
+    conditions = []
+    for level in RULE_ORDER:
+        systolic_bound, diastolic_bound = thresholds[level]
+        if level == RiskLevel.LOW:
+            conditions.append((systolic < systolic_bound) | (diastolic < diastolic_bound))
+        else:
+            conditions.append((systolic >= systolic_bound) | (diastolic >= diastolic_bound))
+    
+    levels = np.select(
+        conditions,
+        [level.value for level in RULE_ORDER],
+        default=RiskLevel.NORMAL.value
+    )
+    return [RiskLevel(level) for level in levels.tolist()]
+
+
+def classify_reading(systolic: int, diastolic: int, thresholds: Optional[Thresholds] = None) -> RiskLevel:
+    """
+    Risk level of a single reading
+    
+    Args:
+        systolic: Systolic BP (mmHg)
+        diastolic: Diastolic BP (mmHg)
+        thresholds: Threshold table (default: DEFAULT_THRESHOLDS)
+    
+    Returns:
+        Risk level
+    """
+    return classify_bp([systolic], [diastolic], thresholds)[0]
@@ -0,0 +1,132 @@
+"""
+Compiled symptom extractor for free-text chat messages
+Token trie with longest-match-wins semantics, built once per model load
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# Word tokens; underscores split so "high_fever" == "high fever"
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# Trie node key marking the end of a symptom phrase (never a valid token)
+_TERMINAL = ""
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens (Latin and Arabic)
+    
+    Args:
+        text: Raw text
+    
+    Returns:
+        List of tokens
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SymptomMatcher:
+    """
+    Multi-pattern symptom matcher over word tokens
+    
+    Each known symptom is registered under its internal name, its
+    space-separated variant and its Arabic translation. Matching is a
+    single left-to-right pass; at each position the longest phrase wins
+    and its tokens are consumed, so "high fever" never also yields "fever".
+    """
+    
+    def __init__(self):
+        """Initialize empty trie"""
+        self._root: Dict = {}
+        self.pattern_count = 0
+    
+    def add(self, phrase: str, symptom: str):
+        """
+        Register phrase as a way of mentioning symptom
+        
+        Args:
+            phrase: Text variant (English or Arabic)
+            symptom: Canonical symptom name returned on match
+        """
+        tokens = tokenize(phrase)
+        if not tokens:
+            return
+        
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        
+        # First registration wins if two symptoms share a phrase
+        if _TERMINAL not in node:
+            node[_TERMINAL] = symptom
+            self.pattern_count += 1
+    
+    @classmethod
+    def from_metadata(cls, metadata: Optional[Dict]) -> "SymptomMatcher":
+        """
+        Build matcher from model metadata
+        
+        Args:
+            metadata: Model metadata ("symptoms" and optional "symptom_translations")
+        
+        Returns:
+            Compiled matcher
+        """
+        matcher = cls()
+        if not metadata:
+            return matcher
+        
+        # Translations are keyed by display name ("Shortness of Breath")
+        translations = {
+            " ".join(tokenize(name)): arabic
+            for name, arabic in metadata.get("symptom_translations", {}).items()
+        }
+        
+        for symptom in metadata.get("symptoms", []):
+            matcher.add(symptom, symptom)
+            arabic = translations.get(" ".join(tokenize(symptom)))
+            if arabic:
+                matcher.add(arabic, symptom)
+        
+        return matcher
+    
+    def find(self, text: str) -> List[str]:
+        """
+        Extract symptoms mentioned in text
+        
+        Args:
+            text: Free-text message
+        
+        Returns:
+            Canonical symptom names in order of first mention (no duplicates)
+        """
+        tokens = tokenize(text)
+        found = []
+        seen = set()
+        
+        i = 0
+        while i < len(tokens):
+            node = self._root
+            match = None
+            match_end = i
+            j = i
+            
+            # Walk the trie as far as the tokens allow, remembering the longest match
+            while j < len(tokens) and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if _TERMINAL in node:
+                    match = node[_TERMINAL]
+                    match_end = j
+            
+            if match is None:
+                i += 1
+                continue
+            
+            if match not in seen:
+                seen.add(match)
+                found.append(match)
+            i = match_end
+        
+        return found
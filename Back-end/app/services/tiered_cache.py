@@ -0,0 +1,340 @@
+"""
+Two-tier cache: bounded in-process LRU/TTL in front of Redis
+Single-flight request coalescing and probabilistic early refresh
+"""
+
+import asyncio
+import functools
+import inspect
+import math
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.redis_cache import RedisCache, redis_cache
+
+
+class CacheMetrics:
+    """
+    Hit / miss counters per cache tier
+    """
+    
+    def __init__(self):
+        """Initialize counters"""
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.early_refreshes = 0
+        self.evictions = 0
+    
+    def snapshot(self) -> Dict:
+        """Get metrics as dict"""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "lookups": lookups,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.local_hits + self.redis_hits) / lookups if lookups else 0.0,
+            "coalesced": self.coalesced,
+            "early_refreshes": self.early_refreshes,
+            "evictions": self.evictions
+        }
+
+
+# (value, expires_at epoch seconds, compute time in seconds)
+CacheEntry = Tuple[Any, float, float]
+
+
+class TieredCache:
+    """
+    Two-tier cache for JSON-serializable values
+    
+    Provides:
+    - Bounded in-process LRU with per-entry TTL (no network round trip)
+    - Redis as the tier shared between workers
+    - Single-flight: concurrent misses for a key run compute once
+    - Probabilistic early refresh (XFetch) so hot keys are recomputed
+      shortly before they expire instead of all at once after
+    
+    Local entries live at most local_ttl_seconds, which bounds how long
+    another worker can serve a value after it was invalidated.
+    """
+    
+    def __init__(
+        self,
+        cache: RedisCache,
+        max_entries: int,
+        local_ttl_seconds: float,
+        early_refresh_beta: float = 1.0
+    ):
+        """Initialize cache tiers"""
+        self.cache = cache
+        self.max_entries = max_entries
+        self.local_ttl_seconds = local_ttl_seconds
+        self.early_refresh_beta = early_refresh_beta
+        self.metrics = CacheMetrics()
+        self._entries: "OrderedDict[str, Tuple[CacheEntry, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._rng = random.Random()
+    
+    def _get_local(self, key: str) -> Optional[CacheEntry]:
+        """Get unexpired local entry, marking it recently used"""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        entry, local_expires_at = item
+        if min(entry[1], local_expires_at) <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def _set_local(self, key: str, entry: CacheEntry):
+        """Store local entry, evicting least recently used ones"""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (entry, time.time() + self.local_ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.metrics.evictions += 1
+    
+    async def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Look up entry in local tier, then Redis"""
+        entry = self._get_local(key)
+        if entry is not None:
+            self.metrics.local_hits += 1
+            return entry
+        
+        envelope = await self.cache.get_json(key)
+        if envelope and envelope.get("expires_at", 0) > time.time():
+            entry = (envelope["value"], envelope["expires_at"], envelope.get("delta", 0.0))
+            self.metrics.redis_hits += 1
+            self._set_local(key, entry)
+            return entry
+        
+        return None
+    
+    def _should_refresh(self, entry: CacheEntry) -> bool:
+        """
+        XFetch: recompute early with probability growing towards expiry
+        
+        Expensive values (large compute time) start refreshing earlier.
+        """
+        _, expires_at, delta = entry
+        if delta <= 0 or self.early_refresh_beta <= 0:
+            return False
+        jitter = -delta * self.early_refresh_beta * math.log(1.0 - self._rng.random())
+        return time.time() + jitter >= expires_at
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value or None
+        """
+        entry = await self._get_entry(key)
+        if entry is None:
+            self.metrics.misses += 1
+            return None
+        return entry[0]
+    
+    async def set(self, key: str, value: Any, ttl_seconds: int, delta: float = 0.0) -> bool:
+        """
+        Store value in both tiers
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl_seconds: Expiration time in seconds
+            delta: Seconds it took to compute the value (drives early refresh)
+        
+        Returns:
+            True if stored in Redis
+        """
+        expires_at = time.time() + ttl_seconds
+        self._set_local(key, (value, expires_at, delta))
+        return await self.cache.set(
+            key,
+            {"value": value, "expires_at": expires_at, "delta": delta},
+            expire_seconds=ttl_seconds
+        )
+    
+    async def delete(self, key: str) -> bool:
+        """
+        Delete key from both tiers
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            True if deleted from Redis
+        """
+        self._entries.pop(key, None)
+        return await self.cache.delete(key)
+    
+    def clear_local(self, prefix: str = ""):
+        """
+        Drop local entries (all, or those whose key starts with prefix)
+        
+        Args:
+            prefix: Key prefix
+        """
+        if not prefix:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: int
+    ) -> Any:
+        """
+        Get value from cache, computing and storing it on a miss
+        
+        None results are returned but not cached.
+        
+        Args:
+            key: Cache key
+            compute: Async function producing the value
+            ttl_seconds: Expiration time in seconds
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        entry = await self._get_entry(key)
+        if entry is not None:
+            if key in self._inflight or not self._should_refresh(entry):
+                return entry[0]
+            self.metrics.early_refreshes += 1
+        else:
+            self.metrics.misses += 1
+        
+        return await self._compute_once(key, compute, ttl_seconds)
+    
+    async def _compute_once(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: int
+    ) -> Any:
+        """
+        Run compute for key, or wait for the call already in flight
+        
+        The computation runs in its own task: a cancelled caller (e.g. a
+        disconnected client) stops waiting but doesn't cancel it for the
+        callers coalesced onto it.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.metrics.coalesced += 1
+        else:
+            task = asyncio.create_task(self._compute_and_store(key, compute, ttl_seconds))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+    
+    async def _compute_and_store(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: int
+    ) -> Any:
+        """Compute value and store it in both tiers"""
+        start = time.perf_counter()
+        value = await compute()
+        if value is not None:
+            await self.set(key, value, ttl_seconds, delta=time.perf_counter() - start)
+        return value
+    
+    def _finish(self, key: str, task: asyncio.Task):
+        """Forget a completed computation"""
+        self._inflight.pop(key, None)
+        # Mark retrieved so asyncio doesn't warn when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    def info(self) -> Dict:
+        """Get cache state with hit / miss counters"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "in_flight": len(self._inflight),
+            **self.metrics.snapshot()
+        }
+
+
+def cached(
+    key_builder: Callable[..., str],
+    ttl_seconds: int,
+    cache: Optional[TieredCache] = None,
+    session_factory: Callable = AsyncSessionLocal
+):
+    """
+    Cache an async route handler's result in the tiered cache
+    
+    The handler must return JSON-serializable data (e.g. a dict). Raised
+    exceptions (HTTPException) are not cached.
+    
+    A coalesced computation can outlive the request that started it, so
+    a handler's db argument is replaced by a session the computation
+    opens and closes itself; the request's session (closed when the
+    request ends or is cancelled) is never shared.
+    
+    Args:
+        key_builder: Builds the cache key (or an awaitable of it, e.g.
+            RedisCache.user_key) from the handler's keyword arguments
+        ttl_seconds: Expiration time in seconds
+        cache: Cache instance (default: shared tiered_cache)
+        session_factory: Opens the computation's own database session
+    
+    Example:
+        @router.get("/bp/stats")
+        @cached(
+            lambda current_user, days, **_: redis_cache.user_key(str(current_user.id), f"bp:stats:{days}"),
+            ttl_seconds=300
+        )
+        async def get_bp_stats(...): ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = key_builder(**kwargs)
+            if inspect.isawaitable(key):
+                key = await key
+            
+            async def compute():
+                if "db" not in kwargs:
+                    return await func(*args, **kwargs)
+                async with session_factory() as db:
+                    return await func(*args, **{**kwargs, "db": db})
+            
+            return await (cache or tiered_cache).get_or_compute(key, compute, ttl_seconds)
+        return wrapper
+    return decorator
+
+
+# Singleton instance
+tiered_cache = TieredCache(
+    cache=redis_cache,
+    max_entries=settings.cache_local_max_entries,
+    local_ttl_seconds=settings.cache_local_ttl_seconds,
+    early_refresh_beta=settings.cache_early_refresh_beta
+)
+
+
+def get_tiered_cache() -> TieredCache:
+    """Get tiered cache instance"""
+    return tiered_cache
@@ -0,0 +1,220 @@
+"""
+Streaming BP history export
+NDJSON / CSV always, Parquet when pyarrow is installed
+"""
+
+import csv
+import io
+from datetime import datetime
+from typing import AsyncIterator, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal
+from app.core.serialization import json_serializer
+from app.models.vital_sign import VitalSign
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+# Exported columns (plain rows, no ORM objects)
+EXPORT_COLUMNS = [
+    VitalSign.id,
+    VitalSign.measured_at,
+    VitalSign.systolic,
+    VitalSign.diastolic,
+    VitalSign.heart_rate,
+    VitalSign.risk_level,
+    VitalSign.source,
+    VitalSign.confidence,
+    VitalSign.signal_quality,
+    VitalSign.created_at,
+]
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+def _text_values(row) -> list:
+    """Row values as JSON / CSV friendly scalars"""
+    return [
+        str(row.id),
+        row.measured_at.isoformat(),
+        row.systolic,
+        row.diastolic,
+        row.heart_rate,
+        row.risk_level.value,
+        row.source,
+        row.confidence,
+        row.signal_quality,
+        row.created_at.isoformat(),
+    ]
+
+
+class NdjsonExport:
+    """One JSON object per line"""
+    
+    name = "ndjson"
+    media_type = "application/x-ndjson"
+    
+    def start(self) -> bytes:
+        return b""
+    
+    def encode(self, rows: Sequence) -> bytes:
+        return b"".join(
+            json_serializer.dumps(dict(zip(EXPORT_FIELDS, _text_values(row)))) + b"\n"
+            for row in rows
+        )
+    
+    def finish(self) -> bytes:
+        return b""
+
+
+class CsvExport:
+    """CSV with header row"""
+    
+    name = "csv"
+    media_type = "text/csv"
+    
+    def _write(self, rows) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+    
+    def start(self) -> bytes:
+        return self._write([EXPORT_FIELDS])
+    
+    def encode(self, rows: Sequence) -> bytes:
+        return self._write(_text_values(row) for row in rows)
+    
+    def finish(self) -> bytes:
+        return b""
+
+
+class _PositionSink:
+    """
+    Write-only file for pyarrow that hands out bytes as they are written
+    
+    tell() keeps counting across drains, so the Parquet footer offsets
+    stay valid while nothing is buffered beyond the current row group.
+    """
+    
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+    
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        self.closed = True
+    
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ParquetExport:
+    """Parquet, one row group per fetched batch (requires pyarrow)"""
+    
+    name = "parquet"
+    media_type = "application/vnd.apache.parquet"
+    
+    def __init__(self):
+        self.schema = pa.schema([
+            ("id", pa.string()),
+            ("measured_at", pa.timestamp("us")),
+            ("systolic", pa.int32()),
+            ("diastolic", pa.int32()),
+            ("heart_rate", pa.int32()),
+            ("risk_level", pa.string()),
+            ("source", pa.string()),
+            ("confidence", pa.float64()),
+            ("signal_quality", pa.float64()),
+            ("created_at", pa.timestamp("us")),
+        ])
+        self._sink = _PositionSink()
+        self._writer = pq.ParquetWriter(self._sink, self.schema)
+    
+    def start(self) -> bytes:
+        return self._sink.drain()
+    
+    def encode(self, rows: Sequence) -> bytes:
+        columns = {name: [] for name in EXPORT_FIELDS}
+        for row in rows:
+            for name, value in zip(EXPORT_FIELDS, row):
+                columns[name].append(value)
+        columns["id"] = [str(value) for value in columns["id"]]
+        columns["risk_level"] = [value.value for value in columns["risk_level"]]
+        
+        self._writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+        return self._sink.drain()
+    
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+EXPORT_FORMATS = {
+    "ndjson": (NdjsonExport, lambda: True),
+    "csv": (CsvExport, lambda: True),
+    "parquet": (ParquetExport, lambda: pq is not None),
+}
+
+
+async def stream_bp_export(
+    exporter,
+    user_id: UUID,
+    batch_size: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> AsyncIterator[bytes]:
+    """
+    Stream a user's BP history, oldest first, encoded by exporter
+    
+    Rows come from a server-side cursor batch_size at a time, so memory
+    stays flat however long the history is. Opens its own session: the
+    request's session is closed before a streaming response is sent.
+    
+    Args:
+        exporter: NdjsonExport, CsvExport or ParquetExport instance
+        user_id: Whose readings to export
+        batch_size: Rows per cursor fetch
+        start_date: Filter from date (optional)
+        end_date: Filter to date (optional)
+    
+    Yields:
+        Encoded chunks
+    """
+    query = select(*EXPORT_COLUMNS).where(VitalSign.user_id == user_id)
+    if start_date:
+        query = query.where(VitalSign.measured_at >= start_date)
+    if end_date:
+        query = query.where(VitalSign.measured_at <= end_date)
+    query = query.order_by(VitalSign.measured_at, VitalSign.id)
+    
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        
+        chunk = exporter.start()
+        if chunk:
+            yield chunk
+        async for rows in result.partitions():
+            yield exporter.encode(rows)
+        chunk = exporter.finish()
+        if chunk:
+            yield chunk
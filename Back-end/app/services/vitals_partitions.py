@@ -0,0 +1,227 @@
+"""
+Monthly range partitions of vital_signs
+Creates upcoming partitions ahead of time and drops expired ones
+"""
+
+import asyncio
+import re
+from datetime import date, datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+PARTITION_PATTERN = re.compile(r"^vital_signs_p(\d{4})(\d{2})$")
+DEFAULT_PARTITION = "vital_signs_default"
+
+
+def month_start(moment: datetime) -> date:
+    """First day of the moment's month"""
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after (or before) month"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Partition table name for a month, e.g. vital_signs_p202610"""
+    return f"vital_signs_p{month:%Y%m}"
+
+
+async def is_partitioned(conn: AsyncConnection) -> bool:
+    """
+    Check vital_signs is a partitioned table (migration 008 applied)
+    """
+    result = await conn.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+        "WHERE partrelid = to_regclass('vital_signs'))"
+    ))
+    return bool(result.scalar())
+
+
+async def list_partitions(conn: AsyncConnection) -> List[str]:
+    """Names of vital_signs partitions"""
+    result = await conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass('vital_signs') ORDER BY c.relname"
+    ))
+    return list(result.scalars().all())
+
+
+async def create_partition(conn: AsyncConnection, month: date) -> int:
+    """
+    Create a month's partition, moving its readings out of DEFAULT
+    
+    Postgres refuses to create a partition while DEFAULT holds rows in
+    its range, so DEFAULT is detached, the month created, the rows moved
+    over and DEFAULT attached again.
+    
+    Args:
+        conn: Connection in a transaction
+        month: First day of the month
+    
+    Returns:
+        Readings moved from DEFAULT
+    """
+    name = partition_name(month)
+    start, end = month.isoformat(), add_months(month, 1).isoformat()
+    in_range = f"measured_at >= '{start}' AND measured_at < '{end}'"
+    
+    result = await conn.execute(text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+    moved = result.scalar()
+    
+    if moved:
+        await conn.execute(text(f"ALTER TABLE vital_signs DETACH PARTITION {DEFAULT_PARTITION}"))
+    await conn.execute(text(
+        f"CREATE TABLE {name} PARTITION OF vital_signs FOR VALUES FROM ('{start}') TO ('{end}')"
+    ))
+    if moved:
+        await conn.execute(text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+        await conn.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+        await conn.execute(text(f"ALTER TABLE vital_signs ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+        print(f"🔄 Moved {moved} readings from {DEFAULT_PARTITION} to {name}")
+    
+    return moved
+
+
+async def ensure_partitions(conn: AsyncConnection, months_ahead: int) -> List[str]:
+    """
+    Create monthly partitions from the current month to months_ahead
+    
+    Readings outside every monthly range land in the DEFAULT partition,
+    which is created here too.
+    
+    Args:
+        conn: Connection in a transaction
+        months_ahead: Future months to prepare
+    
+    Returns:
+        Names of partitions created
+    """
+    existing = set(await list_partitions(conn))
+    created = []
+    
+    if DEFAULT_PARTITION not in existing:
+        await conn.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF vital_signs DEFAULT"))
+        created.append(DEFAULT_PARTITION)
+    
+    current = month_start(datetime.utcnow())
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        await create_partition(conn, month)
+        created.append(name)
+    
+    return created
+
+
+async def drop_expired_partitions(conn: AsyncConnection, retention_months: int) -> List[str]:
+    """
+    Drop monthly partitions entirely older than the retention window
+    
+    Trend rollups of the dropped months are kept.
+    
+    Args:
+        conn: Connection in a transaction
+        retention_months: Months of readings to keep (0 = keep everything)
+    
+    Returns:
+        Names of partitions dropped
+    """
+    if retention_months <= 0:
+        return []
+    
+    cutoff = add_months(month_start(datetime.utcnow()), -retention_months)
+    dropped = []
+    for name in await list_partitions(conn):
+        match = PARTITION_PATTERN.match(name)
+        if not match:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if add_months(month, 1) <= cutoff:
+            await conn.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    
+    return dropped
+
+
+async def _run_locked(engine: AsyncEngine, step: Callable, argument: int) -> Optional[List[str]]:
+    """
+    Run one maintenance step in its own transaction
+    
+    A transaction-level advisory lock keeps workers that start at the
+    same time from creating or dropping the same partition twice.
+    
+    Args:
+        engine: Database engine
+        step: ensure_partitions or drop_expired_partitions
+        argument: The step's months argument
+    
+    Returns:
+        The step's result, or None if vital_signs is not partitioned
+    """
+    async with engine.begin() as conn:
+        if not await is_partitioned(conn):
+            return None
+        await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('vital_signs_partitions'))"))
+        return await step(conn, argument)
+
+
+async def maintain_partitions(engine: AsyncEngine, months_ahead: int, retention_months: int):
+    """
+    Create upcoming and drop expired partitions
+    
+    Creation and retention run in separate transactions, so a failure in
+    one doesn't keep the other from running.
+    
+    Args:
+        engine: Database engine
+        months_ahead: Future months to prepare
+        retention_months: Months of readings to keep (0 = keep everything)
+    """
+    try:
+        created = await _run_locked(engine, ensure_partitions, months_ahead)
+    except Exception as e:
+        print(f"❌ Creating vital_signs partitions failed: {e}")
+        created = []
+    if created is None:
+        print("⚠️  vital_signs is not partitioned (run alembic upgrade head)")
+        return
+    if created:
+        print(f"✅ Created vital_signs partitions: {', '.join(created)}")
+    
+    try:
+        dropped = await _run_locked(engine, drop_expired_partitions, retention_months)
+    except Exception as e:
+        print(f"❌ Dropping expired vital_signs partitions failed: {e}")
+        dropped = []
+    if dropped:
+        print(f"🔄 Dropped expired vital_signs partitions: {', '.join(dropped)}")
+
+
+async def watch_partitions(
+    engine: AsyncEngine,
+    interval_seconds: float,
+    months_ahead: int,
+    retention_months: int
+):
+    """
+    Background task: periodically run partition maintenance
+    
+    Args:
+        engine: Database engine
+        interval_seconds: Check interval
+        months_ahead: Future months to prepare
+        retention_months: Months of readings to keep (0 = keep everything)
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await maintain_partitions(engine, months_ahead, retention_months)
+        except Exception as e:
+            print(f"❌ Partition maintenance failed: {e}")
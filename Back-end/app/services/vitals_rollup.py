@@ -0,0 +1,215 @@
+"""
+BP rollup maintenance
+Incremental upserts on insert, rebuild from vital_signs after deletes
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, delete, func, literal, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.vital_sign import VitalSign, RiskLevel
+from app.models.vital_sign_rollup import VitalSignRollup, RollupBucket
+
+
+BUCKET_WIDTHS = {
+    RollupBucket.HOUR: timedelta(hours=1),
+    RollupBucket.DAY: timedelta(days=1),
+    RollupBucket.WEEK: timedelta(weeks=1),
+}
+
+RISK_COUNT_COLUMNS = {risk: f"{risk.value}_count" for risk in RiskLevel}
+
+# Rollup rows per upsert: ~19 binds each, asyncpg allows 32767 per statement
+UPSERT_CHUNK_SIZE = 1000
+
+
+def bucket_start(moment: datetime, bucket: RollupBucket) -> datetime:
+    """
+    Truncate timestamp to the start of its bucket (same as Postgres date_trunc)
+    
+    Args:
+        moment: Timestamp
+        bucket: Bucket width
+    
+    Returns:
+        Bucket start (weeks start on Monday)
+    """
+    start = moment.replace(minute=0, second=0, microsecond=0)
+    if bucket == RollupBucket.HOUR:
+        return start
+    start = start.replace(hour=0)
+    if bucket == RollupBucket.DAY:
+        return start
+    return start - timedelta(days=start.weekday())
+
+
+def _empty_row(user_id: UUID, bucket: RollupBucket, start: datetime) -> Dict:
+    """Rollup row with no readings"""
+    row = {
+        "user_id": user_id,
+        "bucket": bucket.value,
+        "bucket_start": start,
+        "count": 0,
+        "systolic_sum": 0,
+        "systolic_min": None,
+        "systolic_max": None,
+        "diastolic_sum": 0,
+        "diastolic_min": None,
+        "diastolic_max": None,
+        "heart_rate_count": 0,
+        "heart_rate_sum": 0,
+        "heart_rate_min": None,
+        "heart_rate_max": None,
+    }
+    row.update({column: 0 for column in RISK_COUNT_COLUMNS.values()})
+    return row
+
+
+def _add_value(row: Dict, name: str, value: int):
+    """Fold one measurement into a row's sum/min/max"""
+    row[f"{name}_sum"] += value
+    row[f"{name}_min"] = value if row[f"{name}_min"] is None else min(row[f"{name}_min"], value)
+    row[f"{name}_max"] = value if row[f"{name}_max"] is None else max(row[f"{name}_max"], value)
+
+
+def rollup_rows(vitals: Iterable[VitalSign]) -> list:
+    """
+    Aggregate readings into one rollup row per (user, bucket, bucket start)
+    
+    Args:
+        vitals: Readings with measured_at and risk_level set
+    
+    Returns:
+        Rollup rows as dicts (VitalSignRollup columns)
+    """
+    rows: Dict[Tuple[UUID, RollupBucket, datetime], Dict] = {}
+    for vital in vitals:
+        for bucket in RollupBucket:
+            start = bucket_start(vital.measured_at, bucket)
+            row = rows.get((vital.user_id, bucket, start))
+            if row is None:
+                row = rows[(vital.user_id, bucket, start)] = _empty_row(vital.user_id, bucket, start)
+            
+            row["count"] += 1
+            _add_value(row, "systolic", vital.systolic)
+            _add_value(row, "diastolic", vital.diastolic)
+            if vital.heart_rate is not None:
+                row["heart_rate_count"] += 1
+                _add_value(row, "heart_rate", vital.heart_rate)
+            row[RISK_COUNT_COLUMNS[RiskLevel(vital.risk_level)]] += 1
+    return list(rows.values())
+
+
+async def apply_readings(db: AsyncSession, vitals: Iterable[VitalSign]):
+    """
+    Add new readings to their hour, day and week rollups
+    
+    One INSERT ... ON CONFLICT DO UPDATE per UPSERT_CHUNK_SIZE affected
+    buckets (a single one for live readings); runs in the caller's
+    transaction so rollups commit with the readings.
+    
+    Args:
+        db: Database session
+        vitals: Newly inserted readings (flushed, so measured_at is set)
+    """
+    rows = rollup_rows(vitals)
+    
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = insert(VitalSignRollup).values(rows[start:start + UPSERT_CHUNK_SIZE])
+        table = VitalSignRollup.__table__
+        additive = [
+            "count", "systolic_sum", "diastolic_sum", "heart_rate_count", "heart_rate_sum",
+            *RISK_COUNT_COLUMNS.values()
+        ]
+        updates = {name: table.c[name] + stmt.excluded[name] for name in additive}
+        for name in ("systolic", "diastolic", "heart_rate"):
+            # least / greatest ignore NULLs (buckets without heart rate)
+            updates[f"{name}_min"] = func.least(table.c[f"{name}_min"], stmt.excluded[f"{name}_min"])
+            updates[f"{name}_max"] = func.greatest(table.c[f"{name}_max"], stmt.excluded[f"{name}_max"])
+        
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "bucket", "bucket_start"],
+                set_=updates
+            )
+        )
+
+
+async def rebuild_rollups(
+    db: AsyncSession,
+    user_id: Optional[UUID] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    """
+    Recompute rollups from vital_signs
+    
+    Every bucket overlapping [start, end] is deleted and re-aggregated
+    with one INSERT ... SELECT per bucket width. Used after deletes (min
+    and max can't be decremented) and to backfill existing readings.
+    
+    Args:
+        db: Database session
+        user_id: Only this user's rollups (default: all users)
+        start: Earliest affected measured_at (default: beginning)
+        end: Latest affected measured_at (default: now)
+    """
+    for bucket in RollupBucket:
+        # Inline field name: SELECT and GROUP BY must be the same expression
+        truncated = func.date_trunc(literal_column(f"'{bucket.value}'"), VitalSign.measured_at)
+        
+        rollup_filter = [VitalSignRollup.bucket == bucket.value]
+        vital_filter = []
+        if user_id is not None:
+            rollup_filter.append(VitalSignRollup.user_id == user_id)
+            vital_filter.append(VitalSign.user_id == user_id)
+        if start is not None:
+            first = bucket_start(start, bucket)
+            rollup_filter.append(VitalSignRollup.bucket_start >= first)
+            vital_filter.append(VitalSign.measured_at >= first)
+        if end is not None:
+            after_last = bucket_start(end, bucket) + BUCKET_WIDTHS[bucket]
+            rollup_filter.append(VitalSignRollup.bucket_start < after_last)
+            vital_filter.append(VitalSign.measured_at < after_last)
+        
+        await db.execute(delete(VitalSignRollup).where(*rollup_filter))
+        
+        columns = {
+            "user_id": VitalSign.user_id,
+            "bucket": literal(bucket.value),
+            "bucket_start": truncated,
+            "count": func.count(),
+            "heart_rate_count": func.count(VitalSign.heart_rate),
+            "heart_rate_sum": func.coalesce(func.sum(VitalSign.heart_rate), 0),
+            "heart_rate_min": func.min(VitalSign.heart_rate),
+            "heart_rate_max": func.max(VitalSign.heart_rate),
+        }
+        for name in ("systolic", "diastolic"):
+            column = getattr(VitalSign, name)
+            columns[f"{name}_sum"] = func.sum(column)
+            columns[f"{name}_min"] = func.min(column)
+            columns[f"{name}_max"] = func.max(column)
+        for risk, name in RISK_COUNT_COLUMNS.items():
+            columns[name] = func.count().filter(VitalSign.risk_level == risk)
+        
+        query = (
+            select(*columns.values())
+            .where(*vital_filter)
+            .group_by(VitalSign.user_id, truncated)
+        )
+        await db.execute(insert(VitalSignRollup).from_select(list(columns), query))
+
+
+async def remove_reading(db: AsyncSession, vital: VitalSign):
+    """
+    Rebuild the hour, day and week rollups that contained a deleted reading
+    
+    Args:
+        db: Database session
+        vital: Reading deleted in the current transaction
+    """
+    await rebuild_rollups(db, user_id=vital.user_id, start=vital.measured_at, end=vital.measured_at)
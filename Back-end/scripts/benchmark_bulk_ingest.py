@@ -0,0 +1,109 @@
+"""
+BP ingestion benchmark: POST /vitals/bp per reading vs POST /vitals/bp/bulk
+
+Inserts N synthetic readings for one user twice: once the way the
+single-reading endpoint does (object, risk check, rollup upsert, commit
+and refresh per reading), once through the bulk endpoint's helper in
+batches. Benchmark rows (source="benchmark") are deleted afterwards and
+the user's rollups rebuilt.
+
+Uses DATABASE_URL from .env.
+
+Usage:
+    python -m scripts.benchmark_bulk_ingest [--readings 5000] [--batch 1000] [--user-id UUID]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import delete
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.vital_sign import VitalSign
+from app.schemas.vital_sign import VitalSignBulkItem
+from app.services.vitals_rollup import apply_readings, rebuild_rollups
+from app.api.v1.vitals import insert_bp_readings
+from scripts.benchmark_vitals_cache import pick_user
+
+
+def build_readings(count: int) -> list:
+    """Synthetic readings, one per minute going back in time"""
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    return [
+        VitalSignBulkItem(
+            systolic=rng.randint(95, 170),
+            diastolic=rng.randint(60, 105),
+            heart_rate=rng.randint(55, 110),
+            source="benchmark",
+            measured_at=now - timedelta(minutes=i)
+        )
+        for i in range(count)
+    ]
+
+
+async def ingest_single(user_id: UUID, readings: list):
+    """One transaction per reading, as POST /vitals/bp"""
+    async with AsyncSessionLocal() as db:
+        for reading in readings:
+            vital = VitalSign(user_id=user_id, **reading.model_dump())
+            vital.risk_level = vital.calculate_risk_level()
+            db.add(vital)
+            await db.flush()
+            await apply_readings(db, [vital])
+            await db.commit()
+            await db.refresh(vital)
+
+
+async def ingest_bulk(user_id: UUID, readings: list, batch: int):
+    """One transaction per batch, as POST /vitals/bp/bulk"""
+    async with AsyncSessionLocal() as db:
+        for start in range(0, len(readings), batch):
+            await insert_bp_readings(db, user_id, readings[start:start + batch])
+            await db.commit()
+
+
+async def cleanup(user_id: UUID):
+    """Delete benchmark rows and rebuild the user's rollups"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            delete(VitalSign)
+            .where(VitalSign.user_id == user_id)
+            .where(VitalSign.source == "benchmark")
+        )
+        await rebuild_rollups(db, user_id=user_id)
+        await db.commit()
+
+
+async def main(args):
+    """Time both ingestion paths"""
+    user_id = UUID(args.user_id) if args.user_id else await pick_user()
+    readings = build_readings(args.readings)
+    print(f"User: {user_id} | readings: {args.readings:,} | bulk batch: {args.batch}")
+
+    try:
+        print(f"{'path':>8} {'seconds':>9} {'readings/s':>12}")
+        for name, ingest in (
+            ("single", lambda: ingest_single(user_id, readings)),
+            ("bulk", lambda: ingest_bulk(user_id, readings, args.batch)),
+        ):
+            start = time.perf_counter()
+            await ingest()
+            elapsed = time.perf_counter() - start
+            print(f"{name:>8} {elapsed:>9.2f} {len(readings) / elapsed:>12,.0f}")
+            await cleanup(user_id)
+    finally:
+        await cleanup(user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readings", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--user-id", default=None)
+    asyncio.run(main(parser.parse_args()))
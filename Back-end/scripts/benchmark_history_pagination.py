@@ -0,0 +1,122 @@
+"""
+BP history pagination benchmark: LIMIT/OFFSET vs keyset cursor
+
+Times fetching page 1 and a deep page of one user's history both ways.
+OFFSET makes Postgres walk and discard every earlier row; the cursor
+starts the (user_id, measured_at DESC) index scan at the previous page's
+last reading, so latency stays flat however deep the page is.
+
+Uses DATABASE_URL from .env. --seed inserts synthetic readings
+(source="benchmark") for the user first and deletes them afterwards.
+
+Usage:
+    python -m scripts.benchmark_history_pagination [--pages 1 10000] [--limit 50] [--seed 600000] [--user-id UUID]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, delete, insert
+
+from app.core.database import AsyncSessionLocal, engine
+from app.core.pagination import apply_cursor, encode_cursor
+from app.models.vital_sign import VitalSign, RiskLevel
+from scripts.benchmark_vitals_cache import pick_user, percentile
+
+
+async def seed(user_id: UUID, count: int):
+    """Insert synthetic readings, one per minute going back in time"""
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        for chunk in range(0, count, 10000):
+            await db.execute(insert(VitalSign), [
+                {
+                    "user_id": user_id,
+                    "systolic": rng.randint(95, 170),
+                    "diastolic": rng.randint(60, 105),
+                    "risk_level": RiskLevel.NORMAL,
+                    "source": "benchmark",
+                    "measured_at": now - timedelta(minutes=i),
+                    "created_at": now
+                }
+                for i in range(chunk, min(chunk + 10000, count))
+            ])
+        await db.commit()
+    print(f"✅ Seeded {count:,} readings")
+
+
+async def fetch_page(user_id: UUID, limit: int, offset: int = 0, cursor: Optional[str] = None):
+    """One history page exactly as the endpoint queries it"""
+    query = apply_cursor(
+        select(VitalSign).where(VitalSign.user_id == user_id),
+        VitalSign.measured_at,
+        VitalSign.id,
+        cursor
+    )
+    if not cursor:
+        query = query.offset(offset)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(query.limit(limit + 1))
+        return result.scalars().all()
+
+
+async def time_page(fetch, repeats: int) -> float:
+    """Median latency in milliseconds"""
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await fetch()
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return percentile(latencies, 50)
+
+
+async def main(args):
+    """Time each page with offset and cursor"""
+    user_id = UUID(args.user_id) if args.user_id else await pick_user()
+    if args.seed:
+        await seed(user_id, args.seed)
+
+    try:
+        print(f"User: {user_id} | page size: {args.limit}")
+        print(f"{'page':>8} {'offset (ms)':>12} {'cursor (ms)':>12}")
+        for page in args.pages:
+            offset = (page - 1) * args.limit
+
+            # Cursor as the client would hold it after the previous page
+            cursor = None
+            if offset:
+                previous = await fetch_page(user_id, 1, offset=offset - 1)
+                if not previous:
+                    print(f"{page:>8}   (user has fewer than {offset:,} readings)")
+                    continue
+                cursor = encode_cursor(previous[0].measured_at, previous[0].id)
+
+            by_offset = await time_page(lambda: fetch_page(user_id, args.limit, offset=offset), args.repeats)
+            by_cursor = await time_page(lambda: fetch_page(user_id, args.limit, cursor=cursor), args.repeats)
+            print(f"{page:>8} {by_offset:>12.2f} {by_cursor:>12.2f}")
+    finally:
+        if args.seed:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    delete(VitalSign)
+                    .where(VitalSign.user_id == user_id)
+                    .where(VitalSign.source == "benchmark")
+                )
+                await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10000])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--user-id", default=None)
+    asyncio.run(main(parser.parse_args()))
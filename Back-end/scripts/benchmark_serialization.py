@@ -0,0 +1,96 @@
+"""
+Serialization benchmark: stdlib json vs orjson vs msgpack
+
+Encodes / decodes a typical /vitals/bp/history page (200 VitalSignResponse
+items) with each available serializer, and compares rendering it through
+Starlette's JSONResponse and the app's FastJSONResponse.
+
+Usage:
+    python -m scripts.benchmark_serialization [--items 200] [--repeats 2000]
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+
+from app.core.serialization import SERIALIZERS, FastJSONResponse, get_serializer
+from app.models.vital_sign import RiskLevel
+from app.schemas.vital_sign import VitalSignResponse
+
+
+def build_payload(n_items: int) -> list:
+    """BP history page as the API returns it (JSON-mode dicts)"""
+    rng = random.Random(42)
+    user_id = uuid.uuid4()
+    now = datetime.utcnow()
+    return [
+        VitalSignResponse(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            systolic=rng.randint(95, 170),
+            diastolic=rng.randint(60, 105),
+            heart_rate=rng.randint(55, 110),
+            risk_level=rng.choice(list(RiskLevel)),
+            source=rng.choice(["sensor", "manual"]),
+            confidence=round(rng.random(), 3),
+            signal_quality=round(rng.random(), 3),
+            measured_at=now - timedelta(minutes=15 * i),
+            created_at=now - timedelta(minutes=15 * i)
+        ).model_dump(mode="json")
+        for i in range(n_items)
+    ]
+
+
+def ops_per_second(fn, repeats: int) -> float:
+    """Calls per second over repeats runs"""
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return repeats / (time.perf_counter() - start)
+
+
+def main(args):
+    """Run benchmark"""
+    payload = build_payload(args.items)
+
+    print("=" * 80)
+    print(f"CACHE PAYLOADS ({args.items} VitalSignResponse items)")
+    print("=" * 80)
+    print(f"{'serializer':>10} {'bytes':>8} {'encode/s':>10} {'decode/s':>10} {'vs json':>16}")
+
+    baseline = None
+    for name, (_, available) in SERIALIZERS.items():
+        if not available():
+            print(f"{name:>10}   (not installed)")
+            continue
+        serializer = get_serializer(name)
+        data = serializer.dumps(payload)
+        assert serializer.loads(data) == payload, f"{name} round trip mismatch"
+
+        encode = ops_per_second(lambda: serializer.dumps(payload), args.repeats)
+        decode = ops_per_second(lambda: serializer.loads(data), args.repeats)
+        baseline = baseline or (encode, decode)
+        print(
+            f"{name:>10} {len(data):>8,} {encode:>10,.0f} {decode:>10,.0f} "
+            f"{encode / baseline[0]:>7.1f}x /{decode / baseline[1]:>5.1f}x"
+        )
+
+    print("\n" + "=" * 80)
+    print("HTTP RESPONSE RENDERING")
+    print("=" * 80)
+    starlette = ops_per_second(lambda: JSONResponse(payload), args.repeats)
+    fast = ops_per_second(lambda: FastJSONResponse(payload), args.repeats)
+    print(f"{'JSONResponse':>18} {starlette:>10,.0f} renders/s")
+    print(f"{'FastJSONResponse':>18} {fast:>10,.0f} renders/s ({fast / starlette:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=2000)
+    main(parser.parse_args())
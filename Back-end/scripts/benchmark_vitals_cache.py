@@ -0,0 +1,125 @@
+"""
+Latest BP reading benchmark: Postgres only vs Redis write-through cache
+
+Simulates dashboards polling /vitals/bp/current: N concurrent pollers each
+fetch the latest reading of one user R times, first straight from Postgres,
+then through the same cache-first helper the endpoints use.
+
+Uses DATABASE_URL / REDIS_URL from .env; the user must have at least one reading.
+
+Usage:
+    python -m scripts.benchmark_vitals_cache [--pollers 50] [--requests 200] [--user-id UUID]
+"""
+
+import argparse
+import asyncio
+import math
+import time
+from typing import Awaitable, Callable, List
+from uuid import UUID
+
+from sqlalchemy import select, desc, func
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.vital_sign import VitalSign
+from app.services.redis_cache import redis_cache
+from app.api.v1.vitals import get_latest_reading
+
+
+async def fetch_from_db(user_id: UUID):
+    """Latest reading straight from Postgres (pre-cache endpoint behavior)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(VitalSign)
+            .where(VitalSign.user_id == user_id)
+            .order_by(desc(VitalSign.measured_at))
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+
+async def fetch_cached(user_id: UUID):
+    """Latest reading through the endpoints' cache-first helper"""
+    async with AsyncSessionLocal() as db:
+        return await get_latest_reading(db, user_id)
+
+
+async def run_pollers(
+    fetch: Callable[[UUID], Awaitable],
+    user_id: UUID,
+    pollers: int,
+    requests: int
+) -> List[float]:
+    """
+    Run concurrent pollers and collect per-request latency
+
+    Returns:
+        Latencies in milliseconds
+    """
+    latencies: List[float] = []
+
+    async def poller():
+        for _ in range(requests):
+            start = time.perf_counter()
+            await fetch(user_id)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+
+    await asyncio.gather(*(poller() for _ in range(pollers)))
+    return latencies
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)]
+
+
+async def pick_user() -> UUID:
+    """User with the most readings"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(VitalSign.user_id)
+            .group_by(VitalSign.user_id)
+            .order_by(desc(func.count()))
+            .limit(1)
+        )
+        user_id = result.scalar_one_or_none()
+    if not user_id:
+        raise SystemExit("❌ No BP readings in database")
+    return user_id
+
+
+async def main(args):
+    """Run both scenarios and print p50/p99"""
+    await redis_cache.connect()
+    if not redis_cache.redis_client:
+        raise SystemExit("❌ Redis is required for the cached scenario")
+
+    user_id = UUID(args.user_id) if args.user_id else await pick_user()
+    print(f"User: {user_id} | pollers: {args.pollers} | requests/poller: {args.requests}")
+
+    # Warm pool and cache
+    await fetch_from_db(user_id)
+    await redis_cache.invalidate_user_cache(str(user_id))
+    await fetch_cached(user_id)
+
+    print(f"{'scenario':>10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'req/s':>10}")
+    for name, fetch in (("db-only", fetch_from_db), ("cached", fetch_cached)):
+        start = time.perf_counter()
+        latencies = await run_pollers(fetch, user_id, args.pollers, args.requests)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>10} {percentile(latencies, 50):>10.2f} "
+            f"{percentile(latencies, 99):>10.2f} {len(latencies) / elapsed:>10.0f}"
+        )
+
+    await redis_cache.disconnect()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pollers", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--user-id", default=None)
+    asyncio.run(main(parser.parse_args()))
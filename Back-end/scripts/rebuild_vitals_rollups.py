@@ -0,0 +1,49 @@
+"""
+Rebuild BP trend rollups from vital_signs
+
+Backfills vital_sign_rollups after migration 005 and repairs them after
+bulk imports or manual edits that bypassed the API. Runs in one
+transaction per invocation.
+
+Uses DATABASE_URL from .env.
+
+Usage:
+    python -m scripts.rebuild_vitals_rollups [--user-id UUID] [--since 2026-01-01]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select, func
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.vital_sign_rollup import VitalSignRollup
+from app.services.vitals_rollup import rebuild_rollups
+
+
+async def main(args):
+    """Rebuild rollups and print row counts per bucket"""
+    user_id = UUID(args.user_id) if args.user_id else None
+    since = datetime.fromisoformat(args.since) if args.since else None
+
+    async with AsyncSessionLocal() as db:
+        await rebuild_rollups(db, user_id=user_id, start=since)
+        await db.commit()
+
+        result = await db.execute(
+            select(VitalSignRollup.bucket, func.count())
+            .group_by(VitalSignRollup.bucket)
+        )
+        for bucket, rows in result.all():
+            print(f"✅ {bucket:>5}: {rows:,} rollup rows")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--user-id", default=None)
+    parser.add_argument("--since", default=None, help="Rebuild buckets from this date (ISO format)")
+    asyncio.run(main(parser.parse_args()))
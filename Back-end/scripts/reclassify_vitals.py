@@ -0,0 +1,121 @@
+"""
+Re-score vital_signs risk levels with the current threshold tables
+
+Run after changing DEFAULT_THRESHOLDS in app/services/risk_classifier.py
+or a patient's custom thresholds. Walks the table in primary-key order,
+chunk by chunk (one transaction each), classifies every chunk in one
+vectorized call with each reading's patient thresholds, and updates only
+readings whose level changed. Trend rollups and caches of affected users
+are refreshed at the end.
+
+Uses DATABASE_URL / REDIS_URL from .env.
+
+Usage:
+    python -m scripts.reclassify_vitals [--user-id UUID] [--chunk-size 10000] [--dry-run]
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.user import User
+from app.models.vital_sign import VitalSign
+from app.services.redis_cache import redis_cache
+from app.services.risk_classifier import Thresholds, classify_bp, resolve_thresholds, stack_thresholds
+from app.services.vitals_rollup import rebuild_rollups
+
+
+async def load_thresholds(db, user_ids) -> Dict[UUID, Thresholds]:
+    """Threshold table of each user"""
+    result = await db.execute(select(User.id, User.bp_thresholds).where(User.id.in_(user_ids)))
+    return {user_id: resolve_thresholds(overrides) for user_id, overrides in result.all()}
+
+
+async def reclassify(user_id: Optional[UUID], chunk_size: int, dry_run: bool):
+    """Re-score readings chunk by chunk"""
+    thresholds: Dict[UUID, Thresholds] = {}
+    changes = Counter()
+    changed_users = set()
+    scanned = 0
+    last_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            query = select(
+                VitalSign.id,
+                VitalSign.measured_at,
+                VitalSign.user_id,
+                VitalSign.systolic,
+                VitalSign.diastolic,
+                VitalSign.risk_level
+            )
+            if user_id:
+                query = query.where(VitalSign.user_id == user_id)
+            if last_id:
+                query = query.where(VitalSign.id > last_id)
+            result = await db.execute(query.order_by(VitalSign.id).limit(chunk_size))
+            rows = result.all()
+            if not rows:
+                break
+
+            missing = {row.user_id for row in rows} - thresholds.keys()
+            if missing:
+                thresholds.update(await load_thresholds(db, missing))
+
+            levels = classify_bp(
+                [row.systolic for row in rows],
+                [row.diastolic for row in rows],
+                stack_thresholds([thresholds[row.user_id] for row in rows])
+            )
+
+            updates = []
+            for row, level in zip(rows, levels):
+                if level != row.risk_level:
+                    updates.append({"id": row.id, "measured_at": row.measured_at, "risk_level": level})
+                    changes[(row.risk_level.value, level.value)] += 1
+                    changed_users.add(row.user_id)
+
+            if updates and not dry_run:
+                # Bulk UPDATE by primary key (id, measured_at), executemany
+                await db.execute(update(VitalSign), updates)
+                await db.commit()
+
+            scanned += len(rows)
+            last_id = rows[-1].id
+            print(f"🔄 {scanned:,} readings scanned, {sum(changes.values()):,} changed")
+
+    for (old, new), count in sorted(changes.items()):
+        print(f"   {old:>8} → {new:<8} {count:,}")
+
+    if changed_users and not dry_run:
+        async with AsyncSessionLocal() as db:
+            for changed_user in changed_users:
+                await rebuild_rollups(db, user_id=changed_user)
+            await db.commit()
+        await redis_cache.invalidate_users_cache([str(u) for u in changed_users])
+        print(f"✅ Rebuilt rollups and caches of {len(changed_users):,} users")
+    elif dry_run:
+        print("⚠️  Dry run, nothing written")
+
+
+async def main(args):
+    """Run re-scoring"""
+    await redis_cache.connect()
+    try:
+        await reclassify(UUID(args.user_id) if args.user_id else None, args.chunk_size, args.dry_run)
+    finally:
+        await redis_cache.disconnect()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--user-id", default=None)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--dry-run", action="store_true")
+    asyncio.run(main(parser.parse_args()))
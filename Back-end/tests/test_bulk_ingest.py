@@ -0,0 +1,55 @@
+"""
+POST /vitals/bp/bulk insert path (statements compiled, no database)
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.vitals import insert_bp_readings
+from app.models.vital_sign_rollup import RollupBucket
+from app.schemas.vital_sign import VitalSignBulkCreate
+from app.services.vitals_rollup import UPSERT_CHUNK_SIZE, bucket_start
+
+# asyncpg limit on bind parameters per statement
+MAX_BIND_PARAMS = 32767
+
+
+class RecordingSession:
+    """Stands in for AsyncSession: compiles and records executed statements"""
+    
+    def __init__(self):
+        self.statements = []
+    
+    async def execute(self, stmt, params=None):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append((compiled, params))
+
+
+@pytest.mark.asyncio
+async def test_hourly_backfill_upserts_rollups_in_chunks():
+    first = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=5000)
+    upload = VitalSignBulkCreate(readings=[
+        {"systolic": 110 + i % 60, "diastolic": 70 + i % 40, "measured_at": first + timedelta(hours=i)}
+        for i in range(5000)
+    ])
+    db = RecordingSession()
+    
+    rows = await insert_bp_readings(db, uuid.uuid4(), upload.readings)
+    
+    assert len(rows) == 5000
+    inserts, upserts = db.statements[0], db.statements[1:]
+    assert inserts[0].statement.table.name == "vital_signs"
+    assert len(inserts[1]) == 5000
+    
+    expected_buckets = sum(
+        len({bucket_start(row["measured_at"], bucket) for row in rows})
+        for bucket in RollupBucket
+    )
+    assert expected_buckets > UPSERT_CHUNK_SIZE
+    assert len(upserts) == -(-expected_buckets // UPSERT_CHUNK_SIZE)
+    for compiled, _ in upserts:
+        assert compiled.statement.table.name == "vital_sign_rollups"
+        assert len(compiled.params) <= MAX_BIND_PARAMS
@@ -0,0 +1,102 @@
+"""
+NumPy inference kernel parity with sklearn on the production model
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+
+from app.services.compact_model import CompactMLPClassifier, load_compact_model
+
+SYMPTOM_CHECKER_DIR = Path(__file__).resolve().parents[2] / "Symptom-Checker"
+PRODUCTION_DIR = SYMPTOM_CHECKER_DIR / "Output" / "Production"
+
+pytestmark = pytest.mark.skipif(
+    not (PRODUCTION_DIR / "best_model.pkl").exists(),
+    reason="production model not trained"
+)
+
+
+@pytest.fixture(scope="module")
+def production():
+    """Unpickled production model and vectorizer"""
+    model = joblib.load(PRODUCTION_DIR / "best_model.pkl")
+    vectorizer = joblib.load(PRODUCTION_DIR / "vectorizer.pkl")
+    if not hasattr(model, "coefs_"):
+        pytest.skip(f"{type(model).__name__} is not an MLP network")
+    return model, vectorizer
+
+
+@pytest.fixture(scope="module")
+def compact(production, tmp_path_factory):
+    """Compact artifact exported by the training pipeline, loaded with mmap"""
+    pytest.importorskip("pandas")  # training pipeline dependency
+    sys.path.insert(0, str(SYMPTOM_CHECKER_DIR))
+    try:
+        import train_model
+    finally:
+        sys.path.remove(str(SYMPTOM_CHECKER_DIR))
+    
+    model, vectorizer = production
+    with open(PRODUCTION_DIR / "model_metadata.json", "r", encoding="utf-8") as f:
+        metadata = json.load(f)
+    
+    directory = tmp_path_factory.mktemp("compact")
+    default_dir = train_model.Config.COMPACT_DIR
+    train_model.Config.COMPACT_DIR = str(directory)
+    try:
+        assert train_model.export_compact_artifact(model, vectorizer, metadata)
+    finally:
+        train_model.Config.COMPACT_DIR = default_dir
+    
+    loaded = load_compact_model(directory)
+    assert loaded is not None
+    return loaded
+
+
+def symptom_texts(vectorizer, n_samples: int) -> list:
+    """Random symptom strings drawn from the vocabulary"""
+    rng = random.Random(42)
+    vocabulary = sorted(vectorizer.vocabulary_)
+    return [" ".join(rng.sample(vocabulary, rng.randint(1, 8))) for _ in range(n_samples)]
+
+
+@pytest.mark.parametrize("n_samples", [1, 32, 1024])
+def test_vectorizer_matches_sklearn(production, compact, n_samples):
+    _, vectorizer = production
+    compact_vectorizer, _, _ = compact
+    texts = symptom_texts(vectorizer, n_samples)
+    
+    expected = vectorizer.transform(texts).toarray()
+    actual = compact_vectorizer.transform(texts).toarray()
+    
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected)
+
+
+@pytest.mark.parametrize("n_samples", [1, 32, 1024])
+def test_compact_predict_proba_matches_sklearn(production, compact, n_samples):
+    model, vectorizer = production
+    compact_vectorizer, compact_model, _ = compact
+    texts = symptom_texts(vectorizer, n_samples)
+    
+    expected = model.predict_proba(vectorizer.transform(texts))
+    actual = compact_model.predict_proba(compact_vectorizer.transform(texts))
+    
+    assert np.allclose(actual, expected)
+    assert list(compact_model.classes_) == [str(c) for c in model.classes_]
+
+
+@pytest.mark.parametrize("n_samples", [1, 32, 1024])
+def test_kernel_from_pickle_matches_sklearn(production, n_samples):
+    model, vectorizer = production
+    kernel = CompactMLPClassifier.from_sklearn(model)
+    X = vectorizer.transform(symptom_texts(vectorizer, n_samples))
+    
+    assert np.allclose(kernel.predict_proba(X), model.predict_proba(X))
+    assert (kernel.predict(X) == model.predict(X)).all()
@@ -0,0 +1,59 @@
+"""
+Symptom model readiness across hot-swaps
+"""
+
+import json
+
+import joblib
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.neural_network import MLPClassifier
+
+from app.services.ai_service import SymptomCheckerService
+from app.services.model_registry import ModelRegistry, PRODUCTION_MODEL_NAME
+
+
+def write_model(directory, max_iter: int = 50):
+    """Train a tiny production model into directory"""
+    texts = ["fever cough", "headache nausea", "fever chills", "nausea vomiting"]
+    labels = ["flu", "migraine", "flu", "gastro"]
+    vectorizer = CountVectorizer()
+    model = MLPClassifier(hidden_layer_sizes=(4,), max_iter=max_iter, random_state=0)
+    model.fit(vectorizer.fit_transform(texts), labels)
+    
+    joblib.dump(model, directory / "best_model.pkl")
+    joblib.dump(vectorizer, directory / "vectorizer.pkl")
+    with open(directory / "model_metadata.json", "w", encoding="utf-8") as f:
+        json.dump({"version": "test", "symptoms": ["fever", "cough"]}, f)
+
+
+@pytest.fixture
+def service(tmp_path):
+    checker = SymptomCheckerService(ModelRegistry(tmp_path, tmp_path / "archive"))
+    checker.model_path = tmp_path
+    return checker
+
+
+@pytest.mark.filterwarnings("ignore::sklearn.exceptions.ConvergenceWarning")
+def test_ready_once_missing_model_appears(service, tmp_path):
+    assert not service.warm_up()
+    assert not service.warmed
+    
+    write_model(tmp_path)
+    service.reload_if_changed()
+    
+    assert service.loaded
+    assert service.warmed
+
+
+@pytest.mark.filterwarnings("ignore::sklearn.exceptions.ConvergenceWarning")
+def test_ready_again_after_hot_swap(service, tmp_path):
+    write_model(tmp_path)
+    assert service.warm_up()
+    service.warmed = False  # e.g. warm-up prediction failed at startup
+    
+    write_model(tmp_path, max_iter=60)
+    swapped = service.reload_if_changed()
+    
+    assert PRODUCTION_MODEL_NAME in swapped
+    assert service.warmed
@@ -0,0 +1,82 @@
+"""
+Keyset (cursor) pagination
+"""
+
+import base64
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import Column, DateTime, MetaData, Table, Uuid, create_engine, select
+
+from app.core.pagination import (
+    NEXT_CURSOR_HEADER,
+    apply_cursor,
+    decode_cursor,
+    encode_cursor,
+    page_with_cursor,
+)
+
+
+def test_cursor_round_trip():
+    sort_value = datetime(2026, 10, 17, 8, 30, 15, 123456)
+    row_id = uuid.uuid4()
+    
+    cursor = encode_cursor(sort_value, row_id)
+    
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (sort_value, row_id)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    "%%%",
+    base64.urlsafe_b64encode(b"2026-10-17T08:30:00").decode(),
+    base64.urlsafe_b64encode(b"yesterday|" + str(uuid.uuid4()).encode()).decode(),
+    base64.urlsafe_b64encode(b"2026-10-17T08:30:00|not-a-uuid").decode(),
+    base64.urlsafe_b64encode(b"\xff\xfe|\x00").decode(),
+    encode_cursor(datetime(2026, 10, 17), uuid.uuid4())[:-3],
+])
+def test_malformed_cursor_is_bad_request(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    
+    assert error.value.status_code == 400
+
+
+def test_pages_cover_tied_timestamps_exactly_once():
+    metadata = MetaData()
+    readings = Table(
+        "readings", metadata,
+        Column("id", Uuid, primary_key=True),
+        Column("measured_at", DateTime, nullable=False),
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    
+    # 5 distinct timestamps, 7 readings each: every page boundary falls on a tie
+    start = datetime(2026, 10, 1)
+    rows = [
+        {"id": uuid.uuid4(), "measured_at": start + timedelta(minutes=i % 5)}
+        for i in range(35)
+    ]
+    expected = [
+        row["id"]
+        for row in sorted(rows, key=lambda row: (row["measured_at"], row["id"]), reverse=True)
+    ]
+    
+    seen = []
+    cursor = None
+    with engine.connect() as conn:
+        conn.execute(readings.insert(), rows)
+        while True:
+            query = apply_cursor(select(readings), readings.c.measured_at, readings.c.id, cursor)
+            response = Response()
+            page = page_with_cursor(conn.execute(query.limit(5)).all(), 4, "measured_at", response)
+            seen.extend(row.id for row in page)
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if cursor is None:
+                break
+    
+    assert seen == expected
@@ -0,0 +1,90 @@
+"""
+Symptom prediction cache keys and model fingerprints
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer
+
+from app.services.model_registry import ModelVersion
+from app.services.prediction_cache import PredictionCache
+from app.services.redis_cache import RedisCache
+from app.services.tiered_cache import TieredCache
+
+
+def make_cache(vectorizer) -> PredictionCache:
+    registry = SimpleNamespace(
+        active=SimpleNamespace(fingerprint="production:test", vectorizer=vectorizer),
+        candidate=None,
+        candidate_percent=0
+    )
+    # Unconnected Redis tier: only the in-process tier caches
+    cache = TieredCache(RedisCache(), max_entries=100, local_ttl_seconds=30, early_refresh_beta=0.0)
+    return PredictionCache(registry, cache, ttl_seconds=60)
+
+
+class RecordingModel:
+    """Stands in for SymptomBatcher.predict; output depends on the list as given"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def predict(self, symptoms):
+        self.calls.append(list(symptoms))
+        return {"symptoms_matched": len(symptoms)}
+
+
+@pytest.mark.asyncio
+async def test_model_sees_symptoms_as_submitted():
+    cache = make_cache(CountVectorizer())
+    model = RecordingModel()
+    
+    duplicated = await cache.predict(["Fever", "Fever"], model.predict)
+    single = await cache.predict(["fever"], model.predict)
+    
+    assert model.calls == [["Fever", "Fever"], ["fever"]]
+    assert duplicated == {"symptoms_matched": 2}
+    assert single == {"symptoms_matched": 1}
+
+
+@pytest.mark.asyncio
+async def test_case_order_and_whitespace_share_an_entry():
+    cache = make_cache(CountVectorizer())
+    model = RecordingModel()
+    
+    first = await cache.predict(["Fever", "cough"], model.predict)
+    second = await cache.predict([" cough", "fever "], model.predict)
+    
+    assert first == second
+    assert len(model.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_order_kept_for_ngram_vectorizer():
+    cache = make_cache(CountVectorizer(ngram_range=(1, 2)))
+    model = RecordingModel()
+    
+    await cache.predict(["fever", "cough"], model.predict)
+    await cache.predict(["cough", "fever"], model.predict)
+    
+    assert len(model.calls) == 2
+
+
+def test_fingerprint_changes_when_file_replaced_within_same_second(tmp_path):
+    model_file = tmp_path / "best_model.pkl"
+    model_file.write_bytes(b"model-a")
+    before = ModelVersion("production", None, None, [model_file])
+    
+    # Same size, same timestamp: only the file itself differs
+    staged = tmp_path / "best_model.pkl.tmp"
+    staged.write_bytes(b"model-b")
+    stat = model_file.stat()
+    os.utime(staged, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(staged, model_file)
+    after = ModelVersion("production", None, None, [model_file])
+    
+    assert before.is_stale()
+    assert after.fingerprint != before.fingerprint
+    assert after.fingerprint.startswith("production:")
@@ -0,0 +1,125 @@
+"""
+Planner uses the composite indexes from migration 006
+
+EXPLAINs the hot vitals, notification and caregiver-link queries with
+sequential scans disabled, so small development tables still show the
+plan shape production gets. Needs DATABASE_URL (skipped otherwise).
+"""
+
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, desc, func, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import database_url
+from app.models.vital_sign import VitalSign
+from app.models.notification import Notification
+from app.models.patient_caregiver_link import PatientCaregiverLink
+
+
+USER_ID = uuid.uuid4()
+
+QUERIES = {
+    "latest reading": (
+        "ix_vital_signs_user_id_measured_at",
+        select(VitalSign)
+        .where(VitalSign.user_id == USER_ID)
+        .order_by(desc(VitalSign.measured_at))
+        .limit(1)
+    ),
+    "history page": (
+        "ix_vital_signs_user_id_measured_at",
+        select(VitalSign)
+        .where(VitalSign.user_id == USER_ID)
+        .order_by(desc(VitalSign.measured_at))
+        .limit(50)
+    ),
+    "unread notifications": (
+        "ix_notifications_user_id_is_read_created_at",
+        select(func.count())
+        .select_from(Notification)
+        .where(Notification.user_id == USER_ID)
+        .where(Notification.is_read == False)
+    ),
+    "caregiver link check": (
+        "ix_patient_caregiver_links_caregiver_patient_active",
+        select(PatientCaregiverLink)
+        .where(PatientCaregiverLink.caregiver_id == USER_ID)
+        .where(PatientCaregiverLink.patient_id == USER_ID)
+        .where(PatientCaregiverLink.is_active == True)
+    ),
+}
+
+
+def plan_indexes(plan: dict) -> set:
+    """Index names scanned anywhere in an EXPLAIN (FORMAT JSON) plan"""
+    found = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        found |= plan_indexes(child)
+    return found
+
+
+async def with_parent_indexes(conn, names: set) -> set:
+    """
+    Add the partitioned indexes that scanned partition indexes belong to
+    
+    Plans on the partitioned vital_signs scan each month's own index
+    (e.g. vital_signs_p202610_user_id_measured_at_idx), not the parent's.
+    """
+    found = set(names)
+    for name in names:
+        result = await conn.execute(
+            text(
+                "SELECT c.relname FROM pg_partition_ancestors(to_regclass(:name)) a "
+                "JOIN pg_class c ON c.oid = a.relid"
+            ),
+            {"name": name}
+        )
+        found |= set(result.scalars().all())
+    return found
+
+
+@pytest_asyncio.fixture
+async def conn(requires_database):
+    engine = create_async_engine(database_url)
+    async with engine.connect() as connection:
+        await connection.execute(text("SET enable_seqscan = off"))
+        yield connection
+    await engine.dispose()
+
+
+def test_plan_indexes_walks_child_plans():
+    plan = {
+        "Node Type": "Limit",
+        "Plans": [{
+            "Node Type": "Append",
+            "Plans": [
+                {"Node Type": "Index Scan", "Index Name": "vital_signs_p202610_user_id_measured_at_idx"},
+                {"Node Type": "Index Scan", "Index Name": "vital_signs_p202611_user_id_measured_at_idx"},
+            ]
+        }]
+    }
+    
+    assert plan_indexes(plan) == {
+        "vital_signs_p202610_user_id_measured_at_idx",
+        "vital_signs_p202611_user_id_measured_at_idx",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(QUERIES))
+async def test_query_uses_index(conn, name):
+    expected, query = QUERIES[name]
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    
+    result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    
+    used = plan_indexes(plan[0]["Plan"])
+    assert expected in await with_parent_indexes(conn, used), f"{name} scans {sorted(used) or 'no index'}"
@@ -0,0 +1,71 @@
+"""
+Batch BP risk classification
+"""
+
+import numpy as np
+
+from app.models.vital_sign import VitalSign, RiskLevel
+from app.services.risk_classifier import (
+    DEFAULT_THRESHOLDS,
+    classify_bp,
+    resolve_thresholds,
+    stack_thresholds,
+)
+
+
+def guideline_risk(systolic: int, diastolic: int, thresholds=DEFAULT_THRESHOLDS) -> RiskLevel:
+    """Reference: the if/elif chain VitalSign.calculate_risk_level used to hold"""
+    if systolic < thresholds[RiskLevel.LOW][0] or diastolic < thresholds[RiskLevel.LOW][1]:
+        return RiskLevel.LOW
+    elif systolic >= thresholds[RiskLevel.CRITICAL][0] or diastolic >= thresholds[RiskLevel.CRITICAL][1]:
+        return RiskLevel.CRITICAL
+    elif systolic >= thresholds[RiskLevel.HIGH][0] or diastolic >= thresholds[RiskLevel.HIGH][1]:
+        return RiskLevel.HIGH
+    elif systolic >= thresholds[RiskLevel.MODERATE][0] or diastolic >= thresholds[RiskLevel.MODERATE][1]:
+        return RiskLevel.MODERATE
+    else:
+        return RiskLevel.NORMAL
+
+
+def schema_grid():
+    """Every systolic/diastolic pair VitalSignCreate accepts"""
+    systolic, diastolic = np.meshgrid(np.arange(50, 301), np.arange(30, 201))
+    return systolic.ravel().tolist(), diastolic.ravel().tolist()
+
+
+def test_batch_matches_guideline_chain_on_every_valid_reading():
+    systolic, diastolic = schema_grid()
+    
+    levels = classify_bp(systolic, diastolic)
+    
+    assert levels == [guideline_risk(s, d) for s, d in zip(systolic, diastolic)]
+
+
+def test_model_method_matches_batch():
+    for systolic, diastolic in [(85, 70), (120, 70), (135, 85), (150, 95), (185, 100), (110, 125)]:
+        vital = VitalSign(systolic=systolic, diastolic=diastolic)
+        assert vital.calculate_risk_level() == classify_bp([systolic], [diastolic])[0]
+
+
+def test_custom_thresholds():
+    thresholds = resolve_thresholds({"high": [150, 95], "moderate": [130, 85]})
+    systolic, diastolic = schema_grid()
+    
+    levels = classify_bp(systolic, diastolic, thresholds)
+    
+    assert levels == [guideline_risk(s, d, thresholds) for s, d in zip(systolic, diastolic)]
+    assert classify_bp([145], [80]) == [RiskLevel.HIGH]
+    assert classify_bp([145], [80], thresholds) == [RiskLevel.MODERATE]
+
+
+def test_stacked_thresholds_per_reading():
+    custom = resolve_thresholds({"high": [150, 95]})
+    tables = [DEFAULT_THRESHOLDS, custom, DEFAULT_THRESHOLDS, custom]
+    systolic, diastolic = [145, 145, 100, 160], [80, 80, 70, 80]
+    
+    levels = classify_bp(systolic, diastolic, stack_thresholds(tables))
+    
+    assert levels == [
+        guideline_risk(s, d, table)
+        for s, d, table in zip(systolic, diastolic, tables)
+    ]
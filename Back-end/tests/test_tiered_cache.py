@@ -0,0 +1,144 @@
+"""
+Request coalescing in the tiered cache
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal
+from app.services.redis_cache import RedisCache
+from app.services.tiered_cache import TieredCache, cached
+
+
+def make_cache() -> TieredCache:
+    # Unconnected Redis tier: reads miss, writes are dropped
+    return TieredCache(RedisCache(), max_entries=100, local_ttl_seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compute_once():
+    cache = make_cache()
+    calls = 0
+    
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+    
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute, 60) for _ in range(10)))
+    
+    assert calls == 1
+    assert results == [{"value": 1}] * 10
+    assert cache.metrics.coalesced == 9
+
+
+@pytest.mark.asyncio
+async def test_owner_cancellation_does_not_cancel_waiters():
+    cache = make_cache()
+    release = asyncio.Event()
+    
+    async def compute():
+        await release.wait()
+        return {"value": 1}
+    
+    owner = asyncio.create_task(cache.get_or_compute("k", compute, 60))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_compute("k", compute, 60))
+    await asyncio.sleep(0)
+    
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    
+    assert await waiter == {"value": 1}
+    assert owner.cancelled()
+    assert await cache.get("k") == {"value": 1}
+
+
+@pytest.mark.asyncio
+async def test_compute_error_reaches_waiters():
+    cache = make_cache()
+    
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+    
+    results = await asyncio.gather(
+        *(cache.get_or_compute("k", compute, 60) for _ in range(3)),
+        return_exceptions=True
+    )
+    
+    assert all(isinstance(result, ValueError) for result in results)
+    assert cache.info()["in_flight"] == 0
+
+
+class FakeSession:
+    """Tracks whether a session is still open"""
+    
+    def __init__(self):
+        self.closed = False
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_cached_compute_uses_its_own_session():
+    release = asyncio.Event()
+    request_sessions = [FakeSession(), FakeSession()]
+    used = []
+    
+    @cached(lambda user_id, **_: f"stats:{user_id}", ttl_seconds=60, cache=make_cache(), session_factory=FakeSession)
+    async def handler(user_id: str, db):
+        await release.wait()
+        used.append(db)
+        assert not db.closed
+        return {"user_id": user_id}
+    
+    async def request(session):
+        # Like Depends(get_db): the session closes when the request ends
+        async with session as db:
+            return await handler(user_id="u1", db=db)
+    
+    owner = asyncio.create_task(request(request_sessions[0]))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(request(request_sessions[1]))
+    await asyncio.sleep(0)
+    
+    owner.cancel()
+    await asyncio.sleep(0)
+    assert request_sessions[0].closed
+    release.set()
+    
+    assert await waiter == {"user_id": "u1"}
+    assert len(used) == 1
+    assert used[0] not in request_sessions
+    assert used[0].closed
+
+
+@pytest.mark.asyncio
+async def test_first_caller_cancelled_during_db_compute(requires_database):
+    @cached(lambda user_id, **_: f"slow:{user_id}", ttl_seconds=60, cache=make_cache())
+    async def handler(user_id: str, db):
+        result = await db.execute(text("SELECT pg_sleep(0.2), 1"))
+        return {"value": result.one()[1]}
+    
+    async def request():
+        async with AsyncSessionLocal() as db:
+            return await handler(user_id="u1", db=db)
+    
+    owner = asyncio.create_task(request())
+    await asyncio.sleep(0.05)
+    waiter = asyncio.create_task(request())
+    await asyncio.sleep(0.05)
+    
+    owner.cancel()
+    
+    assert await waiter == {"value": 1}
+    assert owner.cancelled()
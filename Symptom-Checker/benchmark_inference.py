@@ -0,0 +1,108 @@
+"""
+ExperTIQ Pro - NumPy Inference Kernel Verification & Benchmark
+==============================================================
+
+Checks that the backend's NumPy MLP kernel (Back-end/app/services/compact_model.py)
+reproduces sklearn's predict_proba exactly on the production model, then compares
+per-call latency at several batch sizes.
+
+Usage:
+    python benchmark_inference.py
+"""
+
+import os
+import sys
+import time
+import random
+import joblib
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Back-end"))
+from app.services.compact_model import CompactMLPClassifier  # noqa: E402
+
+# ==========================================
+# CONFIGURATION
+# ==========================================
+class Config:
+    """Benchmark configuration"""
+
+    PRODUCTION_DIR = os.path.join("Output", "Production")
+    BATCH_SIZES = [1, 32, 1024]
+    REPEATS = 200
+    VERIFY_SAMPLES = 2048
+    RANDOM_STATE = 42
+
+
+def random_symptom_texts(vectorizer, n_samples, rng):
+    """
+    Build random symptom strings from the vectorizer vocabulary.
+
+    Args:
+        vectorizer: Fitted vectorizer
+        n_samples (int): Number of texts
+        rng (random.Random): Random source
+
+    Returns:
+        list: Symptom texts
+    """
+    vocabulary = list(vectorizer.vocabulary_)
+    return [" ".join(rng.sample(vocabulary, rng.randint(1, 8))) for _ in range(n_samples)]
+
+
+def verify(model, kernel, vectorizer, rng):
+    """
+    Assert kernel probabilities and labels match sklearn bit-for-bit.
+    """
+    X = vectorizer.transform(random_symptom_texts(vectorizer, Config.VERIFY_SAMPLES, rng))
+
+    expected = model.predict_proba(X)
+    actual = kernel.predict_proba(X)
+
+    assert actual.shape == expected.shape, f"shape mismatch: {actual.shape} != {expected.shape}"
+    assert np.array_equal(actual, expected), f"max abs diff: {np.max(np.abs(actual - expected))}"
+    assert np.array_equal(kernel.predict(X), model.predict(X)), "label mismatch"
+
+    # Single-row calls reuse the (larger) thread buffers
+    for i in range(10):
+        assert np.array_equal(kernel.predict_proba(X[i]), model.predict_proba(X[i]))
+
+    print(f"✓ Identical predict_proba on {Config.VERIFY_SAMPLES:,} samples")
+
+
+def time_per_call(fn, X):
+    """Median seconds per call"""
+    fn(X)  # warm-up
+    timings = []
+    for _ in range(Config.REPEATS):
+        start = time.perf_counter()
+        fn(X)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main():
+    """Run verification and latency benchmark."""
+    rng = random.Random(Config.RANDOM_STATE)
+
+    model = joblib.load(os.path.join(Config.PRODUCTION_DIR, 'best_model.pkl'))
+    vectorizer = joblib.load(os.path.join(Config.PRODUCTION_DIR, 'vectorizer.pkl'))
+    kernel = CompactMLPClassifier.from_sklearn(model)
+
+    print("=" * 80)
+    print("NUMERICAL VERIFICATION")
+    print("=" * 80)
+    verify(model, kernel, vectorizer, rng)
+
+    print("\n" + "=" * 80)
+    print("LATENCY (median per predict_proba call)")
+    print("=" * 80)
+    print(f"{'batch':>8} {'sklearn (ms)':>14} {'numpy (ms)':>12} {'speedup':>9}")
+    for batch_size in Config.BATCH_SIZES:
+        X = vectorizer.transform(random_symptom_texts(vectorizer, batch_size, rng))
+        sk = time_per_call(model.predict_proba, X)
+        np_kernel = time_per_call(kernel.predict_proba, X)
+        print(f"{batch_size:>8} {sk * 1000:>14.3f} {np_kernel * 1000:>12.3f} {sk / np_kernel:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,10 @@ import pandas as pd
 import numpy as np
 import joblib
 import json
+import scipy.sparse as sp
 import os
+import shutil
+from joblib import Memory, Parallel, delayed
 from sklearn.model_selection import train_test_split, GridSearchCV, cross_val_score
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
@@ -34,12 +37,21 @@ class Config:
     # Paths
     DATA_DIR = "Data"
     OUTPUT_DIR = os.path.join("Output", "Production")
+    COMPACT_DIR = os.path.join(OUTPUT_DIR, "compact")
+    
+    # Compact (non-pickle) artifact format
+    COMPACT_FORMAT = "healthmate-mlp"
+    COMPACT_FORMAT_VERSION = 1
     
     # Model Parameters
     TEST_SIZE = 0.2
     RANDOM_STATE = 42
     CV_FOLDS = 5
     
+    # Pipeline Performance
+    N_JOBS = -1                                     # Candidate models trained in parallel (processes)
+    CACHE_DIR = os.path.join("Output", "Cache")     # Fitted models / features keyed by data hash
+    
     # TF-IDF Parameters
     MAX_FEATURES = 5000
     MIN_DF = 2
@@ -59,6 +71,11 @@ class Config:
         "Hematological", "Liver Disease", "Renal"
     ]
 
+# On-disk cache: entries are keyed by a hash of the function arguments
+# (training data + estimator parameters), so re-runs with unchanged data
+# skip vectorization and model fitting entirely.
+memory = Memory(Config.CACHE_DIR, verbose=0)
+
 # ==========================================
 # STEP 1: DATA PREPARATION
 # ==========================================
@@ -91,63 +108,324 @@ def load_and_prepare_data():
 # ==========================================
 # STEP 2: FEATURE ENGINEERING
 # ==========================================
-def create_symptom_text(data):
+def create_symptom_matrix(data):
     """
-    Convert symptom columns into text representation for TF-IDF vectorization.
+    Extract the 0/1 symptom indicator matrix.
     
     Args:
         data (pd.DataFrame): Raw medical data
         
     Returns:
-        pd.Series: Text representation of symptoms
+        tuple: (symptom column names, boolean matrix n_cases x n_symptoms)
     """
     print("\n" + "=" * 80)
     print("STEP 2: FEATURE ENGINEERING")
     print("=" * 80)
     
-    # Create symptom text by joining all symptom columns
-    symptom_cols = [col for col in data.columns if col != 'disease']
-    
-    symptom_texts = []
-    for idx, row in data.iterrows():
-        # Only include symptoms that are present (value = 1)
-        active_symptoms = [col for col in symptom_cols if row[col] == 1]
-        symptom_texts.append(" ".join(active_symptoms))
+    symptom_cols = np.array([col for col in data.columns if col != 'disease'])
+    present = data[symptom_cols].to_numpy() == 1
     
     print(f"✓ Extracted {len(symptom_cols)} potential symptom features")
-    print(f"✓ Average symptoms per case: {np.mean([len(text.split()) for text in symptom_texts]):.2f}")
-    print(f"✓ Sample symptom text: {symptom_texts[0][:100]}...")
+    print(f"✓ Average symptoms per case: {present.sum(axis=1).mean():.2f}")
+    print(f"✓ Sample symptoms: {', '.join(symptom_cols[present[0]])[:100]}...")
+    
+    return symptom_cols, present
+
+def create_symptom_text(symptom_cols, present):
+    """
+    Convert symptom indicators into text representation (reference path for TF-IDF).
     
-    return pd.Series(symptom_texts, index=data.index)
+    Args:
+        symptom_cols (np.ndarray): Symptom column names
+        present (np.ndarray): Boolean symptom matrix
+        
+    Returns:
+        list: Space-joined present symptoms per case
+    """
+    return [" ".join(symptom_cols[row]) for row in present]
 
-def build_tfidf_vectorizer(symptom_texts):
+def build_tfidf_vectorizer(vocabulary=None):
     """
-    Build and fit TF-IDF vectorizer for symptom text.
+    Build TF-IDF vectorizer with the pipeline parameters.
     
     Args:
-        symptom_texts (pd.Series): Text representation of symptoms
+        vocabulary (dict): Optional fixed term -> column mapping
         
     Returns:
-        TfidfVectorizer: Fitted vectorizer
+        TfidfVectorizer: Unfitted vectorizer
     """
-    vectorizer = TfidfVectorizer(
+    return TfidfVectorizer(
         max_features=Config.MAX_FEATURES,
         min_df=Config.MIN_DF,
         max_df=Config.MAX_DF,
         ngram_range=Config.NGRAM_RANGE,
-        token_pattern=r'\b\w+\b'
+        token_pattern=r'\b\w+\b',
+        vocabulary=vocabulary
     )
+
+def symptom_ngrams(symptom_cols, present, vectorizer):
+    """
+    Enumerate word n-grams of every case directly from the symptom matrix.
+    
+    Each case's text is its present symptom names in column order, so the
+    token stream is the row-major expansion of the matrix. N-grams are
+    windows of that stream that stay inside one row, encoded as integers
+    (base = number of distinct tokens + 1, token ids start at 1 so n-grams
+    of different lengths never collide).
+    
+    Args:
+        symptom_cols (np.ndarray): Symptom column names
+        present (np.ndarray): Boolean symptom matrix
+        vectorizer (TfidfVectorizer): Supplies preprocessing, tokenization and n-gram range
+        
+    Returns:
+        tuple: (row index per n-gram, n-gram key per n-gram, token list indexed by id)
+    """
+    preprocess = vectorizer.build_preprocessor()
+    tokenize = vectorizer.build_tokenizer()
+    stop_words = vectorizer.get_stop_words() or ()
+    
+    # Tokenize each column name once (sklearn's own preprocessor/tokenizer)
+    tokens = [None]
+    token_ids = {}
+    column_tokens = []
+    for col in symptom_cols:
+        ids = []
+        for token in tokenize(preprocess(col)):
+            if token in stop_words:
+                continue
+            if token not in token_ids:
+                token_ids[token] = len(tokens)
+                tokens.append(token)
+            ids.append(token_ids[token])
+        column_tokens.append(ids)
+    
+    col_lengths = np.array([len(ids) for ids in column_tokens], dtype=np.int64)
+    col_starts = np.concatenate([[0], np.cumsum(col_lengths)[:-1]])
+    flat_tokens = np.array([t for ids in column_tokens for t in ids], dtype=np.int64)
+    
+    # Row-major token stream: np.nonzero walks rows in order, columns left to right
+    rows, cols = np.nonzero(present)
+    lengths = col_lengths[cols]
+    stream_rows = np.repeat(rows, lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    stream = flat_tokens[np.repeat(col_starts[cols], lengths) + offsets]
+    
+    base = len(tokens)
+    min_n, max_n = vectorizer.ngram_range
+    ngram_rows, ngram_keys = [], []
+    for n in range(min_n, max_n + 1):
+        if len(stream) < n:
+            break
+        n_windows = len(stream) - n + 1
+        inside_row = stream_rows[:n_windows] == stream_rows[n - 1:]
+        keys = np.zeros(inside_row.sum(), dtype=np.int64)
+        for j in range(n):
+            keys = keys * base + stream[j:j + n_windows][inside_row]
+        ngram_rows.append(stream_rows[:n_windows][inside_row])
+        ngram_keys.append(keys)
+    
+    return np.concatenate(ngram_rows), np.concatenate(ngram_keys), tokens
+
+def _decode_ngram(key, tokens):
+    """Turn an integer n-gram key back into its space-joined term"""
+    base = len(tokens)
+    words = []
+    while key:
+        key, token = divmod(int(key), base)
+        words.append(tokens[token])
+    return " ".join(reversed(words))
+
+def _encode_term(term, token_ids, base):
+    """Turn a vocabulary term into its integer n-gram key (-1 if it cannot occur)"""
+    key = 0
+    for word in term.split(" "):
+        if word not in token_ids:
+            return -1
+        key = key * base + token_ids[word]
+    return key
+
+def fit_symptom_tfidf(symptom_cols, present):
+    """
+    Fit the TF-IDF vocabulary and IDF weights from the symptom matrix.
     
-    vectorizer.fit(symptom_texts)
+    Reproduces TfidfVectorizer.fit on the symptom texts: terms in
+    alphabetical order, min_df/max_df/max_features pruning with the same
+    tie-breaking, and smooth IDF in closed form ln((1 + n) / (1 + df)) + 1.
     
-    print(f"✓ Built TF-IDF vectorizer with {len(vectorizer.vocabulary_):,} features")
+    Args:
+        symptom_cols (np.ndarray): Symptom column names
+        present (np.ndarray): Boolean symptom matrix
+        
+    Returns:
+        TfidfVectorizer: Vectorizer with fixed vocabulary and fitted idf_
+    """
+    params = build_tfidf_vectorizer()
+    rows, keys, tokens = symptom_ngrams(symptom_cols, present, params)
+    n_docs = present.shape[0]
+    
+    unique_keys, term_index = np.unique(keys, return_inverse=True)
+    n_terms = len(unique_keys)
+    
+    # Term frequency (total count) and document frequency (distinct cases)
+    counts = sp.csr_matrix(
+        (np.ones(len(rows), dtype=np.int64), (rows, term_index)),
+        shape=(n_docs, n_terms)
+    )
+    counts.sum_duplicates()
+    tfs = np.bincount(term_index, minlength=n_terms)
+    dfs = np.bincount(counts.indices, minlength=n_terms)
+    
+    # Alphabetical term order, as CountVectorizer._sort_features
+    terms = np.array([_decode_ngram(key, tokens) for key in unique_keys], dtype=object)
+    order = np.argsort(terms.astype(str), kind="stable")
+    terms, tfs, dfs = terms[order], tfs[order], dfs[order]
+    
+    # Pruning, as CountVectorizer._limit_features
+    max_doc_count = params.max_df if isinstance(params.max_df, int) else params.max_df * n_docs
+    min_doc_count = params.min_df if isinstance(params.min_df, int) else params.min_df * n_docs
+    mask = (dfs <= max_doc_count) & (dfs >= min_doc_count)
+    if params.max_features is not None and mask.sum() > params.max_features:
+        mask_inds = (-tfs[mask]).argsort()[:params.max_features]
+        new_mask = np.zeros(len(dfs), dtype=bool)
+        new_mask[np.where(mask)[0][mask_inds]] = True
+        mask = new_mask
+    
+    vocabulary = {term: idx for idx, term in enumerate(terms[mask])}
+    df = dfs[mask].astype(np.float64) + 1.0
+    
+    vectorizer = build_tfidf_vectorizer(vocabulary)
+    vectorizer.idf_ = np.log((n_docs + 1) / df) + 1.0
+    
+    print(f"✓ Built TF-IDF vectorizer with {len(vocabulary):,} features")
     print(f"✓ N-gram range: {Config.NGRAM_RANGE}")
     
     return vectorizer
 
+def transform_symptom_matrix(symptom_cols, present, vectorizer):
+    """
+    Build the TF-IDF feature matrix directly from the symptom matrix.
+    
+    Same output as vectorizer.transform(create_symptom_text(...)) without
+    building or re-tokenizing any text.
+    
+    Args:
+        symptom_cols (np.ndarray): Symptom column names
+        present (np.ndarray): Boolean symptom matrix
+        vectorizer (TfidfVectorizer): Fitted vectorizer
+        
+    Returns:
+        scipy.sparse.csr_matrix: L2-normalized TF-IDF features
+    """
+    rows, keys, tokens = symptom_ngrams(symptom_cols, present, vectorizer)
+    token_ids = {token: idx for idx, token in enumerate(tokens) if idx}
+    
+    # Vocabulary lookup via sorted integer keys
+    vocab_keys = np.array(
+        [_encode_term(term, token_ids, len(tokens)) for term in vectorizer.vocabulary_],
+        dtype=np.int64
+    )
+    vocab_cols = np.fromiter(vectorizer.vocabulary_.values(), dtype=np.int64, count=len(vocab_keys))
+    order = np.argsort(vocab_keys)
+    vocab_keys, vocab_cols = vocab_keys[order], vocab_cols[order]
+    
+    pos = np.minimum(np.searchsorted(vocab_keys, keys), len(vocab_keys) - 1)
+    known = vocab_keys[pos] == keys
+    
+    # Duplicate (row, column) entries are summed into counts
+    X = sp.csr_matrix(
+        (np.ones(known.sum(), dtype=np.int64), (rows[known], vocab_cols[pos[known]])),
+        shape=(present.shape[0], len(vectorizer.vocabulary_))
+    )
+    X.sum_duplicates()
+    X.sort_indices()
+    
+    data = X.data.astype(np.float64)
+    if vectorizer.sublinear_tf:
+        np.log(data, out=data)
+        data += 1.0
+    data *= vectorizer.idf_[X.indices]
+    
+    row_of = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+    norms = np.sqrt(np.bincount(row_of, weights=data * data, minlength=X.shape[0]))
+    norms[norms == 0.0] = 1.0
+    data /= norms[row_of]
+    
+    return sp.csr_matrix((data, X.indices, X.indptr), shape=X.shape)
+
+def verify_tfidf_features(symptom_cols, present, n_samples=2000):
+    """
+    Check the direct path against TfidfVectorizer on a sample of cases.
+    
+    Raises:
+        AssertionError: If vocabulary, IDF or features differ
+    """
+    rng = np.random.default_rng(Config.RANDOM_STATE)
+    sample = present[rng.choice(len(present), size=min(n_samples, len(present)), replace=False)]
+    texts = create_symptom_text(symptom_cols, sample)
+    
+    reference = build_tfidf_vectorizer().fit(texts)
+    vectorizer = fit_symptom_tfidf(symptom_cols, sample)
+    
+    assert vectorizer.vocabulary_ == reference.vocabulary_, "vocabulary mismatch"
+    assert np.array_equal(vectorizer.idf_, reference.idf_), "idf mismatch"
+    diff = transform_symptom_matrix(symptom_cols, sample, vectorizer) != reference.transform(texts)
+    assert diff.nnz == 0, "feature mismatch"
+    
+    print(f"✓ Direct TF-IDF features match TfidfVectorizer on {len(sample):,} sampled cases")
+
+@memory.cache
+def _fit_tfidf_features(symptom_cols, present, max_features, min_df, max_df, ngram_range):
+    """Fit vectorizer and transform the symptom matrix (cached on data + TF-IDF parameters)."""
+    vectorizer = fit_symptom_tfidf(symptom_cols, present)
+    return vectorizer, transform_symptom_matrix(symptom_cols, present, vectorizer)
+
+def build_tfidf_features(symptom_cols, present):
+    """
+    Fit TF-IDF vectorizer and build the feature matrix, reusing the on-disk cache.
+    
+    Args:
+        symptom_cols (np.ndarray): Symptom column names
+        present (np.ndarray): Boolean symptom matrix
+        
+    Returns:
+        tuple: (fitted vectorizer, sparse TF-IDF matrix)
+    """
+    return _fit_tfidf_features(
+        symptom_cols, present,
+        Config.MAX_FEATURES, Config.MIN_DF, Config.MAX_DF, Config.NGRAM_RANGE
+    )
+
 # ==========================================
 # STEP 3: MODEL TRAINING & SELECTION
 # ==========================================
+@memory.cache
+def fit_and_evaluate(model, X_train, y_train, X_test, y_test, cv_folds):
+    """
+    Fit one candidate model, score it on the test set and cross-validate it.
+    
+    Cached on disk keyed by estimator parameters + data hash.
+    
+    Returns:
+        dict: Fitted model and its metrics
+    """
+    # Cross-validation (refits clones on each fold)
+    cv_scores = cross_val_score(model, X_train, y_train, cv=cv_folds, scoring='accuracy')
+    
+    # Train
+    model.fit(X_train, y_train)
+    
+    # Evaluate
+    y_pred = model.predict(X_test)
+    
+    return {
+        'model': model,
+        'accuracy': accuracy_score(y_test, y_pred),
+        'f1_score': f1_score(y_test, y_pred, average='weighted'),
+        'cv_mean': cv_scores.mean(),
+        'cv_std': cv_scores.std()
+    }
+
 def train_expert_models(X_train, y_train, X_test, y_test):
     """
     Train multiple expert models and select the best performer.
@@ -171,33 +449,22 @@ def train_expert_models(X_train, y_train, X_test, y_test):
         "Naive Bayes": MultinomialNB(alpha=0.1)
     }
     
-    results = {}
+    print(f"→ Training {len(models)} models in parallel (n_jobs={Config.N_JOBS})...")
     
-    for name, model in models.items():
-        print(f"\n→ Training {name}...")
-        
-        # Train
-        model.fit(X_train, y_train)
-        
-        # Evaluate
-        y_pred = model.predict(X_test)
-        accuracy = accuracy_score(y_test, y_pred)
-        f1 = f1_score(y_test, y_pred, average='weighted')
-        
-        # Cross-validation
-        cv_scores = cross_val_score(model, X_train, y_train, cv=Config.CV_FOLDS, scoring='accuracy')
-        
-        results[name] = {
-            'model': model,
-            'accuracy': accuracy,
-            'f1_score': f1,
-            'cv_mean': cv_scores.mean(),
-            'cv_std': cv_scores.std()
-        }
-        
-        print(f"  ✓ Test Accuracy: {accuracy:.4f}")
-        print(f"  ✓ F1-Score: {f1:.4f}")
-        print(f"  ✓ CV Accuracy: {cv_scores.mean():.4f} (+/- {cv_scores.std():.4f})")
+    # Each candidate (fit + test evaluation + CV folds) runs in its own process;
+    # cached candidates are loaded from disk instead of refitted
+    outputs = Parallel(n_jobs=Config.N_JOBS)(
+        delayed(fit_and_evaluate)(model, X_train, y_train, X_test, y_test, Config.CV_FOLDS)
+        for model in models.values()
+    )
+    
+    results = dict(zip(models.keys(), outputs))
+    
+    for name, result in results.items():
+        print(f"\n→ {name}")
+        print(f"  ✓ Test Accuracy: {result['accuracy']:.4f}")
+        print(f"  ✓ F1-Score: {result['f1_score']:.4f}")
+        print(f"  ✓ CV Accuracy: {result['cv_mean']:.4f} (+/- {result['cv_std']:.4f})")
     
     # Select best model
     best_name = max(results, key=lambda x: results[x]['accuracy'])
@@ -293,12 +560,119 @@ def deploy_to_production(model, vectorizer, metadata):
         json.dump(metadata, f, indent=2, ensure_ascii=False)
     print(f"✓ Saved metadata to: {meta_path}")
     
+    # Save compact non-pickle artifact (memory-mappable weights)
+    export_compact_artifact(model, vectorizer, metadata)
+    
     print("\n" + "=" * 80)
     print("✅ EXPERT SYSTEM DEPLOYMENT COMPLETE")
     print("=" * 80)
     print(f"\nProduction files ready in: {Config.OUTPUT_DIR}")
     print("You can now run: streamlit run app.py")
 
+def export_compact_artifact(model, vectorizer, metadata):
+    """
+    Export a compact, versioned, non-pickle copy of the production model.
+    
+    Layout (Config.COMPACT_DIR):
+        manifest.json          format/version, layer activations, vectorizer params,
+                               class labels, weights_dir of the current export
+        v<timestamp>/          one directory per export:
+            vocabulary.json    feature terms ordered by column index
+            idf.npy            IDF weights (TF-IDF vectorizers only)
+            coef_<i>.npy       weight matrix of layer i
+            intercept_<i>.npy  bias vector of layer i
+    
+    Plain .npy files (not NPZ) are used so the serving side can memory-map them.
+    Serving workers keep their mapping of the previous export, so files are
+    never rewritten in place: the new export is written to a fresh directory
+    and published by atomically replacing manifest.json last.
+    
+    Args:
+        model: Trained classifier (only MLP networks are exportable)
+        vectorizer: Fitted CountVectorizer / TfidfVectorizer
+        metadata: System metadata
+        
+    Returns:
+        bool: True if the artifact was written
+    """
+    if not hasattr(model, 'coefs_'):
+        print(f"⚠ Compact export skipped: {type(model).__name__} is not an MLP network")
+        return False
+    
+    if (getattr(vectorizer, 'analyzer', 'word') != 'word'
+            or getattr(vectorizer, 'tokenizer', None) is not None
+            or getattr(vectorizer, 'preprocessor', None) is not None
+            or getattr(vectorizer, 'stop_words', None) is not None
+            or getattr(vectorizer, 'strip_accents', None) is not None):
+        print("⚠ Compact export skipped: vectorizer uses custom analysis steps")
+        return False
+    
+    manifest_file = os.path.join(Config.COMPACT_DIR, 'manifest.json')
+    previous_dir = None
+    if os.path.exists(manifest_file):
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            previous_dir = json.load(f).get('weights_dir')
+    
+    weights_dir = f"v{datetime.now():%Y%m%d%H%M%S%f}"
+    export_dir = os.path.join(Config.COMPACT_DIR, weights_dir)
+    os.makedirs(export_dir)
+    
+    # Layer weights
+    for i, (coef, intercept) in enumerate(zip(model.coefs_, model.intercepts_)):
+        np.save(os.path.join(export_dir, f'coef_{i}.npy'), np.ascontiguousarray(coef))
+        np.save(os.path.join(export_dir, f'intercept_{i}.npy'), np.ascontiguousarray(intercept))
+    
+    # Vocabulary as an index (position == feature column)
+    vocabulary = [None] * len(vectorizer.vocabulary_)
+    for term, idx in vectorizer.vocabulary_.items():
+        vocabulary[idx] = term
+    with open(os.path.join(export_dir, 'vocabulary.json'), 'w', encoding='utf-8') as f:
+        json.dump(vocabulary, f, ensure_ascii=False)
+    
+    use_idf = hasattr(vectorizer, 'idf_') and getattr(vectorizer, 'use_idf', False)
+    if use_idf:
+        np.save(os.path.join(export_dir, 'idf.npy'), np.asarray(vectorizer.idf_, dtype=np.float64))
+    
+    manifest = {
+        'format': Config.COMPACT_FORMAT,
+        'format_version': Config.COMPACT_FORMAT_VERSION,
+        'model_version': str(metadata.get('version', 'unknown')),
+        'exported_at': datetime.now().isoformat(),
+        'weights_dir': weights_dir,
+        'model': {
+            'n_layers': len(model.coefs_),
+            'activation': model.activation,
+            'out_activation': model.out_activation_,
+            'classes': [str(c) for c in model.classes_]
+        },
+        'vectorizer': {
+            'token_pattern': vectorizer.token_pattern,
+            'ngram_range': list(vectorizer.ngram_range),
+            'lowercase': bool(vectorizer.lowercase),
+            'binary': bool(getattr(vectorizer, 'binary', False)),
+            'use_idf': bool(use_idf),
+            'norm': getattr(vectorizer, 'norm', None),
+            'sublinear_tf': bool(getattr(vectorizer, 'sublinear_tf', False))
+        }
+    }
+    
+    # Publish: readers see either the old or the new manifest, never a partial one
+    staging_file = manifest_file + '.tmp'
+    with open(staging_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(staging_file, manifest_file)
+    
+    # Keep the previous export: workers may not have reloaded yet
+    for entry in os.listdir(Config.COMPACT_DIR):
+        path = os.path.join(Config.COMPACT_DIR, entry)
+        if os.path.isdir(path) and entry not in (weights_dir, previous_dir):
+            shutil.rmtree(path, ignore_errors=True)
+    
+    print(f"✓ Exported compact artifact to: {export_dir}")
+    return True
+
 # ==========================================
 # MAIN TRAINING PIPELINE
 # ==========================================
@@ -316,11 +690,11 @@ def main():
     data = load_and_prepare_data()
     
     # Step 2: Feature Engineering
-    symptom_texts = create_symptom_text(data)
-    vectorizer = build_tfidf_vectorizer(symptom_texts)
+    symptom_cols, present = create_symptom_matrix(data)
+    verify_tfidf_features(symptom_cols, present)
     
-    # Transform to TF-IDF features
-    X = vectorizer.transform(symptom_texts)
+    # Fit vectorizer + build TF-IDF features from the symptom matrix (cached by data hash)
+    vectorizer, X = build_tfidf_features(symptom_cols, present)
     y = data['disease']
     
     # Split data